@@ -24,7 +24,7 @@ from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
 from genie.utils.diff import Diff
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, PUSH_INTENT, DIFF, NO_DIFF
 from general_functionalities import ParseConfigFunction, ParseLearnFunction
 from datetime import datetime
@@ -32,7 +32,7 @@ from contextlib import redirect_stdout
 
 log = logging.getLogger(__name__)
 template_dir = 'templates/cisco/ios_xe'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 timestr = datetime.now().strftime("%Y%m%d_%H%M%S")
 
 # ----------------
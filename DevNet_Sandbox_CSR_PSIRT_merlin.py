@@ -14,14 +14,15 @@ import time
 import json
 import shutil
 import logging
-import requests
 from rich import print
 from rich.panel import Panel
 from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
+from cisco_api import CiscoOAuth, api_results, api_url
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 from general_functionalities import ParseShowCommandFunction
 
@@ -42,7 +43,7 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/api'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # AE Test Setup
@@ -93,19 +94,17 @@ class Collect_Information(aetest.Testcase):
                     psirt_api_username = api_credentials['APIs']['psirt']['psirt_api_username']
                     psirt_api_password = api_credentials['APIs']['psirt']['psirt_api_password']
 
-                    oauth_token_raw = requests.post("https://cloudsso.cisco.com/as/token.oauth2?grant_type=client_credentials&client_id=%s&client_secret=%s" % (psirt_api_username,psirt_api_password))
-                    oauth_token_json = oauth_token_raw.json()
-                    oauth_headers = {"Authorization": "%s %s" % (oauth_token_json['token_type'],oauth_token_json['access_token'])}
+                    # Token shared with the other Cisco API scripts, refreshed before it expires
+                    oauth = CiscoOAuth(psirt_api_username, psirt_api_password)
 
                     print(Panel.fit(Text.from_markup(CLOUD)))
                     for version,value in self.parsed_show_version.items():
                         with steps.start('Calling API',continue_=True) as step:
                             try:
-                                psirt_raw = requests.get("https://api.cisco.com/security/advisories/iosxe?version=%s" % value['version'], headers=oauth_headers)
+                                # Advisories of a version are shared by every device and script running it
+                                psirt_json = api_results.fetch("psirt", value['version'], "%s/security/advisories/iosxe?version=%s" % (api_url, value['version']), auth=oauth)
                             except Exception as e:
                                 step.failed('Could not parse it correctly\n{e}'.format(e=e))                           
-                        
-                        psirt_json = psirt_raw.json()
 
                         with open("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.json" % device.alias, "w") as fid:
                           json.dump(psirt_json, fid, indent=4, sort_keys=True)
@@ -120,7 +119,11 @@ class Collect_Information(aetest.Testcase):
                                 fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md --output Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md" % device.alias, "Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report_mind_map.html" % device.alias)
                    
+        # Cisco API cache hit rates
+        api_results.log_report()
+        # Mind Maps
+        mind_maps.build()
         # Goodbye Banner
         print(Panel.fit(Text.from_markup(FINISHED)))            
\ No newline at end of file
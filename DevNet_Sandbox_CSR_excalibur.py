@@ -15,7 +15,8 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, CLOUD, WRITING, SERIALS
 from general_functionalities import ParseShowCommandFunction, ParseLearnFunction
 from tinydb import TinyDB, Query
@@ -43,12 +44,12 @@ nxos_template_dir = 'templates/cisco/nxos'
 cisco_api_template_dir = 'templates/cisco/api'
 f5_template_dir = 'templates/f5'
 
-ios_env = Environment(loader=FileSystemLoader(ios_template_dir))
-ios_xe_env = Environment(loader=FileSystemLoader(ios_xe_template_dir))
-isr_env = Environment(loader=FileSystemLoader(isr_template_dir))
-nxos_env = Environment(loader=FileSystemLoader(nxos_template_dir))
-cisco_api_env = Environment(loader=FileSystemLoader(cisco_api_template_dir))
-f5_env = Environment(loader=FileSystemLoader(f5_template_dir))
+ios_env = template_environment(ios_template_dir)
+ios_xe_env = template_environment(ios_xe_template_dir)
+isr_env = template_environment(isr_template_dir)
+nxos_env = template_environment(nxos_template_dir)
+cisco_api_env = template_environment(cisco_api_template_dir)
+f5_env = template_environment(f5_template_dir)
 
 # ----------------
 # Create Database
@@ -337,11 +338,13 @@ class Collect_Information(aetest.Testcase):
             html.close() 
                             
         if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Excalibur/CSR_Inventory.md"):
-            os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Excalibur/CSR_Inventory.md --output Camelot/Cisco/DevNet_Sandbox/Excalibur/Inventory_mind_map.html")
+            mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Excalibur/CSR_Inventory.md", "Camelot/Cisco/DevNet_Sandbox/Excalibur/Inventory_mind_map.html")
 
             fh.close()
             fid.close()
             yml.close()
 
+        # Mind Maps
+        mind_maps.build()
         # Goodbye Banner
         print(Panel.fit(Text.from_markup(SERIALS)))
\ No newline at end of file
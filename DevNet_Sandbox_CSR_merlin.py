@@ -21,7 +21,8 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 from general_functionalities import ParseShowCommandFunction, ParseLearnFunction
 from genie.libs.conf.device.iosxe.device import Device
@@ -44,7 +45,7 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/ios_xe'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Create Database
@@ -162,7 +163,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_acl_netjson_json_template.render(to_parse_access_list=self.learned_acl['acls'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_acl_netjson_html_template.render(device_alias = device.alias)
@@ -208,10 +209,10 @@ class Collect_Information(aetest.Testcase):
                             fh.close()
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_mind_map.html" % device.alias)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_arp_netjson_json_template.render(to_parse_arp=self.learned_arp['interfaces'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_arp_netjson_html_template.render(device_alias = device.alias)
@@ -261,7 +262,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_dot1x_netjson_json_template.render(to_parse_dot1x=self.learned_dot1x,device_alias = device.alias)
                     parsed_output_netjson_html = learned_dot1x_netjson_html_template.render(device_alias = device.alias)
@@ -282,7 +283,7 @@ class Collect_Information(aetest.Testcase):
                             fh.close()
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_sessions.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_sessions.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_sessions_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_sessions.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Dot1X/%s_learned_dot1x_sessions_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_dot1x_sessions_netjson_json_template.render(to_parse_dot1x=self.learned_dot1x,device_alias = device.alias)
                     parsed_output_netjson_html = learned_dot1x_sessions_netjson_html_template.render(device_alias = device.alias)
@@ -322,7 +323,7 @@ class Collect_Information(aetest.Testcase):
                             fh.close()
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=self.learned_interface,device_alias = device.alias)
                     parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
@@ -369,7 +370,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_routing_netjson_json_template.render(to_parse_routing=self.learned_routing['vrf'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_routing_netjson_html_template.render(device_alias = device.alias)
@@ -406,7 +407,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md --output Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_vrf_netjson_json_template.render(to_parse_vrf=self.learned_vrf['vrfs'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_vrf_netjson_html_template.render(device_alias = device.alias)
@@ -442,7 +443,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md --output Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store ACLs in Device Table in Database
@@ -474,10 +475,10 @@ class Collect_Information(aetest.Testcase):
                           fh.close()
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary.md --output Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_mind_map.html" % device.alias)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_totals.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_totals.md --output Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_totals_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_totals.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Etherchannel_Summary/%s_show_etherchannel_summary_totals_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store EtherChannel in Device Table in Database
@@ -502,7 +503,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
                         if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md --output Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory_mind_map.html" % (device.alias,device.alias))
+                            mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store Inventory in Device Table in Database
@@ -525,7 +526,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP/%s_show_ip_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP/%s_show_ip_arp.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP/%s_show_ip_arp_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP/%s_show_ip_arp.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP/%s_show_ip_arp_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store IP ARP in Device Table in Database
@@ -548,7 +549,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store IP Int Brief in Device Table in Database
@@ -573,7 +574,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
@@ -607,7 +608,7 @@ class Collect_Information(aetest.Testcase):
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md --output Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version_mind_map.html" % device.alias)
 
                     # ----------------
                     # Store Version in Device Table in Database
@@ -615,6 +616,8 @@ class Collect_Information(aetest.Testcase):
 
                     table.insert(self.parsed_show_version)
 
+        # Mind Maps
+        mind_maps.build()
         db.close()
         # Goodbye Banner
         print(Panel.fit(Text.from_markup(FINISHED)))
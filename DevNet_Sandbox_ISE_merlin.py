@@ -16,7 +16,8 @@ from rich.panel import Panel
 from rich.text import Text
 from pyats import aetest
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, CLOUD, WRITING, FINISHED
 from tinydb import TinyDB, Query
 
@@ -37,7 +38,7 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/ise'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Create Database
@@ -216,7 +217,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_devices.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_devices.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_devices_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_devices.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_devices_mind_map.html")
 
             fid.close()
             yml.close()
@@ -226,7 +227,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_device_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_device_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_device_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_device_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Network_Devices/network_device_details_mind_map.html")
             fid.close()
             yml.close()
 
@@ -352,7 +353,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_groups.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_groups.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_groups_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_groups.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_groups_mind_map.html")
 
             fid.close()
             yml.close()
@@ -362,7 +363,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_group_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_group_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_group_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_group_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Identity_Groups/identity_group_details_mind_map.html")
 
             fid.close()
             yml.close()
@@ -493,7 +494,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_groups.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_groups.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_groups_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_groups.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_groups_mind_map.html")
 
             fid.close()
             yml.close()
@@ -503,7 +504,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_group_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_group_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_group_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_group_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Endpoint_Groups/endpoint_group_details_mind_map.html")
             fid.close()
             yml.close()
 
@@ -633,7 +634,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACLs.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACLs.md --output Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACLs_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACLs.md", "Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACLs_mind_map.html")
             fid.close()
             yml.close()
             with open("Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details.html", "a") as html:
@@ -641,7 +642,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/dACLs/dACL_details_mind_map.html")
             fid.close()
             yml.close()
 
@@ -771,7 +772,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profiles.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profiles.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profiles_mind_maps.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profiles.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profiles_mind_maps.html")
 
             fid.close()
             yml.close()
@@ -781,7 +782,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profile_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profile_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profile_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profile_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Authorization_Profiles/authorization_profile_details_mind_map.html")
                 
             fid.close()
             yml.close()
@@ -913,7 +914,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrators.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrators.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrators_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrators.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrators_mind_map.html")
 
             fid.close()
             yml.close()
@@ -923,7 +924,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrator_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrator_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrator_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrator_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Administrators/administrator_details_mind_map.html")
 
             fid.close()
             yml.close()
@@ -961,7 +962,7 @@ class Collect_Information(aetest.Testcase):
                 table.insert(self.raw_allowed_protocols.json())
 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocols.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocols.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocols_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocols.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocols_mind_map.html")
 
             fid.close()
             yml.close()
@@ -1003,7 +1004,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocol_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocol_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocol_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocol_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Allowed_Protocols/allowed_protocol_details_mind_map.html")
                 
             fid.close()
             yml.close()
@@ -1135,7 +1136,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoints.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoints.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoints_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoints.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoints_mind_map.html")
 
             fid.close()
             yml.close()
@@ -1145,7 +1146,7 @@ class Collect_Information(aetest.Testcase):
                 html.close() 
                                 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoint_details.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoint_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoint_details_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoint_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Endpoints/endpoint_details_mind_map.html")
             fid.close()
             yml.close()
 
@@ -1180,7 +1181,7 @@ class Collect_Information(aetest.Testcase):
                     table.insert(xmltodict.parse(self.raw_active_session_totals.content))
             
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals_mind_map.html")
 
             # Get Active Session Details
             with steps.start('Requesting Active Session Details Count',continue_=True) as step:
@@ -1212,7 +1213,7 @@ class Collect_Information(aetest.Testcase):
                     table.insert(xmltodict.parse(self.raw_active_session_details.content))
 
             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_totals.md"):
-                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_details_totals_mind_map.html")
+                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/active_session_details_totals_mind_map.html")
 
             # Define Templates 
             MAC_session_details_template = env.get_template('mac_session_details.j2')
@@ -1277,11 +1278,13 @@ class Collect_Information(aetest.Testcase):
                     html.close() 
                                     
                 if os.path.exists("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/MAC_session_details.md"):
-                    os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/MAC_session_details.md --output Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/MAC_session_details_mind_map.html")
+                    mind_maps.add("Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/MAC_session_details.md", "Camelot/Cisco/DevNet_Sandbox/ISE/Active_Sessions/MAC_session_details_mind_map.html")
 
                 fid.close()
                 yml.close()
 
+        # Mind Maps
+        mind_maps.build()
         # ---------------------------------------
         # You Made It 
         # ---------------------------------------
@@ -21,7 +21,8 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParseConfigFunction, ParseDictFunction
 from tinydb import TinyDB, Query
@@ -43,7 +44,7 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/nxos'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Create Database
@@ -172,7 +173,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ACL/%s_learned_acl_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_acl_netjson_json_template.render(to_parse_access_list=self.learned_acl['acls'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_acl_netjson_html_template.render(device_alias = device.alias)
@@ -216,10 +217,10 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_mind_map.html" % device.alias)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics.md --output Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_arp_netjson_json_template.render(to_parse_arp=self.learned_arp['interfaces'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_arp_netjson_html_template.render(device_alias = device.alias)
@@ -263,7 +264,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_BGP/%s_learned_bgp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_BGP/%s_learned_bgp.md --output Camelot/Cisco/DevNet_Sandbox/Learned_BGP/%s_learned_bgp_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_BGP/%s_learned_bgp.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_BGP/%s_learned_bgp_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_bgp_netjson_json_template.render(to_parse_bgp=self.learned_bgp['instance'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_bgp_netjson_html_template.render(device_alias = device.alias)
@@ -300,7 +301,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Interface/%s_learned_interface_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=self.learned_interface,device_alias = device.alias)
                     parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
@@ -361,7 +362,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Platform/%s_learned_platform.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Platform/%s_learned_platform.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Platform/%s_learned_platform_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Platform/%s_learned_platform.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Platform/%s_learned_platform_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_platform_netjson_json_template.render(to_parse_platform=self.learned_platform,device_alias = device.alias)
                     parsed_output_netjson_html = learned_platform_netjson_html_template.render(device_alias = device.alias)
@@ -396,7 +397,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md --output Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_Routing/%s_learned_routing_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_routing_netjson_json_template.render(to_parse_routing=self.learned_routing['vrf'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_routing_netjson_html_template.render(device_alias = device.alias)
@@ -431,7 +432,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_VLAN/%s_learned_vlan.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_VLAN/%s_learned_vlan.md --output Camelot/Cisco/DevNet_Sandbox/Learned_VLAN/%s_learned_vlan_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_VLAN/%s_learned_vlan.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_VLAN/%s_learned_vlan_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_vlan_netjson_json_template.render(to_parse_vlan=self.learned_vlan['vlans'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_vlan_netjson_html_template.render(device_alias = device.alias)
@@ -466,7 +467,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md --output Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Learned_VRF/%s_learned_vrf_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = learned_vrf_netjson_json_template.render(to_parse_vrf=self.learned_vrf['vrfs'],device_alias = device.alias)
                     parsed_output_netjson_html = learned_vrf_netjson_html_template.render(device_alias = device.alias)
@@ -510,7 +511,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md --output Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Access_Lists/%s_show_access_lists_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_access_lists_netjson_json_template.render(to_parse_access_list=self.parsed_show_access_lists,device_alias = device.alias)
                     parsed_output_netjson_html = sh_access_lists_netjson_html_template.render(device_alias = device.alias)
@@ -545,7 +546,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md --output Camelot/Cisco/DevNet_Sandbox/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_bgp_process_vrf_all_netjson_json_template.render(to_parse_bgp=self.parsed_show_bgp_process_vrf_all,device_alias = device.alias)
                     parsed_output_netjson_html = sh_bgp_process_vrf_all_netjson_html_template.render(device_alias = device.alias)
@@ -580,7 +581,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type) 
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_BGP_Sessions/%s_show_bgp_sessions.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_BGP_Sessions/%s_show_bgp_sessions.md --output Camelot/Cisco/DevNet_Sandbox/Show_BGP_Sessions/%s_show_bgp_sessions_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_BGP_Sessions/%s_show_bgp_sessions.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_BGP_Sessions/%s_show_bgp_sessions_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_bgp_sessions_netjson_json_template.render(to_parse_bgp=self.parsed_show_bgp_sessions,device_alias = device.alias)
                     parsed_output_netjson_html = sh_bgp_sessions_netjson_html_template.render(device_alias = device.alias)
@@ -617,7 +618,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type)  
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Interface_Status/%s_show_int_status.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Interface_Status/%s_show_int_status.md --output Camelot/Cisco/DevNet_Sandbox/Show_Interface_Status/%s_show_int_status_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Interface_Status/%s_show_int_status.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Interface_Status/%s_show_int_status_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_int_status_netjson_json_template.render(to_parse_interface=self.parsed_show_int_status['interfaces'],device_alias = device.alias)
                     parsed_output_netjson_html = sh_int_status_netjson_html_template.render(device_alias = device.alias)
@@ -656,7 +657,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type)
 
                         if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md --output Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory_mind_map.html" % (device.alias,device.alias))
+                            mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Inventory/%s_show_inventory_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_inventory_netjson_json_template.render(to_parse_inventory_name=self.parsed_show_inventory['name'],device_alias = device.alias)
                     parsed_output_netjson_html = sh_inventory_netjson_html_template.render(device_alias = device.alias)
@@ -691,7 +692,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_Interface_Brief/%s_show_ip_int_brief_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_ip_int_brief_netjson_json_template.render(to_parse_interfaces=self.parsed_show_ip_int_brief['interface'],device_alias = device.alias)
                     parsed_output_netjson_html = sh_ip_int_brief_netjson_html_template.render(device_alias = device.alias)
@@ -726,7 +727,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_OSPF/%s_show_ip_ospf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_OSPF/%s_show_ip_ospf.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_OSPF/%s_show_ip_ospf_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_OSPF/%s_show_ip_ospf.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_OSPF/%s_show_ip_ospf_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_ip_ospf_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_ospf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_ip_ospf_netjson_html_template.render(device_alias = device.alias)
@@ -761,7 +762,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
                     
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_IP_Route/%s_show_ip_route_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
@@ -796,7 +797,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_MAC_Address_Table/%s_show_mac_address_table.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_MAC_Address_Table/%s_show_mac_address_table.md --output Camelot/Cisco/DevNet_Sandbox/Show_MAC_Address_Table/%s_show_mac_address_table_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_MAC_Address_Table/%s_show_mac_address_table.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_MAC_Address_Table/%s_show_mac_address_table_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_mac_address_netjson_json_template.render(to_parse_mac_address_table=self.parsed_show_mac_address_table['mac_table'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_mac_address_netjson_html_template.render(device_alias = device.alias)
@@ -831,7 +832,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Port_Channel_Summary/%s_show_port_channel_summary.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Port_Channel_Summary/%s_show_port_channel_summary.md --output Camelot/Cisco/DevNet_Sandbox/Show_Port_Channel_Summary/%s_show_port_channel_summary_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Port_Channel_Summary/%s_show_port_channel_summary.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Port_Channel_Summary/%s_show_port_channel_summary_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_portchannel_summary_netjson_json_template.render(to_parse_etherchannel_summary=self.parsed_show_port_channel_summary['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_portchannel_summary_netjson_html_template.render(device_alias = device.alias)
@@ -867,7 +868,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md --output Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_Version/%s_show_version_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_ver_netjson_json_template.render(to_parse_version=self.parsed_show_version['platform'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_ver_netjson_html_template.render(device_alias = device.alias)
@@ -908,7 +909,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_VRF/%s_show_vrf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_VRF/%s_show_vrf.md --output Camelot/Cisco/DevNet_Sandbox/Show_VRF/%s_show_vrf_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_VRF/%s_show_vrf.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_VRF/%s_show_vrf_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_vrf_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf['vrfs'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_vrf_netjson_html_template.render(device_alias = device.alias)
@@ -949,7 +950,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Detail/%s_show_vrf_all_detail.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Detail/%s_show_vrf_all_detail.md --output Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Detail/%s_show_vrf_all_detail_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Detail/%s_show_vrf_all_detail.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Detail/%s_show_vrf_all_detail_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_vrf_all_detail_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf_all_detail,filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_vrf_all_detail_netjson_html_template.render(device_alias = device.alias)
@@ -984,7 +985,7 @@ class Collect_Information(aetest.Testcase):
                           fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Interface/%s_show_vrf_all_interface.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Interface/%s_show_vrf_all_interface.md --output Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Interface/%s_show_vrf_all_interface_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Interface/%s_show_vrf_all_interface.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_VRF_All_Interface/%s_show_vrf_all_interface_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_vrf_all_interface_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf_all_interface,filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_vrf_all_interface_netjson_html_template.render(device_alias = device.alias)
@@ -1019,7 +1020,7 @@ class Collect_Information(aetest.Testcase):
                             fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_VLAN/%s_show_vlan.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_VLAN/%s_show_vlan.md --output Camelot/Cisco/DevNet_Sandbox/Show_VLAN/%s_show_vlan_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_VLAN/%s_show_vlan.md" % device.alias, "Camelot/Cisco/DevNet_Sandbox/Show_VLAN/%s_show_vlan_mind_map.html" % device.alias)
 
                     parsed_output_netjson_json = sh_vlan_netjson_json_template.render(to_parse_vlan=self.parsed_show_vlan['vlans'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                     parsed_output_netjson_html = sh_vlan_netjson_html_template.render(device_alias = device.alias)
@@ -1061,7 +1062,7 @@ class Collect_Information(aetest.Testcase):
                                     fh.write(parsed_output_type)
         
                             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/DevNet_Sandbox/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_mind_map.html" % (device.alias,vrf))
 
                             parsed_output_netjson_json = sh_ip_arp_vrf_netjson_json_template.render(to_parse_ip_arp=self.parsed_show_ip_arp_vrf['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
                             parsed_output_netjson_html = sh_ip_arp_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
@@ -1095,7 +1096,7 @@ class Collect_Information(aetest.Testcase):
                                 with open("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
                                   fh.write(parsed_output_type)
                             if os.path.exists("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md --output Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                                mind_maps.add("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_mind_map.html" % (device.alias,vrf))
                             parsed_output_netjson_json = sh_ip_route_vrf_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype,vrf = vrf,device_alias = device.alias)
                             parsed_output_netjson_html = sh_ip_route_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
                             with open("Camelot/Cisco/DevNet_Sandbox/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
@@ -1107,6 +1108,8 @@ class Collect_Information(aetest.Testcase):
                         # ----------------
                         table.insert(self.parsed_show_ip_route_vrf)
         
+        # Mind Maps
+        mind_maps.build()
         db.close()
         # Goodbye Banner
         print(Panel.fit(Text.from_markup(FINISHED)))
@@ -16,10 +16,14 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParseConfigFunction, ParseDictFunction
 from elasticsearch import Elasticsearch
+import elastic_sink
+from elastic_sink import BulkSink
+from elastic_documents import elastic_documents
+import elastic_index
+from elastic_index import IndexLayout
 
 
 # ----------------
@@ -29,16 +33,54 @@ from elasticsearch import Elasticsearch
 log = logging.getLogger(__name__)
 
 # ----------------
-# Template Directory
+# Define Elastic
+# ----------------
+es = Elasticsearch(cloud_id="{{ YOUR CLOUD ID HERE }}", http_auth=('elastic', '{{ YOUR PASSWORD HERE }}'))
+
+# ----------------
+# Script parameters
 # ----------------
 
-template_dir = 'templates/cisco/nxos'
-env = Environment(loader=FileSystemLoader(template_dir))
+parameters = {
+    # Documents per bulk request, NDJSON bytes per bulk request and bulk requests in flight;
+    # override with the job's --elastic-batch-size, --elastic-batch-bytes and --elastic-inflight
+    'elastic_batch_size': elastic_sink.batch_size,
+    'elastic_batch_bytes': elastic_sink.batch_bytes,
+    'elastic_inflight': elastic_sink.max_inflight,
+    # "device" (one index per device and feature), "feature" (one index per feature) or
+    # "data_stream" (one data stream per feature); the job's --elastic-index-mode
+    'elastic_index_mode': elastic_index.index_mode,
+}
 
 # ----------------
-# Define Elastic
+# Elastic features
 # ----------------
-es = Elasticsearch(cloud_id="{{ YOUR CLOUD ID HERE }}", http_auth=('elastic', '{{ YOUR PASSWORD HERE }}'))
+# (feature, attribute holding its Genie learn().info or parsed show command)
+elastic_features = [
+    ("learned_acl", "learned_acl"),
+    ("learned_arp", "learned_arp"),
+    ("learned_bgp", "learned_bgp"),
+    ("learned_interface", "learned_interface"),
+    ("learned_ospf", "learned_ospf"),
+    ("learned_platform", "learned_platform"),
+    ("learned_routing", "learned_routing"),
+    ("learned_vlan", "learned_vlan"),
+    ("learned_vrf", "learned_vrf"),
+    ("show_bgp_process_vrf_all", "parsed_show_bgp_process_vrf_all"),
+    ("show_bgp_sessions", "parsed_show_bgp_sessions"),
+    ("show_interface_status", "parsed_show_int_status"),
+    ("show_inventory", "parsed_show_inventory"),
+    ("show_ip_interface_brief", "parsed_show_ip_int_brief"),
+    ("show_ip_ospf", "parsed_show_ip_ospf"),
+    ("show_ip_route", "parsed_show_ip_route"),
+    ("show_mac_address_table", "parsed_show_mac_address_table"),
+    ("show_port_channel_summary", "parsed_show_port_channel_summary"),
+    ("show_version", "parsed_show_version"),
+    ("show_vlan", "parsed_show_vlan"),
+    ("show_vrf", "parsed_show_vrf"),
+    ("show_vrf_all_detail", "parsed_show_vrf_all_detail"),
+    ("show_vrf_all_interface", "parsed_show_vrf_all_interface"),
+]
 
 # ----------------
 # AE Test Setup
@@ -58,8 +100,15 @@ class Collect_Information(aetest.Testcase):
     """Parse all the commands"""
 
     @aetest.test
-    def parse(self, testbed, section, steps):
+    def parse(self, testbed, section, steps, elastic_batch_size, elastic_batch_bytes, elastic_inflight, elastic_index_mode):
         """ Testcase Setup section """
+        # Index template and ingest pipeline, installed before anything is written
+        layout = IndexLayout(elastic_index_mode)
+        layout.install(es, [feature for feature, attribute in elastic_features])
+
+        # Documents of every device are shipped together through the _bulk API
+        sink = BulkSink(es, batch_size=elastic_batch_size, batch_bytes=elastic_batch_bytes, max_inflight=elastic_inflight)
+
         # ---------------------------------------
         # Loop over devices
         # ---------------------------------------
@@ -151,248 +200,23 @@ class Collect_Information(aetest.Testcase):
             with steps.start('Post To ElasticSearch',continue_=True) as step:
                 print(Panel.fit(Text.from_markup(WRITING)))
                 
-                ###############################
-                # Genie learn().info section
-                ###############################
-
-                # Learned ACLs
-                if self.learned_acl is not None:
-                    learned_acl_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_acl_elastic = learned_acl_elastic_template.render(to_normalize_for_elastic=self.learned_acl)
-
-                #    # ----------------
-                #    # Store acl in Elastic
-                #    # ----------------
-                    es.index(index='%s_learned_acl' % device.alias.lower(), id=unique_id, 
-                             body=learned_acl_elastic)
-
-                # Learned ARP
-                if self.learned_arp is not None:
-                    learned_arp_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_arp_elastic = learned_arp_elastic_template.render(to_normalize_for_elastic=self.learned_arp)
-
-                    # ----------------
-                    # Store arp in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_arp' % device.alias.lower(), id=unique_id, 
-                             body=learned_arp_elastic)
-
-                # Learned BGP
-                if self.learned_bgp is not None:
-                    learned_bgp_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_bgp_elastic = learned_bgp_elastic_template.render(to_normalize_for_elastic=self.learned_bgp)
-
-                    # ----------------
-                    # Store bgp in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_bgp' % device.alias.lower(), id=unique_id, 
-                             body=learned_bgp_elastic)
-
-                # Learned Interface
-                if self.learned_interface is not None:
-                    learned_interface_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_interface_elastic = learned_interface_elastic_template.render(to_normalize_for_elastic=self.learned_interface)
-
-                    # ----------------
-                    # Store Interface in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_interface' % device.alias.lower(), id=unique_id, 
-                             body=learned_interface_elastic)
-
-                # Learned OSPF
-                if self.learned_ospf is not None:
-                    learned_ospf_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_ospf_elastic = learned_ospf_elastic_template.render(to_normalize_for_elastic=self.learned_ospf)
-                    # ----------------
-                    # Store ospf in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_ospf' % device.alias.lower(), id=unique_id, 
-                             body=learned_ospf_elastic)
-
-                # Learned Platform
-                if self.learned_platform is not None:
-                    learned_platform_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_platform_elastic = learned_platform_elastic_template.render(to_normalize_for_elastic=self.learned_platform)
-                    # ----------------
-                    # Store platform in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_platform' % device.alias.lower(), id=unique_id, 
-                             body=learned_platform_elastic)                
-
-                # Learned Routing
-                if self.learned_routing is not None:
-                    learned_routing_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_routing_elastic = learned_routing_elastic_template.render(to_normalize_for_elastic=self.learned_routing)
-                    # ----------------
-                    # Store routing in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_routing' % device.alias.lower(), id=unique_id, 
-                             body=learned_routing_elastic) 
-
-                # Learned VLAN
-                if self.learned_vlan is not None:
-                    learned_vlan_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_vlan_elastic = learned_vlan_elastic_template.render(to_normalize_for_elastic=self.learned_vlan)
-                    # ----------------
-                    # Store vlan in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_vlan' % device.alias.lower(), id=unique_id, 
-                             body=learned_vlan_elastic)
-
-                # Learned VRF
-                if self.learned_vrf is not None:
-                    learned_vrf_elastic_template = env.get_template('elastic_standards.j2')
-                    learned_vrf_elastic = learned_vrf_elastic_template.render(to_normalize_for_elastic=self.learned_vrf)
-                    # ----------------
-                    # Store vrf in Elastic
-                    # ----------------
-                    es.index(index='%s_learned_vrf' % device.alias.lower(), id=unique_id, 
-                             body=learned_vrf_elastic)
-
-                ###############################
-                # Genie Show Command Section
-                ###############################
-                
-                # Show BGP Process VRF all
-                if self.parsed_show_bgp_process_vrf_all is not None:
-                    show_bgp_process_vrf_all_elastic_template = env.get_template('elastic_standards.j2')
-                    show_bgp_process_vrf_all_elastic = show_bgp_process_vrf_all_elastic_template.render(to_normalize_for_elastic=self.parsed_show_bgp_process_vrf_all)
-                    # ----------------
-                    # Store BGP Process VRF all in Elastic
-                    # ----------------
-                    es.index(index='%s_show_bgp_process_vrf_all' % device.alias.lower(), id=unique_id, 
-                             body=show_bgp_process_vrf_all_elastic)
-
-                # Show BGP Sessions
-                if self.parsed_show_bgp_sessions is not None:
-                    show_bgp_sessions_elastic_template = env.get_template('elastic_standards.j2')
-                    show_bgp_sessions_elastic = show_bgp_sessions_elastic_template.render(to_normalize_for_elastic=self.parsed_show_bgp_sessions)
-                    # ----------------
-                    # Store BGP in Elastic
-                    # ----------------
-                    es.index(index='%s_show_bgp_sessions' % device.alias.lower(), id=unique_id, 
-                             body=show_bgp_sessions_elastic)
+                # Client side timestamp shared by every document of the device
+                collected_at = layout.now()
 
-                # Show Interface Status
-                if self.parsed_show_int_status is not None:
-                    show_int_status_elastic_template = env.get_template('elastic_standards.j2')
-                    show_int_status_elastic = show_int_status_elastic_template.render(to_normalize_for_elastic=self.parsed_show_int_status)
-                    # ----------------
-                    # Store Interface in Elastic
-                    # ----------------
-                    es.index(index='%s_show_interface_status' % device.alias.lower(), id=unique_id, 
-                             body=show_int_status_elastic)
-
-                # Show Inventory
-                if self.parsed_show_inventory is not None:
-                    show_inventory_elastic_template = env.get_template('elastic_standards.j2')
-                    show_inventory_elastic = show_inventory_elastic_template.render(to_normalize_for_elastic=self.parsed_show_inventory)
-                    # ----------------
-                    # Store Inventory in Elastic
-                    # ----------------
-                    es.index(index='%s_show_inventory' % device.alias.lower(), id=unique_id, 
-                             body=show_inventory_elastic)
-
-                # Show IP Interface Brief
-                if self.parsed_show_ip_int_brief is not None:
-                    show_ip_int_brief_elastic_template = env.get_template('elastic_standards.j2')
-                    show_ip_int_brief_elastic = show_ip_int_brief_elastic_template.render(to_normalize_for_elastic=self.parsed_show_ip_int_brief)
-                    # ----------------
-                    # Store IP Interface in Elastic
-                    # ----------------
-                    es.index(index='%s_show_ip_interface_brief' % device.alias.lower(), id=unique_id, 
-                             body=show_ip_int_brief_elastic)
-
-                # Show IP OSPF
-                if self.parsed_show_ip_ospf is not None:
-                    show_ip_ospf_elastic_template = env.get_template('elastic_standards.j2')
-                    show_ip_ospf_elastic = show_ip_ospf_elastic_template.render(to_normalize_for_elastic=self.parsed_show_ip_ospf)
-                    # ----------------
-                    # Store IP OSPF in Elastic
-                    # ----------------
-                    es.index(index='%s_show_ip_ospf' % device.alias.lower(), id=unique_id, 
-                             body=show_ip_ospf_elastic)
-
-                # Show IP Route
-                if self.parsed_show_ip_route is not None:
-                    show_ip_route_elastic_template = env.get_template('elastic_standards.j2')
-                    show_ip_route_elastic = show_ip_route_elastic_template.render(to_normalize_for_elastic=self.parsed_show_ip_route)
-                    # ----------------
-                    # Store IP Route in Elastic
-                    # ----------------
-                    es.index(index='%s_show_ip_route' % device.alias.lower(), id=unique_id, 
-                             body=show_ip_route_elastic)
-
-                # Show MAC Address Table
-                if self.parsed_show_mac_address_table is not None:
-                    show_mac_address_table_elastic_template = env.get_template('elastic_standards.j2')
-                    show_mac_address_table_elastic = show_mac_address_table_elastic_template.render(to_normalize_for_elastic=self.parsed_show_mac_address_table)
-                    # ----------------
-                    # Store MAC Address Table in Elastic
-                    # ----------------
-                    es.index(index='%s_show_mac_address_table' % device.alias.lower(), id=unique_id, 
-                             body=show_mac_address_table_elastic)
-
-                # Show Port-Channel Summary
-                if self.parsed_show_port_channel_summary is not None:
-                    show_port_channel_summary_elastic_template = env.get_template('elastic_standards.j2')
-                    show_port_channel_summary_elastic = show_port_channel_summary_elastic_template.render(to_normalize_for_elastic=self.parsed_show_port_channel_summary)
-                    # ----------------
-                    # Store Port-Channel Summary in Elastic
-                    # ----------------
-                    es.index(index='%s_show_port_channel_summary' % device.alias.lower(), id=unique_id, 
-                             body=show_port_channel_summary_elastic)
-
-                # Show Version
-                if self.parsed_show_version is not None:
-                    show_version_elastic_template = env.get_template('elastic_standards.j2')
-                    show_version_elastic = show_version_elastic_template.render(to_normalize_for_elastic=self.parsed_show_version)
-                    # ----------------
-                    # Store Version in Elastic
-                    # ----------------
-                    es.index(index='%s_show_version' % device.alias.lower(), id=unique_id, 
-                             body=show_version_elastic)
-
-                # Show VLAN
-                if self.parsed_show_vlan is not None:
-                    show_vlan_elastic_template = env.get_template('elastic_standards.j2')
-                    show_vlan_elastic = show_vlan_elastic_template.render(to_normalize_for_elastic=self.parsed_show_vlan)
-                    # ----------------
-                    # Store vlan in Elastic
-                    # ----------------
-                    es.index(index='%s_show_vlan' % device.alias.lower(), id=unique_id, 
-                             body=show_vlan_elastic)
-
-                # Show VRF
-                if self.parsed_show_vrf is not None:
-                    show_vrf_elastic_template = env.get_template('elastic_standards.j2')
-                    show_vrf_elastic = show_vrf_elastic_template.render(to_normalize_for_elastic=self.parsed_show_vrf)
-                    # ----------------
-                    # Store vrf in Elastic
-                    # ----------------
-                    es.index(index='%s_show_vrf' % device.alias.lower(), id=unique_id, 
-                             body=show_vrf_elastic)
-
-                # Show VRF all detail
-                if self.parsed_show_vrf_all_detail is not None:
-                    show_vrf_all_detail_elastic_template = env.get_template('elastic_standards.j2')
-                    show_vrf_all_detail_elastic = show_vrf_all_detail_elastic_template.render(to_normalize_for_elastic=self.parsed_show_vrf_all_detail)
-                    # ----------------
-                    # Store vrf_all_detail in Elastic
-                    # ----------------
-                    es.index(index='%s_show_vrf_all_detail' % device.alias.lower(), id=unique_id, 
-                             body=show_vrf_all_detail_elastic)
-
-                # Show VRF all interface
-                if self.parsed_show_vrf_all_interface is not None:
-                    show_vrf_all_interface_elastic_template = env.get_template('elastic_standards.j2')
-                    show_vrf_all_interface_elastic = show_vrf_all_interface_elastic_template.render(to_normalize_for_elastic=self.parsed_show_vrf_all_interface)
-                    print (show_vrf_all_interface_elastic)
+                for feature, attribute in elastic_features:
+                    data = getattr(self, attribute)
+                    if data is None:
+                        continue
                     # ----------------
-                    # Store vrf_all_interface in Elastic
+                    # Normalize and store the feature in Elastic
                     # ----------------
-                    es.index(index='%s_show_vrf_all_interface' % device.alias.lower(), id=unique_id, 
-                             body=show_vrf_all_interface_elastic)
+                    documents = elastic_documents(feature, data)
+                    for number, document in enumerate(documents):
+                        sink.index(layout.index(feature, device.alias), layout.stamp(document, device.alias, collected_at),
+                                   id=unique_id if len(documents) == 1 else "%s_%i" % (unique_id, number), op_type=layout.op_type)
 
+        # Ship the remaining documents and report the ingestion throughput
+        elastic_stats = sink.close()
+        print(Panel.fit(Text.from_markup("Elastic: %s" % elastic_stats)))
         # Goodbye Banner
         print(Panel.fit(Text.from_markup(FINISHED)))
@@ -3,13 +3,41 @@ To run the job:
 
 $ pyats run job DevNet_Sandbox_Nexus9k_merlin_Elastic_job.py --testbed-file testbed/testbed_DevNet_Nexus9k_Sandbox.yaml
 
+Tune the Elastic _bulk requests (documents and bytes per request, requests in flight):
+
+$ pyats run job DevNet_Sandbox_Nexus9k_merlin_Elastic_job.py --elastic-batch-size 500 --elastic-batch-bytes 5242880 --elastic-inflight 4
+
+Write one index (or data stream) per feature for the whole fleet instead of one per device and feature:
+
+$ pyats run job DevNet_Sandbox_Nexus9k_merlin_Elastic_job.py --elastic-index-mode feature
+$ pyats run job DevNet_Sandbox_Nexus9k_merlin_Elastic_job.py --elastic-index-mode data_stream
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--elastic-batch-size', dest='elastic_batch_size', type=int,
+                    help='documents per _bulk request (default: MERLIN_ELASTIC_BATCH_SIZE or 500)')
+parser.add_argument('--elastic-batch-bytes', dest='elastic_batch_bytes', type=int,
+                    help='NDJSON bytes per _bulk request (default: MERLIN_ELASTIC_BATCH_BYTES or 5 MiB)')
+parser.add_argument('--elastic-inflight', dest='elastic_inflight', type=int,
+                    help='_bulk requests in flight at once (default: MERLIN_ELASTIC_INFLIGHT or 4)')
+parser.add_argument('--elastic-index-mode', dest='elastic_index_mode', choices=('device', 'feature', 'data_stream'),
+                    help='one index per device and feature, one index per feature or one data stream per feature (default: MERLIN_ELASTIC_INDEX_MODE or device)')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
+    # Only override the script defaults that were given
+    script_args = {name: value for name, value in vars(args).items() if value is not None}
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -26,4 +54,4 @@ def main(runtime):
     testscript = os.path.join(os.path.dirname(__file__), 'DevNet_Sandbox_Nexus9k_merlin_Elastic.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
\ No newline at end of file
+    runtime.tasks.run(testscript=testscript, testbed=testbed, **script_args)
\ No newline at end of file
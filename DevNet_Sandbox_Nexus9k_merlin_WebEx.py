@@ -22,7 +22,7 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParseConfigFunction, ParseDictFunction
 
@@ -37,7 +37,7 @@ log = logging.getLogger(__name__)
 # ----------------
 
 template_dir = 'templates/cisco/nxos'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # WebEx Setup
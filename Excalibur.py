@@ -4,7 +4,6 @@
 import os
 import sys
 import yaml
-import time
 import json
 import shutil
 import logging
@@ -15,9 +14,12 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
+from cisco_api import CiscoOAuth, api_results, serial_coverage
+from output_writer import OutputWriter
 from ascii_art import GREETING, LEARN, RUNNING, CLOUD, WRITING, SERIALS
-from general_functionalities import ParseShowCommandFunction, ParseLearnFunction
+from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParallelDeviceFunction
 from tinydb import TinyDB, Query
 from requests_ntlm import HttpNtlmAuth
 
@@ -44,12 +46,12 @@ nxos_template_dir = 'templates/cisco/nxos'
 cisco_api_template_dir = 'templates/cisco/api'
 f5_template_dir = 'templates/f5'
 
-ios_env = Environment(loader=FileSystemLoader(ios_template_dir))
-ios_xe_env = Environment(loader=FileSystemLoader(ios_xe_template_dir))
-isr_env = Environment(loader=FileSystemLoader(isr_template_dir))
-nxos_env = Environment(loader=FileSystemLoader(nxos_template_dir))
-cisco_api_env = Environment(loader=FileSystemLoader(cisco_api_template_dir))
-f5_env = Environment(loader=FileSystemLoader(f5_template_dir))
+ios_env = template_environment(ios_template_dir)
+ios_xe_env = template_environment(ios_xe_template_dir)
+isr_env = template_environment(isr_template_dir)
+nxos_env = template_environment(nxos_template_dir)
+cisco_api_env = template_environment(cisco_api_template_dir)
+f5_env = template_environment(f5_template_dir)
 
 # ----------------
 # Create Database
@@ -90,9 +92,8 @@ with open("api_credentials/cisco_serial2info.yaml", 'r') as f:
 serial_2_info_api_username = cisco_api_credentials['APIs']['serial_2_info']['serial_2_info_api_username']
 serial_2_info_api_password = cisco_api_credentials['APIs']['serial_2_info']['serial_2_info_api_password']
 
-oauth_token_raw = requests.post("https://cloudsso.cisco.com/as/token.oauth2?grant_type=client_credentials&client_id=%s&client_secret=%s" % (serial_2_info_api_username,serial_2_info_api_password))
-oauth_token_json = oauth_token_raw.json()
-oauth_headers = {"Authorization": "%s %s" % (oauth_token_json['token_type'],oauth_token_json['access_token'])}
+# Token shared with the other Cisco API scripts, refreshed before it expires
+oauth = CiscoOAuth(serial_2_info_api_username, serial_2_info_api_password)
 
 if os.path.exists("api_credentials/sharepoint.yaml"):
     with open("api_credentials/sharepoint.yaml", 'r') as f:
@@ -113,6 +114,35 @@ if os.path.exists("api_credentials/sharepoint.yaml"):
         sharepoint_contracts_sharepoint_filename = sharepoint_api_credentials['APIs']['contracts']['sharePointFileName']
         sharepoint_contracts_upload_filename = sharepoint_api_credentials['APIs']['contracts']['uploadFileName']
 
+# ----------------
+# Serial numbers
+# ----------------
+# Platforms whose inventory serial numbers get a sn2info contract lookup
+serial_platforms = ["cat2960", "cat3560", "cat3750", "cat4500", "cat6500", "isr", "cat3850", "nxos"]
+
+def inventory_serials(parsed_show_inventory) -> list:
+    """Every serial number in a parsed show inventory (chassis, modules, subslots, PSUs)
+    in inventory order: 'sn' in the IOS / IOS XE schemas, 'serial_number' in NX-OS"""
+    serials = []
+    def walk(value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key in ('sn', 'serial_number') and isinstance(item, str):
+                    serials.append(item)
+                else:
+                    walk(item)
+    walk(parsed_show_inventory)
+    return serials
+
+# ----------------
+# Script parameters
+# ----------------
+
+parameters = {
+    # Devices parsed concurrently; override with the job's --max-workers
+    'max_workers': 1,
+}
+
 # ----------------
 # AE Test Setup
 # ----------------
@@ -131,7 +161,7 @@ class Collect_Information(aetest.Testcase):
     """Parse all the commands"""
 
     @aetest.test
-    def parse(self, testbed, section, steps):
+    def parse(self, testbed, section, steps, max_workers):
         """ Testcase Setup section """
 
         # ---------------------------------------
@@ -156,48 +186,26 @@ class Collect_Information(aetest.Testcase):
             html.write("<tr><th>Hostname</th><th>Slot</th><th>Part</th><th>Description</th><th>Serial Number</th><th>Virtual ID</th><th>Subslot</th><th>Subslot Part</th><th>Subslot Description</th><th>Subslot Serial Number</th><th>Subslot Virtual ID</th></tr>")
             html.close()        
 
-        with open("Camelot/Excalibur/Contracts.csv",'w') as csv:
-            csv.seek(0, 0)
-            csv.write("Hostname,PID,Service Contract Number,Serial Number,Parent Serial Number,Under Contract,Item Description,Item Type,Warranty Type,Product Line End Date,Warranty End Date,Customer Name,Contract Address,Contract City,Contract State/Province,Contract Country")
-            csv.close()                                   
+        # Serial numbers of every device, looked up together once the inventory is done
+        device_serials = {}
 
-        with open("Camelot/Excalibur/Contracts.md",'w') as md:
-            md.seek(0, 0)
-            md.write("# Serial 2 Contract Information")
-            md.write("\n")
-            md.write("| Hostname | PID | Service Contract Number | Serial Number | Parent Serial Number | Under Contract | Item Description | Item Type | Warranty Type | Product Line End Date | Warranty End Date | Customer Name | Contract Address | Contract City | Contract State/Province | Contract Country |")
-            md.write("\n")
-            md.write("| Hostname | --- | ----------------------- | ------------- | -------------------- | -------------- | ---------------- | --------- | ------------- | --------------------- | ----------------- | ------------- | ---------------- | ------------- | ----------------------- | ---------------- |")
-            md.close() 
-
-        with open("Camelot/Excalibur/Contracts.html",'w') as html:
-            html.seek(0, 0)
-            html.write("<html><body><h1>Serial 2 Contract Infromation</h1><table style=\"width:100%\">")
-            html.write("\n")
-            html.write("<tr><th>Hostname</th><th>PID</th><th>Service Contract Number</th><th>Serial Number</th><th>Parent Serial Number</th><th>Under Contract</th><th>Item Description</th><th>tem Type</th><th>Warranty Type</th><th>Product Line End Date</th><th>Warranty End Date</th><th>Customer Name</th><th>Contract Address</th><th>Contract City</th><th>Contract State/Province</th><th>Contract Country</th></tr>")                     
-            html.close()
+        # ---------------------------------------
+        # Execute parser for various show commands, max_workers devices at a time
+        # ---------------------------------------
+        parsed_devices = ParallelDeviceFunction.run_per_device(steps, testbed, self.parse_device, max_workers)
 
         # ---------------------------------------
-        # Loop over devices
+        # Loop over devices in testbed order, every device appends to the same Inventory files
         # ---------------------------------------
         for device in testbed:
             # ----------------
             # Create a table in the database
             # ----------------
             table = inventory_db.table(device.alias)
-            table = contract_db.table(device.alias)
-
-            # ---------------------------------------
-            # Execute parser for various show commands
-            # ---------------------------------------
-            print(Panel.fit(Text.from_markup(RUNNING)))
 
-            # Show Interface Transceiver (NXOS)
-            if device.os == "nxos":
-                self.parsed_show_interface_transceiver = ParseShowCommandFunction.parse_show_command(steps, device, "show interface transceiver")
-
-            # Show Inventory
-            self.parsed_show_inventory = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
+            parsed = parsed_devices.get(device.alias) or {}
+            self.parsed_show_interface_transceiver = parsed.get("show interface transceiver")
+            self.parsed_show_inventory = parsed.get("show inventory")
 
             # ---------------------------------------
             # Create JSON, YAML, CSV, MD, HTML, HTML Mind Map files from the Parsed Data
@@ -401,327 +409,34 @@ class Collect_Information(aetest.Testcase):
 
                     table.insert(self.parsed_show_inventory)
 
-                    # Serial 2 Info Template
-                    serial_2_info_template = cisco_api_env.get_template('excalibur_serial_2_info.j2')
-
-                    print(Panel.fit(Text.from_markup(CLOUD)))
-                    if device.platform == "cat2960":
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        time.sleep(1)
-                                        with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                            try:                                      
-                                                serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                serial_2_info_json = serial_2_info_raw.json()
-                                                with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                    json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                    fid.write('\n')
-
-                                                with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                    yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                    yml.write('\n')
-
-                                                for filetype in filetype_loop:
-                                                    parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                    with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                        fh.write(parsed_output_type)
-
-                                            except Exception as e:
-                                                step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        for subslot,value in value['subslot'].items():
-                                            for part,value in value.items():
-                                                time.sleep(1)
-                                                with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                                    try:                                      
-                                                        serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                        serial_2_info_json = serial_2_info_raw.json()
-                                                        with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                            json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                            fid.write('\n')
-
-                                                        with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                            yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                            yml.write('\n')
-    
-                                                        for filetype in filetype_loop:
-                                                            parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                            with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                                fh.write(parsed_output_type)
-
-                                                    except Exception as e:
-                                                        step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                    if device.platform == "cat3560":
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        time.sleep(1)
-                                        with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                            try:                                      
-                                                serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                serial_2_info_json = serial_2_info_raw.json()
-                                                with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                    json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                    fid.write('\n')
-
-                                                with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                    yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                    yml.write('\n')
-
-                                                for filetype in filetype_loop:
-                                                    parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                    with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                        fh.write(parsed_output_type)
-
-                                            except Exception as e:
-                                                step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        for subslot,value in value['subslot'].items():
-                                            for part,value in value.items():
-                                                time.sleep(1)
-                                                with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                                    try:                                      
-                                                        serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                        serial_2_info_json = serial_2_info_raw.json()
-                                                        with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                            json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                            fid.write('\n')
-
-                                                        with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                            yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                            yml.write('\n')
-    
-                                                        for filetype in filetype_loop:
-                                                            parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                            with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                                fh.write(parsed_output_type)
-
-                                                    except Exception as e:
-                                                        step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                    if device.platform == "cat3750":
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        time.sleep(1)
-                                        with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                            try:                                      
-                                                serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                serial_2_info_json = serial_2_info_raw.json()
-                                                with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                    json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                    fid.write('\n')
-
-                                                with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                    yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                    yml.write('\n')
-
-                                                for filetype in filetype_loop:
-                                                    parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                    with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                        fh.write(parsed_output_type)
-
-                                            except Exception as e:
-                                                step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                        for slot,value in self.parsed_show_inventory.items():
-                            for slot_number,value in value.items():
-                                for rp,value in value.items():
-                                    for part,value in value.items():
-                                        for subslot,value in value['subslot'].items():
-                                            for part,value in value.items():
-                                                time.sleep(1)
-                                                with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                                    try:                                      
-                                                        serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                                        serial_2_info_json = serial_2_info_raw.json()
-                                                        with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                            json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                            fid.write('\n')
-
-                                                        with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                            yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                            yml.write('\n')
-    
-                                                        for filetype in filetype_loop:
-                                                            parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                            with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                                fh.write(parsed_output_type)
-
-                                                    except Exception as e:
-                                                        step.failed('There was a problem with the API\n{e}'.format(e=e))   
+                    # Serial numbers for the sn2info lookup
+                    if device.platform in serial_platforms:
+                        device_serials[device.alias] = inventory_serials(self.parsed_show_inventory)
 
-                    if device.platform == "cat4500":
-                        for part,value in self.parsed_show_inventory.items():
-                            for pid,value in value.items():
-                                for sn,value in value.items():
-                                    time.sleep(1)
-                                    with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                    fh.write(parsed_output_type)
-
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                    if device.platform == "cat6500":
-                        for part,value in self.parsed_show_inventory.items():
-                            for pid,value in value.items():
-                                for sn,value in value.items():
-                                    time.sleep(1)
-                                    with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                    fh.write(parsed_output_type)
-
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e)) 
-
-                    if device.platform == "isr":
-                        for part,value in self.parsed_show_inventory['main'].items():
-                            for chassis,value in value.items():
-                                time.sleep(1)                          
-                                with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                    try:                                      
-                                        serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                        serial_2_info_json = serial_2_info_raw.json()
-                                        with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                            json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                            fid.write('\n')
-
-                                        with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                            yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                            yml.write('\n')
-
-                                        for filetype in filetype_loop:
-                                            parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                            with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                fh.write(parsed_output_type)
-
-                                    except Exception as e:
-                                        step.failed('There was a problem with the API\n{e}'.format(e=e)) 
-
-                        for part,value in self.parsed_show_inventory['slot'].items():
-                            for slot,value in value.items():                          
-                                for part,value in value.items():
-                                    time.sleep(1)
-                                    with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                    fh.write(parsed_output_type)
-
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e)) 
-
-                    if device.platform == "cat3850":
-                        for slot,value01 in self.parsed_show_inventory['slot'].items():
-                            for pid,value02 in value01.items():
-                                for part,value03 in value02.items():
-                                    time.sleep(1)
-                                    with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value03['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                    fh.write(parsed_output_type)    
-                                                                                            
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
-
-                    if device.platform == "nxos":
-                        for slot,value in self.parsed_show_inventory.items():
-                            for pid,value in value.items():
-                                time.sleep(1)                
-                                with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
-                                    try:    
-                                        serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['serial_number'], headers=oauth_headers)
-                                        serial_2_info_json = serial_2_info_raw.json()
-                                        with open("Camelot/Excalibur/Contracts.json", "a") as fid:
-                                            json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                            fid.write('\n')
-
-                                        with open("Camelot/Excalibur/Contracts.yaml", "a") as yml:
-                                            yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                            yml.write('\n')
-
-                                        for filetype in filetype_loop:
-                                            parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],hostname=device.alias,filetype_loop_jinja2=filetype)
-
-                                            with open("Camelot/Excalibur/Contracts.%s" % filetype, "a") as fh:
-                                                fh.write(parsed_output_type)  
-
-                                    except Exception as e:
-                                        step.failed('There was a problem with the API\n{e}'.format(e=e))
+        # ---------------------------------------
+        # Cisco Serial 2 Info REST API
+        # ---------------------------------------
+        # Every distinct serial number of the testbed in batches, then the coverage of each
+        # device's serial numbers to the Contracts outputs and its Contracts_DB table
+        with steps.start('Calling the Cisco Serial 2 Info REST API',continue_=True) as step:
+            print(Panel.fit(Text.from_markup(CLOUD)))
+            coverage, errors = serial_coverage([serial for serials in device_serials.values() for serial in serials], oauth)
+
+            serial_2_info_template = cisco_api_env.get_template('excalibur_serial_2_info.j2')
+            with OutputWriter("Camelot/Excalibur", "Contracts", "Serial 2 Contract Information",
+                              ["Hostname", "PID", "Service Contract Number", "Serial Number", "Parent Serial Number", "Under Contract", "Item Description", "Item Type", "Warranty Type", "Product Line End Date", "Warranty End Date", "Customer Name", "Contract Address", "Contract City", "Contract State/Province", "Contract Country"],
+                              serial_2_info_template, 'to_parse_serial_2_info') as contracts_writer:
+                for device_alias, serials in device_serials.items():
+                    serial_2_info_json = {"serial_numbers": [coverage[serial] for serial in dict.fromkeys(serials) if serial in coverage]}
+                    contracts_writer.write(serial_2_info_json, serial_2_info_json['serial_numbers'], hostname=device_alias)
+
+                    # ----------------
+                    # Store Contracts in Device Table in Database
+                    # ----------------
+                    contract_db.table(device_alias).insert(serial_2_info_json)
+
+            if errors:
+                step.failed('There was a problem with the API\n{e}'.format(e="\n".join(repr(e) for batch, e in errors)))
 
         # ----------------
         # F5
@@ -803,19 +518,12 @@ class Collect_Information(aetest.Testcase):
             html.close() 
                             
         if os.path.exists("Camelot/Excalibur/Inventory.md"):
-            os.system("markmap --no-open Camelot/Excalibur/Inventory.md --output Camelot/Excalibur/Inventory_mind_map.html")
+            mind_maps.add("Camelot/Excalibur/Inventory.md", "Camelot/Excalibur/Inventory_mind_map.html")
 
             fh.close()
             fid.close()
             yml.close()
 
-        with open("Camelot/Excalibur/Contracts.html", "a") as html:
-            html.write("</table></body></html>")
-            html.close()             
-
-        if os.path.exists("Camelot/Excalibur/Contracts.md"):
-            os.system("markmap --no-open Camelot/Excalibur/Contracts.md --output Camelot/Excalibur/Contracts_mind_map.html")
-
         # SHAREPOINT # 
 
         if os.path.exists("api_credentials/sharepoint.yaml"):
@@ -871,7 +579,23 @@ class Collect_Information(aetest.Testcase):
 
                 uploadResult = requests.post(contractRequestUrl,auth=HttpNtlmAuth('%s\\%s' % (sharepoint_inventory_api_domain,sharepoint_inventory_api_username),'%s' % sharepoint_inventory_api_password), headers=headers, verify=False, data=file.read())
 
+        # Cisco API cache hit rates
+        api_results.log_report()
+        # Mind Maps
+        mind_maps.build()
         inventory_db.close()
         contract_db.close()
         # Goodbye Banner
-        print(Panel.fit(Text.from_markup(SERIALS)))
\ No newline at end of file
+        print(Panel.fit(Text.from_markup(SERIALS)))
+    def parse_device(self, steps, device):
+        """ Parse a single device's inventory commands """
+        print(Panel.fit(Text.from_markup(RUNNING)))
+        parsed = {}
+
+        # Show Interface Transceiver (NXOS)
+        if device.os == "nxos":
+            parsed["show interface transceiver"] = ParseShowCommandFunction.parse_show_command(steps, device, "show interface transceiver")
+
+        # Show Inventory
+        parsed["show inventory"] = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
+        return parsed
@@ -3,13 +3,27 @@ To run the job:
 
 $ pyats run job Excalibur_job.py --testbed-file testbed/Excalibur_testbed.yaml
 
+Parse up to N devices concurrently:
+
+$ pyats run job Excalibur_job.py --testbed-file testbed/Excalibur_testbed.yaml --max-workers 8
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--max-workers', dest='max_workers', type=int, default=1,
+                    help='number of devices parsed concurrently')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -26,4 +40,4 @@ def main(runtime):
     testscript = os.path.join(os.path.dirname(__file__), 'Excalibur.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
+    runtime.tasks.run(testscript=testscript, testbed=testbed, max_workers=args.max_workers)
@@ -7,7 +7,6 @@
 # ----------------
 # Python
 # ----------------
-import os
 import sys
 import yaml
 import time
@@ -20,7 +19,8 @@ from rich.panel import Panel
 from rich.text import Text
 from pyats import aetest
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
 
 # ----------------
@@ -40,7 +40,7 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/f5'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Load Credentials 
@@ -124,7 +124,7 @@ class Collect_Information(aetest.Testcase):
                         with open("Camelot/F5/Virtual_Servers/%s_virtual_servers.%s" % (device_alias,filetype), "w") as fh:
                             fh.write(parsed_output_vs) 
                     
-                        os.system("markmap Camelot/F5/Virtual_Servers/%s_virtual_servers.md --output Camelot/F5/Virtual_Servers/%s_virtual_servers_mind_map.html" % (device_alias,device_alias))
+                        mind_maps.add("Camelot/F5/Virtual_Servers/%s_virtual_servers.md" % device_alias, "Camelot/F5/Virtual_Servers/%s_virtual_servers_mind_map.html" % device_alias)
 
                 # SSL Certificates
                 if hasattr(self, 'raw_ssl_cert'):
@@ -143,8 +143,10 @@ class Collect_Information(aetest.Testcase):
                         with open("Camelot/F5/SSL_Certificates/%s_ssl_certificates.%s" % (device_alias,filetype), "w") as fh:
                             fh.write(parsed_output_ssl_cert) 
                     
-                        os.system("markmap Camelot/F5/SSL_Certificates/%s_ssl_certificates.md --output Camelot/F5/SSL_Certificates/%s_ssl_certificates_mind_map.html" % (device_alias,device_alias))
+                        mind_maps.add("Camelot/F5/SSL_Certificates/%s_ssl_certificates.md" % device_alias, "Camelot/F5/SSL_Certificates/%s_ssl_certificates_mind_map.html" % device_alias)
 
+        # Mind Maps
+        mind_maps.build()
         # ---------------------------------------
         # You Made It 
         # ---------------------------------------
@@ -10,20 +10,20 @@
 import os
 import sys
 import yaml
-import time
 import json
 import shutil
 import logging
-import requests
 from rich import print
 from rich.panel import Panel
 from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
+from cisco_api import CiscoOAuth, api_results, api_url, serial_coverage
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
-from general_functionalities import ParseShowCommandFunction
+from general_functionalities import ParseShowCommandFunction, ParallelDeviceFunction
 
 # ----------------
 # Get logger for script
@@ -42,7 +42,16 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/api'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
+
+# ----------------
+# Script parameters
+# ----------------
+
+parameters = {
+    # Devices parsed concurrently; override with the job's --max-workers
+    'max_workers': 1,
+}
 
 # ----------------
 # AE Test Setup
@@ -62,22 +71,20 @@ class Collect_Information(aetest.Testcase):
     """Parse all the commands"""
 
     @aetest.test
-    def parse(self, testbed, section, steps):
+    def parse(self, testbed, section, steps, max_workers):
         """ Testcase Setup section """
         # ---------------------------------------
-        # Loop over devices
+        # Execute parser for various show commands, max_workers devices at a time
         # ---------------------------------------
-        for device in testbed:
-            # ---------------------------------------
-            # Execute parser for various show commands
-            # ---------------------------------------
-            print(Panel.fit(Text.from_markup(RUNNING)))
-
-            # Show Inventory
-            self.parsed_show_inventory = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
+        parsed_devices = ParallelDeviceFunction.run_per_device(steps, testbed, self.parse_device, max_workers)
 
-            # Show Version
-            self.parsed_show_version = ParseShowCommandFunction.parse_show_command(steps, device, "show version")
+        # ---------------------------------------
+        # Loop over devices; the Cisco APIs are called one device at a time
+        # ---------------------------------------
+        for device in testbed:
+            parsed = parsed_devices.get(device.alias) or {}
+            self.parsed_show_inventory = parsed.get("show inventory")
+            self.parsed_show_version = parsed.get("show version")
 
             # ---------------------------------------
             # Send Version / Serial Numbers to Cisco APIs 
@@ -98,26 +105,23 @@ class Collect_Information(aetest.Testcase):
                     recommended_release_api_username = api_credentials['APIs']['recommended_release']['recommended_release_api_username']
                     recommended_release_api_password = api_credentials['APIs']['recommended_release']['recommended_release_api_password']
 
-                    oauth_token_raw = requests.post("https://cloudsso.cisco.com/as/token.oauth2?grant_type=client_credentials&client_id=%s&client_secret=%s" % (recommended_release_api_username,recommended_release_api_password))
-                    oauth_token_json = oauth_token_raw.json()
-                    oauth_headers = {"Authorization": "%s %s" % (oauth_token_json['token_type'],oauth_token_json['access_token'])}
+                    # Token shared with the other Cisco API scripts, refreshed before it expires
+                    oauth = CiscoOAuth(recommended_release_api_username, recommended_release_api_password)
 
                     print(Panel.fit(Text.from_markup(CLOUD)))
                     for version,value in self.parsed_show_version.items():
                         if device.platform == "cat4500":
                             with steps.start('Calling API',continue_=True) as step:
                                 try:
-                                    recommended_release_raw = requests.get("https://api.cisco.com/software/suggestion/v2/suggestions/software/productIds/WS-C4500X-32SFP+", headers=oauth_headers)
+                                    recommended_release_json = api_results.fetch("software_suggestion", "WS-C4500X-32SFP+", "%s/software/suggestion/v2/suggestions/software/productIds/WS-C4500X-32SFP+" % api_url, auth=oauth)
                                 except Exception as e:
                                     step.failed('Could not parse it correctly\n{e}'.format(e=e))                           
                         else:
                             with steps.start('Calling API',continue_=True) as step:
                                 try:
-                                    recommended_release_raw = requests.get("https://api.cisco.com/software/suggestion/v2/suggestions/software/productIds/%s" % value['chassis'], headers=oauth_headers)
+                                    recommended_release_json = api_results.fetch("software_suggestion", value['chassis'], "%s/software/suggestion/v2/suggestions/software/productIds/%s" % (api_url, value['chassis']), auth=oauth)
                                 except Exception as e:
                                     step.failed('Could not parse it correctly\n{e}'.format(e=e))                           
-                        
-                        recommended_release_json = recommended_release_raw.json()
 
                         with open("Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release.json" % device.alias, "w") as fid:
                           json.dump(recommended_release_json, fid, indent=4, sort_keys=True)
@@ -132,7 +136,7 @@ class Collect_Information(aetest.Testcase):
                                 fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release.md --output Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release.md" % device.alias, "Camelot/Cisco/APIs/Recommended_Release/%s_recommended_release_mind_map.html" % device.alias)
 
                     with open("api_credentials/cisco.yaml", 'r') as f:
                         api_credentials = yaml.safe_load(f)
@@ -140,19 +144,17 @@ class Collect_Information(aetest.Testcase):
                     psirt_api_username = api_credentials['APIs']['psirt']['psirt_api_username']
                     psirt_api_password = api_credentials['APIs']['psirt']['psirt_api_password']
 
-                    oauth_token_raw = requests.post("https://cloudsso.cisco.com/as/token.oauth2?grant_type=client_credentials&client_id=%s&client_secret=%s" % (psirt_api_username,psirt_api_password))
-                    oauth_token_json = oauth_token_raw.json()
-                    oauth_headers = {"Authorization": "%s %s" % (oauth_token_json['token_type'],oauth_token_json['access_token'])}
+                    # Token shared with the other Cisco API scripts, refreshed before it expires
+                    oauth = CiscoOAuth(psirt_api_username, psirt_api_password)
 
                     print(Panel.fit(Text.from_markup(CLOUD)))
                     for version,value in self.parsed_show_version.items():
                         with steps.start('Calling API',continue_=True) as step:
                             try:
-                                psirt_raw = requests.get("https://api.cisco.com/security/advisories/iosxe?version=%s" % value['version'], headers=oauth_headers)
+                                # Advisories of a version are shared by every device and script running it
+                                psirt_json = api_results.fetch("psirt", value['version'], "%s/security/advisories/iosxe?version=%s" % (api_url, value['version']), auth=oauth)
                             except Exception as e:
                                 step.failed('Could not parse it correctly\n{e}'.format(e=e))                           
-                        
-                        psirt_json = psirt_raw.json()
 
                         with open("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.json" % device.alias, "w") as fid:
                           json.dump(psirt_json, fid, indent=4, sort_keys=True)
@@ -167,7 +169,7 @@ class Collect_Information(aetest.Testcase):
                                 fh.write(parsed_output_type)
 
                     if os.path.exists("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md --output Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report.md" % device.alias, "Camelot/Cisco/APIs/PSIRT/%s_PSIRT_report_mind_map.html" % device.alias)
 
                 # Show Inventory
                 if hasattr(self, 'parsed_show_inventory'):
@@ -181,9 +183,8 @@ class Collect_Information(aetest.Testcase):
                     serial_2_info_api_username = api_credentials['APIs']['serial_2_info']['serial_2_info_api_username']
                     serial_2_info_api_password = api_credentials['APIs']['serial_2_info']['serial_2_info_api_password']
 
-                    oauth_token_raw = requests.post("https://cloudsso.cisco.com/as/token.oauth2?grant_type=client_credentials&client_id=%s&client_secret=%s" % (serial_2_info_api_username,serial_2_info_api_password))
-                    oauth_token_json = oauth_token_raw.json()
-                    oauth_headers = {"Authorization": "%s %s" % (oauth_token_json['token_type'],oauth_token_json['access_token'])}
+                    # Token shared with the other Cisco API scripts, refreshed before it expires
+                    oauth = CiscoOAuth(serial_2_info_api_username, serial_2_info_api_password)
 
                     if os.path.exists("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json.json" % (device.alias)):
                        os.remove("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json.json" % (device.alias))
@@ -217,90 +218,77 @@ class Collect_Information(aetest.Testcase):
                     html.close()
 
                     print(Panel.fit(Text.from_markup(CLOUD)))
+                    # ----------------
+                    # Serial numbers of the inventory, in order
+                    # ----------------
+                    serials = []
+                    serial_2_info_template = None
                     if device.platform == "cat4500":
+                        serial_2_info_template = serial_2_info_4500_template
                         for part,value in self.parsed_show_inventory.items():
                             for pid,value in value.items():
                                 for sn,value in value.items():
-                                    time.sleep(5)
-                                    with steps.start('Calling API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json" % device.alias, "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.yaml" % device.alias, "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_4500_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.%s" % (device.alias,filetype), "a") as fh:
-                                                    fh.write(parsed_output_type)
-
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
+                                    serials.append(value['sn'])
 
                     if device.platform == "cat3850":
+                        serial_2_info_template = serial_2_info_3850_template
                         for slot,value01 in self.parsed_show_inventory['slot'].items():
                             for pid,value02 in value01.items():
                                 for part,value03 in value02.items():
-                                    time.sleep(5)
-                                    with steps.start('Calling API',continue_=True) as step:
-                                        try:                                      
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value03['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json" % device.alias, "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
-
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.yaml" % device.alias, "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
-
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_3850_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],filetype_loop_jinja2=filetype)
-
-                                                with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.%s" % (device.alias,filetype), "a") as fh:
-                                                    fh.write(parsed_output_type)    
-                                                                                            
-                                        except Exception as e:
-                                            step.failed('There was a problem with the API\n{e}'.format(e=e))                                        
+                                    serials.append(value03['sn'])
 
                     if device.platform == "cat9300":
+                        serial_2_info_template = serial_2_info_9300_template
                         for slot,value01 in self.parsed_show_inventory['slot'].items():
                             for pid,value02 in value01.items():
-                                for part,value03 in value02.items():                 
-                                    time.sleep(5)
-                                    with steps.start('Calling API',continue_=True) as step:
-                                        try:    
-                                            serial_2_info_raw = requests.get("https://api.cisco.com/sn2info/v2/coverage/summary/serial_numbers/%s" % value03['sn'], headers=oauth_headers)
-                                            serial_2_info_json = serial_2_info_raw.json()
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json" % device.alias, "a") as fid:
-                                                json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
-                                                fid.write('\n')
+                                for part,value03 in value02.items():
+                                    serials.append(value03['sn'])
 
-                                            with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.yaml" % device.alias, "a") as yml:
-                                                yaml.dump(serial_2_info_json, yml, allow_unicode=True)
-                                                yml.write('\n')
+                    # ----------------
+                    # sn2info coverage, batched and cached per serial number like Excalibur's
+                    # ----------------
+                    if serial_2_info_template is not None:
+                        with steps.start('Calling API',continue_=True) as step:
+                            coverage, errors = serial_coverage(serials, oauth)
+                            for serial in serials:
+                                if serial.strip() not in coverage:
+                                    continue
+                                serial_2_info_json = {"serial_numbers": [coverage[serial.strip()]]}
+                                with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.json" % device.alias, "a") as fid:
+                                    json.dump(serial_2_info_json, fid, indent=4, sort_keys=True)
+                                    fid.write('\n')
 
-                                            for filetype in filetype_loop:
-                                                parsed_output_type = serial_2_info_9300_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],filetype_loop_jinja2=filetype)
+                                with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.yaml" % device.alias, "a") as yml:
+                                    yaml.dump(serial_2_info_json, yml, allow_unicode=True)
+                                    yml.write('\n')
 
-                                                with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.%s" % (device.alias,filetype), "a") as fh:
-                                                    fh.write(parsed_output_type)  
+                                for filetype in filetype_loop:
+                                    parsed_output_type = serial_2_info_template.render(to_parse_serial_2_info=serial_2_info_json['serial_numbers'],filetype_loop_jinja2=filetype)
 
-                                        except Exception as e:
-                                            step.failed('There was a problem with the APIy\n{e}'.format(e=e))                                        
+                                    with open("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.%s" % (device.alias,filetype), "a") as fh:
+                                        fh.write(parsed_output_type)
 
-                        fh.close()
-                        fid.close()
-                        yml.close()
+                            if errors:
+                                step.failed('There was a problem with the API\n{e}'.format(e="\n".join(repr(e) for batch, e in errors)))
 
                     if os.path.exists("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.md --output Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info_mind_map.html" % (device.alias,device.alias))
+                        mind_maps.add("Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info.md" % device.alias, "Camelot/Cisco/APIs/Serial_2_Info/%s_serial_2_info_mind_map.html" % device.alias)
                     
+        # Cisco API cache hit rates
+        api_results.log_report()
+        # Mind Maps
+        mind_maps.build()
         # Goodbye Banner
-        print(Panel.fit(Text.from_markup(FINISHED)))            
\ No newline at end of file
+        print(Panel.fit(Text.from_markup(FINISHED)))            
+
+    def parse_device(self, steps, device):
+        """ Parse a single device's show commands """
+        print(Panel.fit(Text.from_markup(RUNNING)))
+        parsed = {}
+
+        # Show Inventory
+        parsed["show inventory"] = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
+
+        # Show Version
+        parsed["show version"] = ParseShowCommandFunction.parse_show_command(steps, device, "show version")
+        return parsed
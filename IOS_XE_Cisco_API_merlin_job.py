@@ -3,13 +3,27 @@ To run the job:
 
 $ pyats run job IOS_XE_Cisco_API_merlin_job.py --testbed-file testbed/testbed_cisco_api.yaml
 
+Parse up to N devices concurrently:
+
+$ pyats run job IOS_XE_Cisco_API_merlin_job.py --testbed-file testbed/testbed_cisco_api.yaml --max-workers 8
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--max-workers', dest='max_workers', type=int, default=1,
+                    help='number of devices parsed concurrently')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -26,4 +40,4 @@ def main(runtime):
     testscript = os.path.join(os.path.dirname(__file__), 'IOS_XE_Cisco_API_merlin.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
\ No newline at end of file
+    runtime.tasks.run(testscript=testscript, testbed=testbed, max_workers=args.max_workers)
\ No newline at end of file
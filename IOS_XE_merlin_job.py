@@ -3,13 +3,65 @@ To run the job:
 
 $ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml
 
+Collect up to N devices concurrently:
+
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --max-workers 8
+
+Archive the raw output of every command, then rebuild Camelot from the archive without
+logging in to the devices (the latest snapshot, or one by timestamp):
+
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --cli-archive
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --replay
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --replay 20261018T020000Z --replay-workers 16
+
+Execute show commands on the device threads and parse their output in 8 processes:
+
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --max-workers 8 --parse-workers 8
+
+PE routers with hundreds of VRFs: write 8 VRFs at a time, and collect every VRF's routes
+with one command:
+
+$ pyats run job IOS_XE_merlin_job.py --testbed-file testbed/testbed_ios_xe.yaml --vrf-workers 8 --vrf-all
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--max-workers', dest='max_workers', type=int, default=1,
+                    help='number of devices collected concurrently')
+parser.add_argument('--max-connections', dest='max_connections', type=int, default=10,
+                    help='number of devices connected to concurrently')
+parser.add_argument('--connect-timeout', dest='connect_timeout', type=int, default=120,
+                    help='seconds to wait for each device to connect before skipping it')
+parser.add_argument('--cli-archive', dest='cli_archive', action='store_true', default=None,
+                    help='archive the raw output of every command sent to the devices')
+parser.add_argument('--cli-archive-dir', dest='cli_archive_dir',
+                    help='folder of the command archive (default: MERLIN_CLI_ARCHIVE_DIR or Camelot/Cisco/IOS_XE/CLI_Archive)')
+parser.add_argument('--replay', dest='replay', nargs='?', const='latest',
+                    help='rebuild the outputs from the archive instead of the devices: latest (default) or a snapshot timestamp')
+parser.add_argument('--replay-workers', dest='replay_workers', type=int,
+                    help='processes parsing archived output (default: MERLIN_REPLAY_WORKERS or the CPU count)')
+parser.add_argument('--parse-workers', dest='parse_workers', type=int,
+                    help='processes parsing show command output, 0 parses on the device threads (default: MERLIN_PARSE_WORKERS or 0)')
+parser.add_argument('--no-command-cache', dest='command_cache', action='store_false', default=None,
+                    help='send show commands to the devices every time learn() or a parse needs them')
+parser.add_argument('--vrf-workers', dest='vrf_workers', type=int,
+                    help='threads writing per-VRF ARP and route outputs while the next VRFs are collected (default: MERLIN_VRF_WORKERS or 4)')
+parser.add_argument('--vrf-all', dest='vrf_all', action='store_true', default=None,
+                    help='collect every VRF\'s routes with one "show ip route vrf *", falling back to one command per VRF it misses')
+parser.add_argument('--timing-dir', dest='timing_dir',
+                    help='folder of the stage timing report and Prometheus textfile (default: Camelot/Cisco/IOS_XE/Timing)')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -22,8 +74,12 @@ def main(runtime):
         # Use the one provided
         testbed = runtime.testbed
 
+    # Only override the archive, replay, parsing, cache, VRF and timing defaults that were given
+    archive_args = {name: getattr(args, name) for name in ('cli_archive', 'cli_archive_dir', 'replay', 'replay_workers', 'parse_workers', 'command_cache', 'vrf_workers', 'vrf_all', 'timing_dir') if getattr(args, name) is not None}
+
     # Find the location of the script in relation to the job file
     testscript = os.path.join(os.path.dirname(__file__), 'IOS_XE_merlin.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
\ No newline at end of file
+    runtime.tasks.run(testscript=testscript, testbed=testbed, max_workers=args.max_workers,
+                      max_connections=args.max_connections, connect_timeout=args.connect_timeout, **archive_args)
\ No newline at end of file
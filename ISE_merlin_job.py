@@ -3,15 +3,43 @@ To run the job:
 
 $ pyats run job ISE_merlin_job.py
 
+Tune the ERS request concurrency and rate limit (requests per second) for the ISE node:
+
+$ pyats run job ISE_merlin_job.py --ise-workers 8 --ise-rate 20
+
+Only request the ERS details of resources that are new or changed since the last run:
+
+$ pyats run job ISE_merlin_job.py --ise-incremental
+$ pyats run job ISE_merlin_job.py --ise-incremental --ise-max-age 168
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--ise-workers', dest='ise_workers', type=int,
+                    help='number of concurrent ERS requests (default: MERLIN_ISE_WORKERS or 8)')
+parser.add_argument('--ise-rate', dest='ise_rate', type=float,
+                    help='ERS requests per second, 0 for no limit (default: MERLIN_ISE_RATE or 20)')
+parser.add_argument('--ise-incremental', dest='ise_incremental', action='store_true', default=None,
+                    help='reuse cached ERS details of resources unchanged since the last run')
+parser.add_argument('--ise-max-age', dest='ise_max_age', type=float,
+                    help='hours after which cached ERS details are requested again, 0 for never')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
+    # Only override the script defaults that were given
+    script_args = {name: value for name, value in vars(args).items() if value is not None}
+
     # Find the location of the script in relation to the job file
     testscript = os.path.join(os.path.dirname(__file__), 'ISE_merlin.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript)    
\ No newline at end of file
+    runtime.tasks.run(testscript=testscript, **script_args)
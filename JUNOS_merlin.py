@@ -7,7 +7,6 @@
 # ----------------
 # Python
 # ----------------
-import os
 import yaml
 import json
 import logging
@@ -15,10 +14,13 @@ from rich import print
 from rich.panel import Panel
 from rich.text import Text
 from pyats import aetest
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
+from ascii_art import FINISHED
+from general_functionalities import ParallelDeviceFunction
 
 template_dir = "templates/juniper"
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Get logger for script
@@ -31,6 +33,15 @@ log = logging.getLogger(__name__)
 
 filetype_loop = ["csv","md","html"]
 
+# ----------------
+# Script parameters
+# ----------------
+
+parameters = {
+    # Devices collected concurrently; override with the job's --max-workers
+    'max_workers': 1,
+}
+
 class common_setup(aetest.CommonSetup):
     """Common Setup section"""
 
@@ -45,61 +56,68 @@ class CollectInformation(aetest.Testcase):
     """Parse all the commands"""
 
     @aetest.test
-    def parse(self, testbed, section, steps):
+    def parse(self, testbed, section, steps, max_workers):
         """ Testcase Setup section """
         # ---------------------------------------
-        # Loop over devices
+        # Loop over devices, max_workers at a time
         # ---------------------------------------
-        for device in testbed:
+        ParallelDeviceFunction.run_per_device(steps, testbed, self.collect_device, max_workers)
+        # Mind Maps
+        mind_maps.build()
+        # Goodbye Banner
+        print(Panel.fit(Text.from_markup(FINISHED)))
+
+    def collect_device(self, steps, device):
+        """ Parse and store a single device """
+        parsed_system_information = None
+        parsed_chassis_hardware = None
 
-            with steps.start("Parsing show system information", continue_=True) as step:
-                try:
-                    self.parsed_system_information = device.parse("show system information")
-                except Exception as e:
-                    step.failed("Could not parse it correctly\n{e}".format(e=e))
+        with steps.start("Parsing show system information", continue_=True) as step:
+            try:
+                parsed_system_information = device.parse("show system information")
+            except Exception as e:
+                step.failed("Could not parse it correctly\n{e}".format(e=e))
 
-            with steps.start("Parsing show chassis hardware", continue_=True) as step:
-                try:
-                    self.parsed_chassis_hardware = device.parse("show chassis hardware")
-                except Exception as e:
-                    step.failed("Could not parse it correctly\n{e}".format(e=e))
+        with steps.start("Parsing show chassis hardware", continue_=True) as step:
+            try:
+                parsed_chassis_hardware = device.parse("show chassis hardware")
+            except Exception as e:
+                step.failed("Could not parse it correctly\n{e}".format(e=e))
 
-            with steps.start("Store data", continue_=True) as step:
+        with steps.start("Store data", continue_=True) as step:
 
-                # Show system information
-                if hasattr(self, "parsed_system_information"):
-                    sh_system_information_csv_template = env.get_template("show_system_information.j2")
+            # Show system information
+            if parsed_system_information is not None:
+                sh_system_information_csv_template = env.get_template("show_system_information.j2")
 
                 with open(f"Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.json", "w") as fid:
-                    json.dump(self.parsed_system_information, fid, indent=4, sort_keys=True)
+                    json.dump(parsed_system_information, fid, indent=4, sort_keys=True)
 
                 with open(f"Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.yaml", "w") as yml:
-                    yaml.dump(self.parsed_system_information, yml, allow_unicode=True)
+                    yaml.dump(parsed_system_information, yml, allow_unicode=True)
 
                 for filetype in filetype_loop:
-                    parsed_output_type = (sh_system_information_csv_template.render(variable=self.parsed_system_information["system-information"], filetype_loop_jinja2=filetype))
+                    parsed_output_type = (sh_system_information_csv_template.render(variable=parsed_system_information["system-information"], filetype_loop_jinja2=filetype))
 
                     with open(f"Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.{filetype}", "w") as fh:
                         fh.write(parsed_output_type)
 
-                os.system(f"markmap Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.md --output Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.html")
+                mind_maps.add(f"Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information.md", f"Camelot/Juniper/Show_System_Information/{device.alias}_show_system_information_mind_map.html")
 
-                # Show chassis hardware
-                if hasattr(self, "parsed_chassis_hardware"):
-                    sh_chassis_hardware_csv_template = env.get_template("show_chassis_hardware.j2")
+            # Show chassis hardware
+            if parsed_chassis_hardware is not None:
+                sh_chassis_hardware_csv_template = env.get_template("show_chassis_hardware.j2")
 
                 with open(f"Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.json", "w") as fid:
-                    json.dump(self.parsed_chassis_hardware, fid, indent=4, sort_keys=True)
+                    json.dump(parsed_chassis_hardware, fid, indent=4, sort_keys=True)
 
                 with open(f"Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.yaml", "w") as yml:
-                    yaml.dump(self.parsed_chassis_hardware, yml, allow_unicode=True)
+                    yaml.dump(parsed_chassis_hardware, yml, allow_unicode=True)
 
                 for filetype in filetype_loop:
-                    parsed_output_type = sh_chassis_hardware_csv_template.render(variable=self.parsed_chassis_hardware["chassis-inventory"]["chassis"], filetype_loop_jinja2=filetype)
+                    parsed_output_type = sh_chassis_hardware_csv_template.render(variable=parsed_chassis_hardware["chassis-inventory"]["chassis"], filetype_loop_jinja2=filetype)
 
                     with open(f"Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.{filetype}", "w") as fh:
                         fh.write(parsed_output_type)
 
-                os.system(f"markmap Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.md --output Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.html")
-
-        # Goodbye Banner
+                mind_maps.add(f"Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware.md", f"Camelot/Juniper/Show_Chassis_Hardware/{device.alias}_show_chassis_hardware_mind_map.html")
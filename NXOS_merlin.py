@@ -15,10 +15,12 @@ from rich.text import Text
 from pyats import aetest
 from pyats import topology
 from pyats.log.utils import banner
-from jinja2 import Environment, FileSystemLoader
+from template_loader import template_environment
+from mind_map import mind_maps
 from ascii_art import GREETING, LEARN, RUNNING, WRITING, FINISHED
-from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParseConfigFunction, ParseDictFunction
-from tinydb import TinyDB, Query
+from general_functionalities import ParseShowCommandFunction, ParseLearnFunction, ParseConfigFunction, ParseDictFunction, ConnectFunction, ParallelDeviceFunction, ThreadSafeTable
+from grail import open_grail
+from stage_timing import timings
 
 # ----------------
 # Get logger for script
@@ -37,16 +39,28 @@ filetype_loop = ["csv","md","html"]
 # ----------------
 
 template_dir = 'templates/cisco/nxos'
-env = Environment(loader=FileSystemLoader(template_dir))
+env = template_environment(template_dir)
 
 # ----------------
 # Create Database
 # ----------------
 
-if os.path.exists("Camelot/Cisco/NXOS/The_Grail/The_Grail_DB.json"):
-    os.remove("Camelot/Cisco/NXOS/The_Grail/The_Grail_DB.json")
+db = open_grail('Camelot/Cisco/NXOS/The_Grail/The_Grail_DB')
 
-db = TinyDB('Camelot/Cisco/NXOS/The_Grail/The_Grail_DB.json')
+# ----------------
+# Script parameters
+# ----------------
+
+parameters = {
+    # Devices collected concurrently; override with the job's --max-workers
+    'max_workers': 1,
+    # Concurrent connection attempts and the per-device connect deadline in seconds
+    'max_connections': 10,
+    'connect_timeout': 120,
+    # Per device, command and stage durations of the run (JSON, CSV and a Prometheus
+    # textfile); the job's --timing-dir
+    'timing_dir': "Camelot/Cisco/NXOS/Timing",
+}
 
 # ----------------
 # AE Test Setup
@@ -54,10 +68,23 @@ db = TinyDB('Camelot/Cisco/NXOS/The_Grail/The_Grail_DB.json')
 class common_setup(aetest.CommonSetup):
     """Common Setup section"""
     @aetest.subsection
-    def connect_to_devices(self, testbed):
+    def connect_to_devices(self, testbed, max_connections, connect_timeout):
         """Connect to all the devices"""
         print(Panel.fit(Text.from_markup(GREETING)))
-        testbed.connect(learn_hostname=True)
+        connected, unreachable = ConnectFunction.connect_devices(testbed, max_connections, connect_timeout)
+
+        # ----------------
+        # Unreachable devices are skipped, not fatal
+        # ----------------
+        if unreachable:
+            summary = "\n".join("%s: %s" % (alias, reason) for alias, reason in unreachable.items())
+            log.warning("Skipping %s unreachable device(s)\n%s" % (len(unreachable), summary))
+            print(Panel.fit(Text("Unreachable devices skipped\n\n%s" % summary)))
+
+        if not connected:
+            self.failed("Could not connect to any device")
+
+        self.parent.parameters['devices'] = connected
 
 # ----------------
 # Test Case #1
@@ -66,1696 +93,1700 @@ class Collect_Information(aetest.Testcase):
     """Parse all the commands"""
 
     @aetest.test
-    def parse(self, testbed, section, steps):
+    def parse(self, devices, section, steps, max_workers, timing_dir):
         """ Testcase Setup section """
         # ---------------------------------------
-        # Loop over devices
+        # Loop over devices, max_workers at a time
         # ---------------------------------------
-        for device in testbed:
-            # ----------------
-            # Create a table in the database
-            # ----------------
-            table = db.table(device.alias)
+        ParallelDeviceFunction.run_per_device(steps, devices, self.collect_device, max_workers)
+        # Mind Maps
+        mind_maps.build()
+        db.close()
+        # Where the run spent its time
+        if timings.write(timing_dir, "nxos"):
+            print(Panel.fit(Text("Stage timings\n\n%s" % timings)))
+        # Goodbye Banner
+        print(Panel.fit(Text.from_markup(FINISHED)))    
 
-            # ---------------------------------------
-            # Genie learn().info for various functions
-            # ---------------------------------------
-            print(Panel.fit(Text.from_markup(LEARN)))
+    def collect_device(self, steps, device):
+        """ Learn, parse and store a single device """
+        # ----------------
+        # Create a table in the database
+        # ----------------
+        table = ThreadSafeTable(db.table(device.alias))
 
-            # ACLs
-            self.learned_acl = ParseLearnFunction.parse_learn(steps, device, "acl")
+        # ---------------------------------------
+        # Genie learn().info for various functions
+        # ---------------------------------------
+        print(Panel.fit(Text.from_markup(LEARN)))
 
-            # ARP
-            self.learned_arp = ParseLearnFunction.parse_learn(steps, device, "arp")
+        # ACLs
+        learned_acl = ParseLearnFunction.parse_learn(steps, device, "acl")
 
-            # BGP
-            self.learned_bgp = ParseLearnFunction.parse_learn(steps, device, "bgp")            
+        # ARP
+        learned_arp = ParseLearnFunction.parse_learn(steps, device, "arp")
 
-            # Config
-            self.learned_config = ParseConfigFunction.parse_learn(steps, device, "config")
+        # BGP
+        learned_bgp = ParseLearnFunction.parse_learn(steps, device, "bgp")            
 
-            # HSRP
-            self.learned_hsrp = ParseLearnFunction.parse_learn(steps, device, "hsrp")
+        # Config
+        learned_config = ParseConfigFunction.parse_learn(steps, device, "config")
 
-            # Interface
-            self.learned_interface = ParseLearnFunction.parse_learn(steps, device, "interface")
+        # HSRP
+        learned_hsrp = ParseLearnFunction.parse_learn(steps, device, "hsrp")
 
-            # OSPF
-            self.learned_ospf = ParseLearnFunction.parse_learn(steps, device, "ospf")
+        # Interface
+        learned_interface = ParseLearnFunction.parse_learn(steps, device, "interface")
 
-            # Platform
-            self.learned_platform = ParseDictFunction.parse_learn(steps, device, "platform")   
+        # OSPF
+        learned_ospf = ParseLearnFunction.parse_learn(steps, device, "ospf")
 
-            # Routing
-            self.learned_routing = ParseLearnFunction.parse_learn(steps, device, "routing")
+        # Platform
+        learned_platform = ParseDictFunction.parse_learn(steps, device, "platform")   
 
-            # VLAN
-            self.learned_vlan = ParseLearnFunction.parse_learn(steps, device, "vlan")
+        # Routing
+        learned_routing = ParseLearnFunction.parse_learn(steps, device, "routing")
 
-            # VRF
-            self.learned_vrf = ParseLearnFunction.parse_learn(steps, device, "vrf")   
+        # VLAN
+        learned_vlan = ParseLearnFunction.parse_learn(steps, device, "vlan")
 
-            # ---------------------------------------
-            # Execute parser for various show commands
-            # ---------------------------------------
-            print(Panel.fit(Text.from_markup(RUNNING)))
+        # VRF
+        learned_vrf = ParseLearnFunction.parse_learn(steps, device, "vrf")   
 
-            # Show Access-Lists
-            self.parsed_show_access_lists = ParseShowCommandFunction.parse_show_command(steps, device, "show access-lists")
+        # ---------------------------------------
+        # Execute parser for various show commands
+        # ---------------------------------------
+        print(Panel.fit(Text.from_markup(RUNNING)))
 
-            # show BGP Process VRF All
-            self.parsed_show_bgp_process_vrf_all = ParseShowCommandFunction.parse_show_command(steps, device, "show bgp process vrf all")
+        # Show Access-Lists
+        parsed_show_access_lists = ParseShowCommandFunction.parse_show_command(steps, device, "show access-lists")
 
-            # Show BGP Sessions
-            self.parsed_show_bgp_sessions = ParseShowCommandFunction.parse_show_command(steps, device, "show bgp sessions")
+        # show BGP Process VRF All
+        parsed_show_bgp_process_vrf_all = ParseShowCommandFunction.parse_show_command(steps, device, "show bgp process vrf all")
 
-            # Show CDP Neighbors
-            if device.platform == 'n9k':
-                self.parsed_show_cdp_neighbors = ParseShowCommandFunction.parse_show_command(steps, device, "show cdp neighbors")
+        # Show BGP Sessions
+        parsed_show_bgp_sessions = ParseShowCommandFunction.parse_show_command(steps, device, "show bgp sessions")
 
-            # Show CDP Neighbors Detail           
-            self.parsed_show_cdp_neighbors_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show cdp neighbors detail")
+        # Show CDP Neighbors
+        if device.platform == 'n9k':
+            parsed_show_cdp_neighbors = ParseShowCommandFunction.parse_show_command(steps, device, "show cdp neighbors")
 
-            # Show Enviroment
-            if device.platform != "n7k":
-                self.parsed_show_environment = ParseShowCommandFunction.parse_show_command(steps, device, "show environment")
+        # Show CDP Neighbors Detail           
+        parsed_show_cdp_neighbors_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show cdp neighbors detail")
 
-            # Show Interface
-            if device.platform != "n5k":
-                self.parsed_show_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show interface")
+        # Show Enviroment
+        if device.platform != "n7k":
+            parsed_show_environment = ParseShowCommandFunction.parse_show_command(steps, device, "show environment")
 
-            # Show Interface Status
-            self.parsed_show_interface_status = ParseShowCommandFunction.parse_show_command(steps, device, "show interface status")
+        # Show Interface
+        if device.platform != "n5k":
+            parsed_show_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show interface")
 
-            # Show Interface Transceiver
-            self.parsed_show_interface_transceiver = ParseShowCommandFunction.parse_show_command(steps, device, "show interface transceiver")
+        # Show Interface Status
+        parsed_show_interface_status = ParseShowCommandFunction.parse_show_command(steps, device, "show interface status")
 
-            # Show Inventory
-            self.parsed_show_inventory = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
+        # Show Interface Transceiver
+        parsed_show_interface_transceiver = ParseShowCommandFunction.parse_show_command(steps, device, "show interface transceiver")
 
-            # Show IP Interface Brief
-            self.parsed_show_ip_interface_brief = ParseShowCommandFunction.parse_show_command(steps, device, "show ip interface brief vrf all")
+        # Show Inventory
+        parsed_show_inventory = ParseShowCommandFunction.parse_show_command(steps, device, "show inventory")
 
-            # Show IP OSPF
-            self.parsed_show_ip_ospf = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf")
+        # Show IP Interface Brief
+        parsed_show_ip_interface_brief = ParseShowCommandFunction.parse_show_command(steps, device, "show ip interface brief vrf all")
 
-            # Show IP OSPF Interface
-            self.parsed_show_ip_ospf_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf interface")
+        # Show IP OSPF
+        parsed_show_ip_ospf = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf")
 
-            # Show IP OSPF Neighbor Detail
-            self.parsed_show_ip_ospf_neighbor_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf neighbors detail")
+        # Show IP OSPF Interface
+        parsed_show_ip_ospf_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf interface")
 
-            # Show IP Route
-            self.parsed_show_ip_route = ParseShowCommandFunction.parse_show_command(steps, device, "show ip route")
-
-            # Show MAC Address-Table
-            self.parsed_show_mac_address_table = ParseShowCommandFunction.parse_show_command(steps, device, "show mac address-table")
-
-            # Show Portchannel Summary
-            self.parsed_show_port_channel_summary = ParseShowCommandFunction.parse_show_command(steps, device, "show port-channel summary")
-
-            # Show Version
-            self.parsed_show_version = ParseShowCommandFunction.parse_show_command(steps, device, "show version")
-            
-            # Show VLAN
-            self.parsed_show_vlan = ParseShowCommandFunction.parse_show_command(steps, device, "show vlan")
-
-            # Show VRF
-            self.parsed_show_vrf = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf")
-
-            # Show VRF All detail
-            self.parsed_show_vrf_all_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf all detail")
-
-            # show vrf All interface
-            self.parsed_show_vrf_all_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf all interface")            
-            # ---------------------------------------
-            # Create JSON, YAML, CSV, MD, HTML, HTML Mind Map files from the Parsed Data
-            # ---------------------------------------         
-            
-            with steps.start('Store data',continue_=True) as step:
-                print(Panel.fit(Text.from_markup(WRITING)))
-                ###############################
-                # Genie learn().info section
-                ###############################
-
-                # Learned ACL
-                if self.learned_acl is not None:
-                    learned_acl_template = env.get_template('learned_acl.j2')
-                    learned_acl_netjson_json_template = env.get_template('learned_acl_netjson_json.j2')
-                    learned_acl_netjson_html_template = env.get_template('learned_acl_netjson_html.j2')
-                    directory_names = "Learned_ACL"
-                    file_names = "learned_acl" 
-
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_acl)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_acl)
+        # Show IP OSPF Neighbor Detail
+        parsed_show_ip_ospf_neighbor_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show ip ospf neighbors detail")
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_acl_template.render(to_parse_access_list=self.learned_acl['acls'],filetype_loop_jinja2=filetype)
+        # Show IP Route
+        parsed_show_ip_route = ParseShowCommandFunction.parse_show_command(steps, device, "show ip route")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl.md --output Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_mind_map.html" % (device.alias,device.alias))
+        # Show MAC Address-Table
+        parsed_show_mac_address_table = ParseShowCommandFunction.parse_show_command(steps, device, "show mac address-table")
 
-                    parsed_output_netjson_json = learned_acl_netjson_json_template.render(to_parse_access_list=self.learned_acl['acls'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_acl_netjson_html_template.render(device_alias = device.alias)
+        # Show Portchannel Summary
+        parsed_show_port_channel_summary = ParseShowCommandFunction.parse_show_command(steps, device, "show port-channel summary")
 
-                    with open("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
-                        fh.close()
+        # Show Version
+        parsed_show_version = ParseShowCommandFunction.parse_show_command(steps, device, "show version")
+        
+        # Show VLAN
+        parsed_show_vlan = ParseShowCommandFunction.parse_show_command(steps, device, "show vlan")
 
-                    with open("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+        # Show VRF
+        parsed_show_vrf = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf")
+
+        # Show VRF All detail
+        parsed_show_vrf_all_detail = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf all detail")
+
+        # show vrf All interface
+        parsed_show_vrf_all_interface = ParseShowCommandFunction.parse_show_command(steps, device, "show vrf all interface")            
+        # ---------------------------------------
+        # Create JSON, YAML, CSV, MD, HTML, HTML Mind Map files from the Parsed Data
+        # ---------------------------------------         
+        
+        with steps.start('Store data',continue_=True) as step:
+            print(Panel.fit(Text.from_markup(WRITING)))
+            ###############################
+            # Genie learn().info section
+            ###############################
+
+            # Learned ACL
+            if learned_acl is not None:
+                learned_acl_template = env.get_template('learned_acl.j2')
+                learned_acl_netjson_json_template = env.get_template('learned_acl_netjson_json.j2')
+                learned_acl_netjson_html_template = env.get_template('learned_acl_netjson_html.j2')
+                directory_names = "Learned_ACL"
+                file_names = "learned_acl" 
+
+                self.save_to_json_file(device, directory_names, file_names, learned_acl)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_acl)
+
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_acl_template.render(to_parse_access_list=learned_acl['acls'],filetype_loop_jinja2=filetype)
+
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl.md" % device.alias, "Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_mind_map.html" % device.alias)
+
+                parsed_output_netjson_json = learned_acl_netjson_json_template.render(to_parse_access_list=learned_acl['acls'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_acl_netjson_html_template.render(device_alias = device.alias)
+
+                with open("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
+                    fh.close()
+
+                with open("Camelot/Cisco/NXOS/Learned_ACL/%s_learned_acl_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
+
+                # ----------------
+                # Store ACLs in Device Table in Database
+                # ----------------
+
+                table.insert(learned_acl, "learned_acl")
+
+            # Learned ARP
+            if learned_arp is not None:
+                learned_arp_template = env.get_template('learned_arp.j2')
+                learned_arp_statistics_template = env.get_template('learned_arp_statistics.j2')
+                learned_arp_netjson_json_template = env.get_template('learned_arp_netjson_json.j2')
+                learned_arp_netjson_html_template = env.get_template('learned_arp_netjson_html.j2')
+                learned_arp_statistics_netjson_json_template = env.get_template('learned_arp_statistics_netjson_json.j2')
+                learned_arp_statistics_netjson_html_template = env.get_template('learned_arp_statistics_netjson_html.j2')
+                directory_names = "Learned_ARP"
+                file_names = "learned_arp" 
+
+                self.save_to_json_file(device, directory_names, file_names, learned_arp)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_arp)  
+
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_arp_template.render(to_parse_arp=learned_arp['interfaces'],filetype_loop_jinja2=filetype)
+
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_arp_statistics_template.render(to_parse_arp=learned_arp['statistics'],filetype_loop_jinja2=filetype)
+
+                    with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics.%s" % (device.alias,filetype), "w") as fh:
+                        fh.write(parsed_output_type) 
                         fh.close()
 
-                    # ----------------
-                    # Store ACLs in Device Table in Database
-                    # ----------------
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md" % device.alias, "Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_mind_map.html" % device.alias)
 
-                    table.insert(self.learned_acl)
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics.md" % device.alias, "Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % device.alias)
 
-                # Learned ARP
-                if self.learned_arp is not None:
-                    learned_arp_template = env.get_template('learned_arp.j2')
-                    learned_arp_statistics_template = env.get_template('learned_arp_statistics.j2')
-                    learned_arp_netjson_json_template = env.get_template('learned_arp_netjson_json.j2')
-                    learned_arp_netjson_html_template = env.get_template('learned_arp_netjson_html.j2')
-                    learned_arp_statistics_netjson_json_template = env.get_template('learned_arp_statistics_netjson_json.j2')
-                    learned_arp_statistics_netjson_html_template = env.get_template('learned_arp_statistics_netjson_html.j2')
-                    directory_names = "Learned_ARP"
-                    file_names = "learned_arp" 
+                parsed_output_netjson_json = learned_arp_netjson_json_template.render(to_parse_arp=learned_arp['interfaces'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_arp_netjson_html_template.render(device_alias = device.alias)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_arp)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_arp)  
+                with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
+                    fh.close()
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_arp_template.render(to_parse_arp=self.learned_arp['interfaces'],filetype_loop_jinja2=filetype)
+                with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                parsed_output_netjson_json = learned_arp_statistics_netjson_json_template.render(to_parse_arp=learned_arp['statistics'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_arp_statistics_netjson_html_template.render(device_alias = device.alias)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_arp_statistics_template.render(to_parse_arp=self.learned_arp['statistics'],filetype_loop_jinja2=filetype)
+                with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()
 
-                        with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics.%s" % (device.alias,filetype), "w") as fh:
-                            fh.write(parsed_output_type) 
-                            fh.close()
+                with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md --output Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_mind_map.html" % (device.alias,device.alias))
+                # ----------------
+                # Store ARP in Device Table in Database
+                # ----------------
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics.md --output Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_mind_map.html" % (device.alias,device.alias))
+                table.insert(learned_arp, "learned_arp")
 
-                    parsed_output_netjson_json = learned_arp_netjson_json_template.render(to_parse_arp=self.learned_arp['interfaces'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_arp_netjson_html_template.render(device_alias = device.alias)
+            # Learned BGP
+            if 'instance' in learned_bgp:
+                learned_bgp_template = env.get_template('learned_bgp.j2')
+                learned_bgp_netjson_json_template = env.get_template('learned_bgp_netjson_json.j2')
+                learned_bgp_netjson_html_template = env.get_template('learned_bgp_netjson_html.j2')
+                directory_names = "Learned_BGP"
+                file_names = "learned_bgp"
 
-                    with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
-                        fh.close()
+                self.save_to_json_file(device, directory_names, file_names, learned_bgp)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_bgp)
 
-                    with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_bgp_template.render(to_parse_bgp=learned_bgp['instance'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = learned_arp_statistics_netjson_json_template.render(to_parse_arp=self.learned_arp['statistics'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_arp_statistics_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp.md" % device.alias, "Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()
+                parsed_output_netjson_json = learned_bgp_netjson_json_template.render(to_parse_bgp=learned_bgp['instance'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_bgp_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_ARP/%s_learned_arp_statistics_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                with open("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    # ----------------
-                    # Store ARP in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+
+                # ----------------
+                # Store BGP in Device Table in Database
+                # ----------------
+
+                table.insert(learned_bgp, "learned_bgp")
+
+            # Learned Config
+            if learned_bgp is not None:
+                directory_names = "Learned_Config"
+                file_names = "learned_config"
+
+                self.save_to_json_file(device, directory_names, file_names, learned_config)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_config)
+
+                # ----------------
+                # Store Config in Device Table in Database
+                # ----------------
+
+                table.insert(learned_config, "learned_config")
+
+            # Learned HSRP
+            if learned_hsrp is not None:
+                learned_hsrp_template = env.get_template('learned_hsrp.j2')
+                learned_hsrp_netjson_json_template = env.get_template('learned_hsrp_netjson_json.j2')
+                learned_hsrp_netjson_html_template = env.get_template('learned_hsrp_netjson_html.j2')
+                directory_names = "Learned_HSRP"
+                file_names = "learned_hsrp"
+
+                self.save_to_json_file(device, directory_names, file_names, learned_hsrp)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_hsrp)
+
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_hsrp_template.render(to_parse_hsrp=learned_hsrp,filetype_loop_jinja2=filetype)
+
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp.md" % device.alias, "Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_mind_map.html" % device.alias)
+
+                parsed_output_netjson_json = learned_hsrp_netjson_json_template.render(to_parse_hsrp=learned_hsrp,device_alias = device.alias)
+                parsed_output_netjson_html = learned_hsrp_netjson_html_template.render(device_alias = device.alias)
 
-                    table.insert(self.learned_arp)
+                with open("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                # Learned BGP
-                if 'instance' in self.learned_bgp:
-                    learned_bgp_template = env.get_template('learned_bgp.j2')
-                    learned_bgp_netjson_json_template = env.get_template('learned_bgp_netjson_json.j2')
-                    learned_bgp_netjson_html_template = env.get_template('learned_bgp_netjson_html.j2')
-                    directory_names = "Learned_BGP"
-                    file_names = "learned_bgp"
+                with open("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_bgp)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_bgp)
+                # ----------------
+                # Store HSRP in Device Table in Database
+                # ----------------
+
+                table.insert(learned_hsrp, "learned_hsrp")
+
+            # Learned Interface
+            if device.platform != "n5k":
+                if learned_interface is not None:
+                    learned_interface_template = env.get_template('learned_interface.j2')
+                    learned_interface_netjson_json_template = env.get_template('learned_interface_netjson_json.j2')
+                    learned_interface_netjson_html_template = env.get_template('learned_interface_netjson_html.j2')
+                    learned_interface_enable_netjson_json_template = env.get_template('learned_interface_enabled_netjson_json.j2')
+                    learned_interface_enable_netjson_html_template = env.get_template('learned_interface_enabled_netjson_html.j2')
+                    directory_names = "Learned_Interface"
+                    file_names = "learned_interface" 
+
+                    self.save_to_json_file(device, directory_names, file_names, learned_interface)
+                    self.save_to_yaml_file(device, directory_names, file_names, learned_interface)
 
                     for filetype in filetype_loop:
-                        parsed_output_type = learned_bgp_template.render(to_parse_bgp=self.learned_bgp['instance'],filetype_loop_jinja2=filetype)
+                        parsed_output_type = learned_interface_template.render(to_parse_interface=learned_interface,filetype_loop_jinja2=filetype)
 
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp.md --output Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_mind_map.html" % (device.alias,device.alias))
+                
+                    if os.path.exists("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias):
+                        mind_maps.add("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias, "Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_mind_map.html" % device.alias)
 
-                    parsed_output_netjson_json = learned_bgp_netjson_json_template.render(to_parse_bgp=self.learned_bgp['instance'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_bgp_netjson_html_template.render(device_alias = device.alias)
+                    parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=learned_interface,device_alias = device.alias)
+                    parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.json" % device.alias, "w") as fh:
+                        fh.write(parsed_output_netjson_json)
+                        fh.close()               
 
-                    with open("Camelot/Cisco/NXOS/Learned_BGP/%s_learned_bgp_netgraph.html" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.html" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_html)
+                        fh.close()
 
-                    # ----------------
-                    # Store BGP in Device Table in Database
-                    # ----------------
-
-                    table.insert(self.learned_bgp)
+                    parsed_output_netjson_json = learned_interface_enable_netjson_json_template.render(to_parse_interface=learned_interface,device_alias = device.alias)
+                    parsed_output_netjson_html = learned_interface_enable_netjson_html_template.render(device_alias = device.alias)
 
-                # Learned Config
-                if self.learned_bgp is not None:
-                    directory_names = "Learned_Config"
-                    file_names = "learned_config"
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_enabled_netgraph.json" % device.alias, "w") as fh:
+                        fh.write(parsed_output_netjson_json)
+                        fh.close()               
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_config)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_config)
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_enabled_netgraph.html" % device.alias, "w") as fh:
+                        fh.write(parsed_output_netjson_html)
+                        fh.close()
 
                     # ----------------
-                    # Store Config in Device Table in Database
+                    # Store Interface in Device Table in Database
                     # ----------------
 
-                    table.insert(self.learned_config)
-
-                # Learned HSRP
-                if self.learned_hsrp is not None:
-                    learned_hsrp_template = env.get_template('learned_hsrp.j2')
-                    learned_hsrp_netjson_json_template = env.get_template('learned_hsrp_netjson_json.j2')
-                    learned_hsrp_netjson_html_template = env.get_template('learned_hsrp_netjson_html.j2')
-                    directory_names = "Learned_HSRP"
-                    file_names = "learned_hsrp"
+                    table.insert(learned_interface, "learned_interface")
+            else:
+                    learned_interface_template = env.get_template('learned_interface_5k.j2')
+                    learned_interface_netjson_json_template = env.get_template('learned_interface_5k_netjson_json.j2')
+                    learned_interface_netjson_html_template = env.get_template('learned_interface_5k_netjson_html.j2')                     
+                    directory_names = "Learned_Interface"
+                    file_names = "learned_interface" 
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_hsrp)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_hsrp)
+                    self.save_to_json_file(device, directory_names, file_names, learned_interface)
+                    self.save_to_yaml_file(device, directory_names, file_names, learned_interface)
 
                     for filetype in filetype_loop:
-                        parsed_output_type = learned_hsrp_template.render(to_parse_hsrp=self.learned_hsrp,filetype_loop_jinja2=filetype)
+                        parsed_output_type = learned_interface_template.render(to_parse_interface=learned_interface,filetype_loop_jinja2=filetype)
 
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp.md --output Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_mind_map.html" % (device.alias,device.alias))
+                
+                    if os.path.exists("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias):
+                        mind_maps.add("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias, "Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_mind_map.html" % device.alias)
 
-                    parsed_output_netjson_json = learned_hsrp_netjson_json_template.render(to_parse_hsrp=self.learned_hsrp,device_alias = device.alias)
-                    parsed_output_netjson_html = learned_hsrp_netjson_html_template.render(device_alias = device.alias)
+                    parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=learned_interface,device_alias = device.alias)
+                    parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.json" % device.alias, "w") as fh:
+                        fh.write(parsed_output_netjson_json)
+                        fh.close()               
 
-                    with open("Camelot/Cisco/NXOS/Learned_HSRP/%s_learned_hsrp_netgraph.html" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.html" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_html)
+                        fh.close()
 
                     # ----------------
-                    # Store HSRP in Device Table in Database
+                    # Store Interface in Device Table in Database
                     # ----------------
 
-                    table.insert(self.learned_hsrp)
+                    table.insert(learned_interface, "learned_interface")
 
-                # Learned Interface
-                if device.platform != "n5k":
-                    if self.learned_interface is not None:
-                        learned_interface_template = env.get_template('learned_interface.j2')
-                        learned_interface_netjson_json_template = env.get_template('learned_interface_netjson_json.j2')
-                        learned_interface_netjson_html_template = env.get_template('learned_interface_netjson_html.j2')
-                        learned_interface_enable_netjson_json_template = env.get_template('learned_interface_enabled_netjson_json.j2')
-                        learned_interface_enable_netjson_html_template = env.get_template('learned_interface_enabled_netjson_html.j2')
-                        directory_names = "Learned_Interface"
-                        file_names = "learned_interface" 
+            # Learned OSPF
+            if learned_ospf['feature_ospf']:
+                learned_ospf_template = env.get_template('learned_ospf.j2')
+                learned_ospf_netjson_json_template = env.get_template('learned_ospf_netjson_json.j2')
+                learned_ospf_netjson_html_template = env.get_template('learned_ospf_netjson_html.j2')
+                directory_names = "Learned_OSPF"
+                file_names = "learned_ospf" 
 
-                        self.save_to_json_file(device, directory_names, file_names, self.learned_interface)
-                        self.save_to_yaml_file(device, directory_names, file_names, self.learned_interface)
+                self.save_to_json_file(device, directory_names, file_names, learned_ospf)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_ospf)  
 
-                        for filetype in filetype_loop:
-                            parsed_output_type = learned_interface_template.render(to_parse_interface=self.learned_interface,filetype_loop_jinja2=filetype)
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_ospf_template.render(to_parse_ospf=learned_ospf,filetype_loop_jinja2=filetype)
 
-                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                        if os.path.exists("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md --output Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_mind_map.html" % (device.alias,device.alias))
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf.md" % device.alias, "Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_mind_map.html" % device.alias)
 
-                        parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=self.learned_interface,device_alias = device.alias)
-                        parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
+                parsed_output_netjson_json = learned_ospf_netjson_json_template.render(to_parse_ospf=learned_ospf,device_alias = device.alias)
+                parsed_output_netjson_html = learned_ospf_netjson_html_template.render(device_alias = device.alias)
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.json" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_json)
-                            fh.close()               
+                with open("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()              
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.html" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_html)
-                            fh.close()
+                with open("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                        parsed_output_netjson_json = learned_interface_enable_netjson_json_template.render(to_parse_interface=self.learned_interface,device_alias = device.alias)
-                        parsed_output_netjson_html = learned_interface_enable_netjson_html_template.render(device_alias = device.alias)
+                # ----------------
+                # Store OSPF in Device Table in Database
+                # ----------------
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_enabled_netgraph.json" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_json)
-                            fh.close()               
+                table.insert(learned_ospf, "learned_ospf")
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_enabled_netgraph.html" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_html)
-                            fh.close()
+            # Learned Platform
+            if learned_platform is not None:
+                learned_platform_template = env.get_template('learned_platform.j2')
+                learned_platform_netjson_json_template = env.get_template('learned_platform_netjson_json.j2')
+                learned_platform_netjson_html_template = env.get_template('learned_platform_netjson_html.j2')
+                directory_names = "Learned_Platform"
+                file_names = "learned_platform"
 
-                        # ----------------
-                        # Store Interface in Device Table in Database
-                        # ----------------
+                self.save_to_json_file(device, directory_names, file_names, learned_platform)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_platform)            
 
-                        table.insert(self.learned_interface)
-                else:
-                        learned_interface_template = env.get_template('learned_interface_5k.j2')
-                        learned_interface_netjson_json_template = env.get_template('learned_interface_5k_netjson_json.j2')
-                        learned_interface_netjson_html_template = env.get_template('learned_interface_5k_netjson_html.j2')                     
-                        directory_names = "Learned_Interface"
-                        file_names = "learned_interface" 
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_platform_template.render(to_parse_platform=learned_platform,filetype_loop_jinja2=filetype)
 
-                        self.save_to_json_file(device, directory_names, file_names, self.learned_interface)
-                        self.save_to_yaml_file(device, directory_names, file_names, self.learned_interface)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform.md" % device.alias, "Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_mind_map.html" % device.alias)
 
-                        for filetype in filetype_loop:
-                            parsed_output_type = learned_interface_template.render(to_parse_interface=self.learned_interface,filetype_loop_jinja2=filetype)
+                parsed_output_netjson_json = learned_platform_netjson_json_template.render(to_parse_platform=learned_platform,device_alias = device.alias)
+                parsed_output_netjson_html = learned_platform_netjson_html_template.render(device_alias = device.alias)
 
-                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                        if os.path.exists("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface.md --output Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_mind_map.html" % (device.alias,device.alias))
+                with open("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                        parsed_output_netjson_json = learned_interface_netjson_json_template.render(to_parse_interface=self.learned_interface,device_alias = device.alias)
-                        parsed_output_netjson_html = learned_interface_netjson_html_template.render(device_alias = device.alias)
+                with open("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.json" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_json)
-                            fh.close()               
+                # ----------------
+                # Store Platform in Device Table in Database
+                # ----------------
 
-                        with open("Camelot/Cisco/NXOS/Learned_Interface/%s_learned_interface_netgraph.html" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_html)
-                            fh.close()
+                table.insert(learned_platform, "learned_platform")
 
-                        # ----------------
-                        # Store Interface in Device Table in Database
-                        # ----------------
+            # Learned Routing
+            if learned_routing is not None:
+                learned_routing_template = env.get_template('learned_routing.j2')
+                learned_routing_netjson_json_template = env.get_template('learned_routing_netjson_json.j2')
+                learned_routing_netjson_html_template = env.get_template('learned_routing_netjson_html.j2')
+                directory_names = "Learned_Routing"
+                file_names = "learned_routing" 
 
-                        table.insert(self.learned_interface)
+                self.save_to_json_file(device, directory_names, file_names, learned_routing)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_routing)                
 
-                # Learned OSPF
-                if self.learned_ospf['feature_ospf']:
-                    learned_ospf_template = env.get_template('learned_ospf.j2')
-                    learned_ospf_netjson_json_template = env.get_template('learned_ospf_netjson_json.j2')
-                    learned_ospf_netjson_html_template = env.get_template('learned_ospf_netjson_html.j2')
-                    directory_names = "Learned_OSPF"
-                    file_names = "learned_ospf" 
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_routing_template.render(to_parse_routing=learned_routing['vrf'],filetype_loop_jinja2=filetype)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_ospf)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_ospf)  
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing.md" % device.alias, "Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_mind_map.html" % device.alias)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_ospf_template.render(to_parse_ospf=self.learned_ospf,filetype_loop_jinja2=filetype)
+                parsed_output_netjson_json = learned_routing_netjson_json_template.render(to_parse_routing=learned_routing['vrf'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_routing_netjson_html_template.render(device_alias = device.alias)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf.md --output Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_mind_map.html" % (device.alias,device.alias))
+                with open("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()             
 
-                    parsed_output_netjson_json = learned_ospf_netjson_json_template.render(to_parse_ospf=self.learned_ospf,device_alias = device.alias)
-                    parsed_output_netjson_html = learned_ospf_netjson_html_template.render(device_alias = device.alias)
+                with open("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                    with open("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()              
+                # ----------------
+                # Store Routing in Device Table in Database
+                # ----------------
 
-                    with open("Camelot/Cisco/NXOS/Learned_OSPF/%s_learned_ospf_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                table.insert(learned_routing, "learned_routing")
 
-                    # ----------------
-                    # Store OSPF in Device Table in Database
-                    # ----------------
+            # Learned VLAN
+            if learned_vlan is not None:
+                learned_vlan_template = env.get_template('learned_vlan.j2')
+                learned_vlan_netjson_json_template = env.get_template('learned_vlan_netjson_json.j2')
+                learned_vlan_netjson_html_template = env.get_template('learned_vlan_netjson_html.j2')
+                directory_names = "Learned_VLAN"
+                file_names = "learned_vlan" 
 
-                    table.insert(self.learned_ospf)
+                self.save_to_json_file(device, directory_names, file_names, learned_vlan)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_vlan)                
 
-                # Learned Platform
-                if self.learned_platform is not None:
-                    learned_platform_template = env.get_template('learned_platform.j2')
-                    learned_platform_netjson_json_template = env.get_template('learned_platform_netjson_json.j2')
-                    learned_platform_netjson_html_template = env.get_template('learned_platform_netjson_html.j2')
-                    directory_names = "Learned_Platform"
-                    file_names = "learned_platform"
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_vlan_template.render(to_parse_vlan=learned_vlan['vlans'],filetype_loop_jinja2=filetype)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_platform)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_platform)            
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan.md" % device.alias, "Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_mind_map.html" % device.alias)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_platform_template.render(to_parse_platform=self.learned_platform,filetype_loop_jinja2=filetype)
+                parsed_output_netjson_json = learned_vlan_netjson_json_template.render(to_parse_vlan=learned_vlan['vlans'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_vlan_netjson_html_template.render(device_alias = device.alias)
+
+                with open("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
+
+                with open("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
+
+                # ----------------
+                # Store VLAN in Device Table in Database
+                # ----------------
+
+                table.insert(learned_vlan, "learned_vlan")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform.md --output Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_mind_map.html" % (device.alias,device.alias))
+            # Learned VRF
+            if learned_vrf is not None:
+                learned_vrf_template = env.get_template('learned_vrf.j2')
+                learned_vrf_netjson_json_template = env.get_template('learned_vrf_netjson_json.j2')
+                learned_vrf_netjson_html_template = env.get_template('learned_vrf_netjson_html.j2')
+                directory_names = "Learned_VRF"
+                file_names = "learned_vrf"
 
-                    parsed_output_netjson_json = learned_platform_netjson_json_template.render(to_parse_platform=self.learned_platform,device_alias = device.alias)
-                    parsed_output_netjson_html = learned_platform_netjson_html_template.render(device_alias = device.alias)
+                self.save_to_json_file(device, directory_names, file_names, learned_vrf)
+                self.save_to_yaml_file(device, directory_names, file_names, learned_vrf)
 
-                    with open("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                for filetype in filetype_loop:
+                    parsed_output_type = learned_vrf_template.render(to_parse_vrf=learned_vrf['vrfs'],filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Learned_Platform/%s_learned_platform_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf.md" % device.alias, "Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_mind_map.html" % device.alias)
 
-                    # ----------------
-                    # Store Platform in Device Table in Database
-                    # ----------------
+                parsed_output_netjson_json = learned_vrf_netjson_json_template.render(to_parse_vrf=learned_vrf['vrfs'],device_alias = device.alias)
+                parsed_output_netjson_html = learned_vrf_netjson_html_template.render(device_alias = device.alias)
 
-                    table.insert(self.learned_platform)
+                with open("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                # Learned Routing
-                if self.learned_routing is not None:
-                    learned_routing_template = env.get_template('learned_routing.j2')
-                    learned_routing_netjson_json_template = env.get_template('learned_routing_netjson_json.j2')
-                    learned_routing_netjson_html_template = env.get_template('learned_routing_netjson_html.j2')
-                    directory_names = "Learned_Routing"
-                    file_names = "learned_routing" 
+                with open("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_routing)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_routing)                
+                # ----------------
+                # Store VRF in Device Table in Database
+                # ----------------
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_routing_template.render(to_parse_routing=self.learned_routing['vrf'],filetype_loop_jinja2=filetype)
+                table.insert(learned_vrf, "learned_vrf")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing.md --output Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_mind_map.html" % (device.alias,device.alias))
+            ###############################
+            # Genie Show Command Section
+            ###############################
 
-                    parsed_output_netjson_json = learned_routing_netjson_json_template.render(to_parse_routing=self.learned_routing['vrf'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_routing_netjson_html_template.render(device_alias = device.alias)
+            # Show access-lists
+            if parsed_show_access_lists is not None:
+                sh_access_lists_template = env.get_template('show_access_lists.j2')
+                sh_access_lists_netjson_json_template = env.get_template('show_access_lists_netjson_json.j2')
+                sh_access_lists_netjson_html_template = env.get_template('show_access_lists_netjson_html.j2')
+                directory_names = "Show_Access_Lists"
+                file_names = "show_access_lists"
 
-                    with open("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()             
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_access_lists)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_access_lists)
 
-                    with open("Camelot/Cisco/NXOS/Learned_Routing/%s_learned_routing_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_access_lists_template.render(to_parse_access_list=parsed_show_access_lists,filetype_loop_jinja2=filetype)
 
-                    # ----------------
-                    # Store Routing in Device Table in Database
-                    # ----------------
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists.md" % device.alias, "Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_mind_map.html" % device.alias)
 
-                    table.insert(self.learned_routing)
+                parsed_output_netjson_json = sh_access_lists_netjson_json_template.render(to_parse_access_list=parsed_show_access_lists,device_alias = device.alias)
+                parsed_output_netjson_html = sh_access_lists_netjson_html_template.render(device_alias = device.alias)
 
-                # Learned VLAN
-                if self.learned_vlan is not None:
-                    learned_vlan_template = env.get_template('learned_vlan.j2')
-                    learned_vlan_netjson_json_template = env.get_template('learned_vlan_netjson_json.j2')
-                    learned_vlan_netjson_html_template = env.get_template('learned_vlan_netjson_html.j2')
-                    directory_names = "Learned_VLAN"
-                    file_names = "learned_vlan" 
+                with open("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_vlan)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_vlan)                
+                with open("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_vlan_template.render(to_parse_vlan=self.learned_vlan['vlans'],filetype_loop_jinja2=filetype)
+                # ----------------
+                # Store ACLs in Device Table in Database
+                # ----------------
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan.md --output Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_mind_map.html" % (device.alias,device.alias))
+                table.insert(parsed_show_access_lists, "parsed_show_access_lists")
 
-                    parsed_output_netjson_json = learned_vlan_netjson_json_template.render(to_parse_vlan=self.learned_vlan['vlans'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_vlan_netjson_html_template.render(device_alias = device.alias)
+            # Show BGP process vrf all
+            if parsed_show_bgp_process_vrf_all is not None:
+                sh_bgp_process_vrf_all_template = env.get_template('show_bgp_process_vrf_all.j2')                  
+                sh_bgp_process_vrf_all_netjson_json_template = env.get_template('show_bgp_process_vrf_all_netjson_json.j2')
+                sh_bgp_process_vrf_all_netjson_html_template = env.get_template('show_bgp_process_vrf_all_netjson_html.j2')
+                
+                directory_names = "Show_BGP_Process_VRF_All"
+                file_names = "show_bgp_process_vfr_all"
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_bgp_process_vrf_all)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_bgp_process_vrf_all)
+                
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_bgp_process_vrf_all_template.render(to_parse_bgp=parsed_show_bgp_process_vrf_all,filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md" % device.alias, "Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_VLAN/%s_learned_vlan_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                parsed_output_netjson_json = sh_bgp_process_vrf_all_netjson_json_template.render(to_parse_bgp=parsed_show_bgp_process_vrf_all,device_alias = device.alias)
+                parsed_output_netjson_html = sh_bgp_process_vrf_all_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store VLAN in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    table.insert(self.learned_vlan)
+                with open("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                # Learned VRF
-                if self.learned_vrf is not None:
-                    learned_vrf_template = env.get_template('learned_vrf.j2')
-                    learned_vrf_netjson_json_template = env.get_template('learned_vrf_netjson_json.j2')
-                    learned_vrf_netjson_html_template = env.get_template('learned_vrf_netjson_html.j2')
-                    directory_names = "Learned_VRF"
-                    file_names = "learned_vrf"
+                # ----------------
+                # Store BGP Process VRF All in Device Table in Database
+                # ----------------
 
-                    self.save_to_json_file(device, directory_names, file_names, self.learned_vrf)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.learned_vrf)
+                table.insert(parsed_show_bgp_process_vrf_all, "parsed_show_bgp_process_vrf_all")
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = learned_vrf_template.render(to_parse_vrf=self.learned_vrf['vrfs'],filetype_loop_jinja2=filetype)
+            # Show BGP Sessions
+            if parsed_show_bgp_sessions is not None:
+                sh_bgp_sessions_template = env.get_template('show_bgp_sessions.j2')                  
+                sh_bgp_sessions_netjson_json_template = env.get_template('show_bgp_sessions_netjson_json.j2')
+                sh_bgp_sessions_netjson_html_template = env.get_template('show_bgp_sessions_netjson_html.j2')
+                directory_names = "Show_BGP_Sessions"
+                file_names = "show_bgp_sessions"
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf.md --output Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_mind_map.html" % (device.alias,device.alias))
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_bgp_sessions)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_bgp_sessions)
 
-                    parsed_output_netjson_json = learned_vrf_netjson_json_template.render(to_parse_vrf=self.learned_vrf['vrfs'],device_alias = device.alias)
-                    parsed_output_netjson_html = learned_vrf_netjson_html_template.render(device_alias = device.alias)
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_bgp_sessions_template.render(to_parse_bgp=parsed_show_bgp_sessions,filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions.md" % device.alias, "Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Learned_VRF/%s_learned_vrf_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                parsed_output_netjson_json = sh_bgp_sessions_netjson_json_template.render(to_parse_bgp=parsed_show_bgp_sessions,device_alias = device.alias)
+                parsed_output_netjson_html = sh_bgp_sessions_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store VRF in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    table.insert(self.learned_vrf)
+                with open("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                ###############################
-                # Genie Show Command Section
-                ###############################
+                # ----------------
+                # Store BGP Sessions in Device Table in Database
+                # ----------------
 
-                # Show access-lists
-                if self.parsed_show_access_lists is not None:
-                    sh_access_lists_template = env.get_template('show_access_lists.j2')
-                    sh_access_lists_netjson_json_template = env.get_template('show_access_lists_netjson_json.j2')
-                    sh_access_lists_netjson_html_template = env.get_template('show_access_lists_netjson_html.j2')
-                    directory_names = "Show_Access_Lists"
-                    file_names = "show_access_lists"
+                table.insert(parsed_show_bgp_sessions, "parsed_show_bgp_sessions")
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_access_lists)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_access_lists)
+            # Show CDP Neighbors
+            if device.platform == 'n9k':                
+                if parsed_show_cdp_neighbors is not None:
+                    sh_cdp_neighbors_template = env.get_template('show_cdp_neighbors.j2')
+                    sh_cdp_neighbors_netjson_json_template = env.get_template('show_cdp_neighbor_netjson_json.j2')
+                    sh_cdp_neighbors_netjson_html_template = env.get_template('show_cdp_neighbor_netjson_html.j2')
+                    directory_names = "Show_CDP_Neighbors"
+                    file_names = "show_cdp_neighbors"
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_access_lists_template.render(to_parse_access_list=self.parsed_show_access_lists,filetype_loop_jinja2=filetype)
+                    self.save_to_json_file(device, directory_names, file_names, parsed_show_cdp_neighbors)
+                    self.save_to_yaml_file(device, directory_names, file_names, parsed_show_cdp_neighbors)
+
+                    for filetype in filetype_loop:                    
+                        parsed_output_type = sh_cdp_neighbors_template.render(to_parse_cdp_neighbors=parsed_show_cdp_neighbors['cdp'],filetype_loop_jinja2=filetype)
 
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists.md --output Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_mind_map.html" % (device.alias,device.alias))
+                                       
+                    if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors.md" % device.alias):
+                        mind_maps.add("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors.md" % device.alias, "Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_mind_map.html" % device.alias)
 
-                    parsed_output_netjson_json = sh_access_lists_netjson_json_template.render(to_parse_access_list=self.parsed_show_access_lists,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_access_lists_netjson_html_template.render(device_alias = device.alias)
+                    parsed_output_netjson_json = sh_cdp_neighbors_netjson_json_template.render(to_parse_cdp_neighbors=parsed_show_cdp_neighbors['cdp'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                    parsed_output_netjson_html = sh_cdp_neighbors_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_netgraph.json" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_netgraph.json" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                        fh.close()
 
-                    with open("Camelot/Cisco/NXOS/Show_Access_Lists/%s_show_access_lists_netgraph.html" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_netgraph.html" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_html)
                         fh.close()
 
                     # ----------------
-                    # Store ACLs in Device Table in Database
+                    # Store CDP Neighbors in Device Table in Database
                     # ----------------
 
-                    table.insert(self.parsed_show_access_lists)
-
-                # Show BGP process vrf all
-                if self.parsed_show_bgp_process_vrf_all is not None:
-                    sh_bgp_process_vrf_all_template = env.get_template('show_bgp_process_vrf_all.j2')                  
-                    sh_bgp_process_vrf_all_netjson_json_template = env.get_template('show_bgp_process_vrf_all_netjson_json.j2')
-                    sh_bgp_process_vrf_all_netjson_html_template = env.get_template('show_bgp_process_vrf_all_netjson_html.j2')
-                    
-                    directory_names = "Show_BGP_Process_VRF_All"
-                    file_names = "show_bgp_process_vfr_all"
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_bgp_process_vrf_all)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_bgp_process_vrf_all)
-                    
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_bgp_process_vrf_all_template.render(to_parse_bgp=self.parsed_show_bgp_process_vrf_all,filetype_loop_jinja2=filetype)
+                    table.insert(parsed_show_cdp_neighbors, "parsed_show_cdp_neighbors")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all.md --output Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_mind_map.html" % (device.alias,device.alias))
+            # Show CDP Neighbors Details
+            if parsed_show_cdp_neighbors_detail is not None:
+                sh_cdp_neighbors_detail_template = env.get_template('show_cdp_neighbors_details.j2')
+                sh_cdp_neighbors_detail_totals_template = env.get_template('show_cdp_neighbors_details_totals.j2')
+                sh_cdp_neighbors_detail_netjson_json_template = env.get_template('show_cdp_neighbor_details_netjson_json.j2')
+                sh_cdp_neighbors_detail_netjson_html_template = env.get_template('show_cdp_neighbor_details_netjson_html.j2')
+                directory_names = "Show_CDP_Neighbors_Details"
+                file_names = "show_cdp_neighbors_detail"
 
-                    parsed_output_netjson_json = sh_bgp_process_vrf_all_netjson_json_template.render(to_parse_bgp=self.parsed_show_bgp_process_vrf_all,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_bgp_process_vrf_all_netjson_html_template.render(device_alias = device.alias)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_cdp_neighbors_detail)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_cdp_neighbors_detail)
 
-                    with open("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                for filetype in filetype_loop:                    
+                    parsed_output_type = sh_cdp_neighbors_detail_template.render(to_parse_cdp_neighbors=parsed_show_cdp_neighbors_detail['index'],filetype_loop_jinja2=filetype)
+                    parsed_totals = sh_cdp_neighbors_detail_totals_template.render(to_parse_cdp_neighbors=parsed_show_cdp_neighbors_detail,filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_BGP_Process_VRF_All/%s_show_bgp_process_vrf_all_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)               
 
-                    # ----------------
-                    # Store BGP Process VRF All in Device Table in Database
-                    # ----------------
+                    with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals.%s" % (device.alias,filetype), "w") as fh:
+                        fh.write(parsed_totals)
 
-                    table.insert(self.parsed_show_bgp_process_vrf_all)
+                if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail.md" % device.alias, "Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_mind_map.html" % device.alias)
 
-                # Show BGP Sessions
-                if self.parsed_show_bgp_sessions is not None:
-                    sh_bgp_sessions_template = env.get_template('show_bgp_sessions.j2')                  
-                    sh_bgp_sessions_netjson_json_template = env.get_template('show_bgp_sessions_netjson_json.j2')
-                    sh_bgp_sessions_netjson_html_template = env.get_template('show_bgp_sessions_netjson_html.j2')
-                    directory_names = "Show_BGP_Sessions"
-                    file_names = "show_bgp_sessions"
+                if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_detail_totals.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals.md" % device.alias, "Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals_mind_map.html" % device.alias)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_bgp_sessions)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_bgp_sessions)
+                parsed_output_netjson_json = sh_cdp_neighbors_detail_netjson_json_template.render(to_parse_cdp_neighbors=parsed_show_cdp_neighbors_detail['index'],filetype_loop_jinja2=filetype,device_ip = device.connections.cli.ip)
+                parsed_output_netjson_html = sh_cdp_neighbors_detail_netjson_html_template.render(device_alias = device.alias)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_bgp_sessions_template.render(to_parse_bgp=self.parsed_show_bgp_sessions,filetype_loop_jinja2=filetype)
+                with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions.md --output Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_mind_map.html" % (device.alias,device.alias))
+                with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                    parsed_output_netjson_json = sh_bgp_sessions_netjson_json_template.render(to_parse_bgp=self.parsed_show_bgp_sessions,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_bgp_sessions_netjson_html_template.render(device_alias = device.alias)
+                # ----------------
+                # Store CDP Neighbors Details in Device Table in Database
+                # ----------------
 
-                    with open("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                table.insert(parsed_show_cdp_neighbors_detail, "parsed_show_cdp_neighbors_detail")
 
-                    with open("Camelot/Cisco/NXOS/Show_BGP_Sessions/%s_show_bgp_sessions_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+            # Show Environment
+            if device.platform != "n7k":
+                if parsed_show_environment is not None:
+                    sh_environment_template = env.get_template('show_environment_all.j2')
+                    sh_environment_netjson_json_template = env.get_template('show_environment_all_netjson_json.j2')
+                    sh_environment_netjson_html_template = env.get_template('show_environment_all_netjson_html.j2')  
+                    sh_environment_5k_template = env.get_template('show_environment_all_5k.j2')
+                    sh_environment_5k_netjson_json_template = env.get_template('show_environment_all_5k_netjson_json.j2')
+                    sh_environment_5k_netjson_html_template = env.get_template('show_environment_all_5k_netjson_html.j2')                        
+                    directory_names = "Show_Environment"
+                    file_names = "show_environment" 
+
+                    self.save_to_json_file(device, directory_names, file_names, parsed_show_environment)
+                    self.save_to_yaml_file(device, directory_names, file_names, parsed_show_environment)
+
+                    if device.platform == "n9k":
+                        for filetype in filetype_loop:  
+                            parsed_output_type = sh_environment_template.render(to_parse_environment=parsed_show_environment,filetype_loop_jinja2=filetype)
+                  
+                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    # ----------------
-                    # Store BGP Sessions in Device Table in Database
-                    # ----------------
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias, "Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_mind_map.html" % device.alias)
 
-                    table.insert(self.parsed_show_bgp_sessions)
+                        parsed_output_netjson_json = sh_environment_netjson_json_template.render(to_parse_environment=parsed_show_environment,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_environment_netjson_html_template.render(device_alias = device.alias)
 
-                # Show CDP Neighbors
-                if device.platform == 'n9k':                
-                    if self.parsed_show_cdp_neighbors is not None:
-                        sh_cdp_neighbors_template = env.get_template('show_cdp_neighbors.j2')
-                        sh_cdp_neighbors_netjson_json_template = env.get_template('show_cdp_neighbor_netjson_json.j2')
-                        sh_cdp_neighbors_netjson_html_template = env.get_template('show_cdp_neighbor_netjson_html.j2')
-                        directory_names = "Show_CDP_Neighbors"
-                        file_names = "show_cdp_neighbors"
-    
-                        self.save_to_json_file(device, directory_names, file_names, self.parsed_show_cdp_neighbors)
-                        self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_cdp_neighbors)
-    
-                        for filetype in filetype_loop:                    
-                            parsed_output_type = sh_cdp_neighbors_template.render(to_parse_cdp_neighbors=self.parsed_show_cdp_neighbors['cdp'],filetype_loop_jinja2=filetype)
-    
-                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                                           
-                        if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors.md --output Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_mind_map.html" % (device.alias,device.alias))
-    
-                        parsed_output_netjson_json = sh_cdp_neighbors_netjson_json_template.render(to_parse_cdp_neighbors=self.parsed_show_cdp_neighbors['cdp'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                        parsed_output_netjson_html = sh_cdp_neighbors_netjson_html_template.render(device_alias = device.alias)
-    
-                        with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_netgraph.json" % device.alias, "w") as fh:
+                        with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.json" % device.alias, "w") as fh:
                             fh.write(parsed_output_netjson_json)
                             fh.close()
-    
-                        with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_netgraph.html" % device.alias, "w") as fh:
+
+                        with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.html" % device.alias, "w") as fh:
                             fh.write(parsed_output_netjson_html)
                             fh.close()
-    
-                        # ----------------
-                        # Store CDP Neighbors in Device Table in Database
-                        # ----------------
-    
-                        table.insert(self.parsed_show_cdp_neighbors)
-
-                # Show CDP Neighbors Details
-                if self.parsed_show_cdp_neighbors_detail is not None:
-                    sh_cdp_neighbors_detail_template = env.get_template('show_cdp_neighbors_details.j2')
-                    sh_cdp_neighbors_detail_totals_template = env.get_template('show_cdp_neighbors_details_totals.j2')
-                    sh_cdp_neighbors_detail_netjson_json_template = env.get_template('show_cdp_neighbor_details_netjson_json.j2')
-                    sh_cdp_neighbors_detail_netjson_html_template = env.get_template('show_cdp_neighbor_details_netjson_html.j2')
-                    directory_names = "Show_CDP_Neighbors_Details"
-                    file_names = "show_cdp_neighbors_detail"
-    
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_cdp_neighbors_detail)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_cdp_neighbors_detail)
-    
-                    for filetype in filetype_loop:                    
-                        parsed_output_type = sh_cdp_neighbors_detail_template.render(to_parse_cdp_neighbors=self.parsed_show_cdp_neighbors_detail['index'],filetype_loop_jinja2=filetype)
-                        parsed_totals = sh_cdp_neighbors_detail_totals_template.render(to_parse_cdp_neighbors=self.parsed_show_cdp_neighbors_detail,filetype_loop_jinja2=filetype)
-    
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)               
-    
-                        with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals.%s" % (device.alias,filetype), "w") as fh:
-                            fh.write(parsed_totals)
-    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail.md --output Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_mind_map.html" % (device.alias,device.alias))
-    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_CDP_Neighbors/%s_show_cdp_neighbors_detail_totals.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals.md --output Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_totals_mind_map.html" % (device.alias,device.alias))
-    
-                    parsed_output_netjson_json = sh_cdp_neighbors_detail_netjson_json_template.render(to_parse_cdp_neighbors=self.parsed_show_cdp_neighbors_detail['index'],filetype_loop_jinja2=filetype,device_ip = device.connections.cli.ip)
-                    parsed_output_netjson_html = sh_cdp_neighbors_detail_netjson_html_template.render(device_alias = device.alias)
-    
-                    with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
-    
-                    with open("Camelot/Cisco/NXOS/Show_CDP_Neighbors_Details/%s_show_cdp_neighbors_detail_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
-    
-                    # ----------------
-                    # Store CDP Neighbors Details in Device Table in Database
-                    # ----------------
-    
-                    table.insert(self.parsed_show_cdp_neighbors_detail)
-
-                # Show Environment
-                if device.platform != "n7k":
-                    if self.parsed_show_environment is not None:
-                        sh_environment_template = env.get_template('show_environment_all.j2')
-                        sh_environment_netjson_json_template = env.get_template('show_environment_all_netjson_json.j2')
-                        sh_environment_netjson_html_template = env.get_template('show_environment_all_netjson_html.j2')  
-                        sh_environment_5k_template = env.get_template('show_environment_all_5k.j2')
-                        sh_environment_5k_netjson_json_template = env.get_template('show_environment_all_5k_netjson_json.j2')
-                        sh_environment_5k_netjson_html_template = env.get_template('show_environment_all_5k_netjson_html.j2')                        
-                        directory_names = "Show_Environment"
-                        file_names = "show_environment" 
-
-                        self.save_to_json_file(device, directory_names, file_names, self.parsed_show_environment)
-                        self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_environment)
-
-                        if device.platform == "n9k":
-                            for filetype in filetype_loop:  
-                                parsed_output_type = sh_environment_template.render(to_parse_environment=self.parsed_show_environment,filetype_loop_jinja2=filetype)
-                      
-                                self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md --output Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_mind_map.html" % (device.alias,device.alias))
-
-                            parsed_output_netjson_json = sh_environment_netjson_json_template.render(to_parse_environment=self.parsed_show_environment,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_environment_netjson_html_template.render(device_alias = device.alias)
-    
-                            with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.json" % device.alias, "w") as fh:
-                                fh.write(parsed_output_netjson_json)
-                                fh.close()
-    
-                            with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.html" % device.alias, "w") as fh:
-                                fh.write(parsed_output_netjson_html)
-                                fh.close()
 
-                        if device.platform == "n5k":
-                            for filetype in filetype_loop:  
-                                parsed_output_type = sh_environment_5k_template.render(to_parse_environment=self.parsed_show_environment,filetype_loop_jinja2=filetype)
-                      
-                                self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md --output Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_mind_map.html" % (device.alias,device.alias))
+                    if device.platform == "n5k":
+                        for filetype in filetype_loop:  
+                            parsed_output_type = sh_environment_5k_template.render(to_parse_environment=parsed_show_environment,filetype_loop_jinja2=filetype)
+                  
+                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                            parsed_output_netjson_json = sh_environment_5k_netjson_json_template.render(to_parse_environment=self.parsed_show_environment,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_environment_5k_netjson_html_template.render(device_alias = device.alias)
-    
-                            with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.json" % device.alias, "w") as fh:
-                                fh.write(parsed_output_netjson_json)
-                                fh.close()
-    
-                            with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.html" % device.alias, "w") as fh:
-                                fh.write(parsed_output_netjson_html)
-                                fh.close()
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment.md" % device.alias, "Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_mind_map.html" % device.alias)
 
-                        # ----------------
-                        # Store Environment in Device Table in Database
-                        # ----------------
+                        parsed_output_netjson_json = sh_environment_5k_netjson_json_template.render(to_parse_environment=parsed_show_environment,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_environment_5k_netjson_html_template.render(device_alias = device.alias)
 
-                        table.insert(self.parsed_show_environment)
+                        with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.json" % device.alias, "w") as fh:
+                            fh.write(parsed_output_netjson_json)
+                            fh.close()
 
-                # Show Interface
-                if device.platform != "n5k":
-                    if self.parsed_show_interface is not None:
-                        show_interface_template = env.get_template('show_interface.j2')
-                        show_interface_netjson_json_template = env.get_template('show_interface_connected_netjson_json.j2')
-                        show_interface_netjson_html_template = env.get_template('show_interface_connected_netjson_html.j2')
-                        directory_names = "Show_Interface"
-                        file_names = "show_interface"
-    
-                        self.save_to_json_file(device, directory_names, file_names, self.parsed_show_interface)
-                        self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_interface)
-    
-                        for filetype in filetype_loop:
-                            parsed_output_type = show_interface_template.render(to_parse_interface=self.parsed_show_interface,filetype_loop_jinja2=filetype)
-    
-                            self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-    
-                        if os.path.exists("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Interface/%s_show_interface.md --output Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_mind_map.html" % (device.alias,device.alias))
+                        with open("Camelot/Cisco/NXOS/Show_Environment/%s_show_environment_netgraph.html" % device.alias, "w") as fh:
+                            fh.write(parsed_output_netjson_html)
+                            fh.close()
 
-                        parsed_output_netjson_json = show_interface_netjson_json_template.render(to_parse_interface=self.parsed_show_interface,device_alias = device.alias)
-                        parsed_output_netjson_html = show_interface_netjson_html_template.render(device_alias = device.alias)
+                    # ----------------
+                    # Store Environment in Device Table in Database
+                    # ----------------
 
-                        with open("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_connected_netgraph.json" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_json)               
+                    table.insert(parsed_show_environment, "parsed_show_environment")
 
-                        with open("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_connected_netgraph.html" % device.alias, "w") as fh:
-                            fh.write(parsed_output_netjson_html)
+            # Show Interface
+            if device.platform != "n5k":
+                if parsed_show_interface is not None:
+                    show_interface_template = env.get_template('show_interface.j2')
+                    show_interface_netjson_json_template = env.get_template('show_interface_connected_netjson_json.j2')
+                    show_interface_netjson_html_template = env.get_template('show_interface_connected_netjson_html.j2')
+                    directory_names = "Show_Interface"
+                    file_names = "show_interface"
 
-                        # ----------------
-                        # Store Interfaces in Device Table in Database
-                        # ----------------
-    
-                        table.insert(self.parsed_show_interface)  
-      
-                # Show Interface Status
-                if self.parsed_show_interface_status is not None:
-                    show_interface_status_template = env.get_template('show_interface_status.j2')
-                    show_interface_status_netjson_json_template = env.get_template('show_interface_status_netjson_json.j2')
-                    show_interface_status_netjson_html_template = env.get_template('show_interface_status_netjson_html.j2')
-                    show_interface_status_connected_netjson_json_template = env.get_template('show_interface_status_connected_netjson_json.j2')
-                    show_interface_status_connected_netjson_html_template = env.get_template('show_interface_status_connected_netjson_html.j2')                    
-                    directory_names = "Show_Interface_Status"
-                    file_names = "show_interface_status"
-
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_interface_status)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_interface_status)
+                    self.save_to_json_file(device, directory_names, file_names, parsed_show_interface)
+                    self.save_to_yaml_file(device, directory_names, file_names, parsed_show_interface)
 
                     for filetype in filetype_loop:
-                        parsed_output_type = show_interface_status_template.render(to_parse_interface=self.parsed_show_interface_status,filetype_loop_jinja2=filetype)
+                        parsed_output_type = show_interface_template.render(to_parse_interface=parsed_show_interface,filetype_loop_jinja2=filetype)
 
                         self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status.md --output Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_mind_map.html" % (device.alias,device.alias))
+                    if os.path.exists("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface.md" % device.alias):
+                        mind_maps.add("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface.md" % device.alias, "Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_mind_map.html" % device.alias)
 
-                    parsed_output_netjson_json = show_interface_status_netjson_json_template.render(to_parse_interface=self.parsed_show_interface_status,device_alias = device.alias)
-                    parsed_output_netjson_html = show_interface_status_netjson_html_template.render(device_alias = device.alias)
+                    parsed_output_netjson_json = show_interface_netjson_json_template.render(to_parse_interface=parsed_show_interface,device_alias = device.alias)
+                    parsed_output_netjson_html = show_interface_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_netgraph.json" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_connected_netgraph.json" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_json)               
 
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_netgraph.html" % device.alias, "w") as fh:
+                    with open("Camelot/Cisco/NXOS/Show_Interface/%s_show_interface_connected_netgraph.html" % device.alias, "w") as fh:
                         fh.write(parsed_output_netjson_html)
 
-                    parsed_output_netjson_json = show_interface_status_connected_netjson_json_template.render(to_parse_interface=self.parsed_show_interface_status,device_alias = device.alias)
-                    parsed_output_netjson_html = show_interface_status_connected_netjson_html_template.render(device_alias = device.alias)
-
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_connected_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
-
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_connected_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)                        
                     # ----------------
                     # Store Interfaces in Device Table in Database
                     # ----------------
 
-                    table.insert(self.parsed_show_interface_status)
+                    table.insert(parsed_show_interface, "parsed_show_interface")  
+  
+            # Show Interface Status
+            if parsed_show_interface_status is not None:
+                show_interface_status_template = env.get_template('show_interface_status.j2')
+                show_interface_status_netjson_json_template = env.get_template('show_interface_status_netjson_json.j2')
+                show_interface_status_netjson_html_template = env.get_template('show_interface_status_netjson_html.j2')
+                show_interface_status_connected_netjson_json_template = env.get_template('show_interface_status_connected_netjson_json.j2')
+                show_interface_status_connected_netjson_html_template = env.get_template('show_interface_status_connected_netjson_html.j2')                    
+                directory_names = "Show_Interface_Status"
+                file_names = "show_interface_status"
 
-                # Show Interface Transceiver
-                if self.parsed_show_interface_transceiver is not None:
-                    show_interface_transceiver_template = env.get_template('show_interface_transceiver.j2')
-                    show_interface_transceiver_connected_netjson_json_template = env.get_template('show_interface_transceiver_connected_netjson_json.j2')
-                    show_interface_transceiver_connected_netjson_html_template = env.get_template('show_interface_transceiver_connected_netjson_html.j2')                    
-                    directory_names = "Show_Interface_Transceiver"
-                    file_names = "show_interface_transceiver"
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_interface_status)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_interface_status)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_interface_transceiver)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_interface_transceiver)
+                for filetype in filetype_loop:
+                    parsed_output_type = show_interface_status_template.render(to_parse_interface=parsed_show_interface_status,filetype_loop_jinja2=filetype)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = show_interface_transceiver_template.render(to_parse_interface=self.parsed_show_interface_transceiver,filetype_loop_jinja2=filetype)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                if os.path.exists("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status.md" % device.alias, "Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_mind_map.html" % device.alias)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Interface_transceiver/%s_show_interface_transceiver.md --output Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_mind_map.html" % (device.alias,device.alias))
+                parsed_output_netjson_json = show_interface_status_netjson_json_template.render(to_parse_interface=parsed_show_interface_status,device_alias = device.alias)
+                parsed_output_netjson_html = show_interface_status_netjson_html_template.render(device_alias = device.alias)
 
-                    parsed_output_netjson_json = show_interface_transceiver_connected_netjson_json_template.render(to_parse_interface=self.parsed_show_interface_transceiver,device_alias = device.alias)
-                    parsed_output_netjson_html = show_interface_transceiver_connected_netjson_html_template.render(device_alias = device.alias)
+                with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_connected_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    with open("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_connected_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)                        
-                    # ----------------
-                    # Store Interfaces in Device Table in Database
-                    # ----------------
+                parsed_output_netjson_json = show_interface_status_connected_netjson_json_template.render(to_parse_interface=parsed_show_interface_status,device_alias = device.alias)
+                parsed_output_netjson_html = show_interface_status_connected_netjson_html_template.render(device_alias = device.alias)
 
-                    table.insert(self.parsed_show_interface_transceiver)
+                with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_connected_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                # Show Inventory
-                if self.parsed_show_inventory is not None:
-                    # Nexus 
-                    sh_inventory_nexus_template = env.get_template('show_inventory.j2')
-                    sh_inventory_netjson_json_template = env.get_template('show_inventory_netjson_json.j2')
-                    sh_inventory_netjson_html_template = env.get_template('show_inventory_netjson_html.j2')
+                with open("Camelot/Cisco/NXOS/Show_Interface_Status/%s_show_interface_status_connected_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)                        
+                # ----------------
+                # Store Interfaces in Device Table in Database
+                # ----------------
 
-                    directory_names = "Show_Inventory"
-                    file_names = "show_inventory"
+                table.insert(parsed_show_interface_status, "parsed_show_interface_status")
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_inventory)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_inventory)
+            # Show Interface Transceiver
+            if parsed_show_interface_transceiver is not None:
+                show_interface_transceiver_template = env.get_template('show_interface_transceiver.j2')
+                show_interface_transceiver_connected_netjson_json_template = env.get_template('show_interface_transceiver_connected_netjson_json.j2')
+                show_interface_transceiver_connected_netjson_html_template = env.get_template('show_interface_transceiver_connected_netjson_html.j2')                    
+                directory_names = "Show_Interface_Transceiver"
+                file_names = "show_interface_transceiver"
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_inventory_nexus_template.render(to_parse_inventory_name=self.parsed_show_inventory['name'],filetype_loop_jinja2=filetype)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_interface_transceiver)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_interface_transceiver)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                for filetype in filetype_loop:
+                    parsed_output_type = show_interface_transceiver_template.render(to_parse_interface=parsed_show_interface_transceiver,filetype_loop_jinja2=filetype)
 
-                        if os.path.exists("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory.md" % device.alias):
-                            os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory.md --output Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_mind_map.html" % (device.alias,device.alias))
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    parsed_output_netjson_json = sh_inventory_netjson_json_template.render(to_parse_inventory_name=self.parsed_show_inventory['name'],device_alias = device.alias)
-                    parsed_output_netjson_html = sh_inventory_netjson_html_template.render(device_alias = device.alias)
+                if os.path.exists("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_Interface_transceiver/%s_show_interface_transceiver.md" % device.alias, "Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                parsed_output_netjson_json = show_interface_transceiver_connected_netjson_json_template.render(to_parse_interface=parsed_show_interface_transceiver,device_alias = device.alias)
+                parsed_output_netjson_html = show_interface_transceiver_connected_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                with open("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_connected_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                # Show ip interface brief
-                if self.parsed_show_ip_interface_brief is not None:
-                    sh_ip_int_brief_template = env.get_template('show_ip_interface_brief.j2')
-                    sh_ip_int_brief_netjson_json_template = env.get_template('show_ip_interface_brief_netjson_json.j2')
-                    sh_ip_int_brief_netjson_html_template = env.get_template('show_ip_interface_brief_netjson_html.j2')
-                    directory_names = "Show_IP_Interface_Brief"
-                    file_names = "show_ip_interface_brief"                    
+                with open("Camelot/Cisco/NXOS/Show_Interface_Transceiver/%s_show_interface_transceiver_connected_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)                        
+                # ----------------
+                # Store Interfaces in Device Table in Database
+                # ----------------
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_ip_interface_brief)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_ip_interface_brief)               
-        
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ip_int_brief_template.render(to_parse_interfaces=self.parsed_show_ip_interface_brief['interface'],filetype_loop_jinja2=filetype)
+                table.insert(parsed_show_interface_transceiver, "parsed_show_interface_transceiver")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+            # Show Inventory
+            if parsed_show_inventory is not None:
+                # Nexus 
+                sh_inventory_nexus_template = env.get_template('show_inventory.j2')
+                sh_inventory_netjson_json_template = env.get_template('show_inventory_netjson_json.j2')
+                sh_inventory_netjson_html_template = env.get_template('show_inventory_netjson_html.j2')
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief.md --output Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_mind_map.html" % (device.alias,device.alias))
+                directory_names = "Show_Inventory"
+                file_names = "show_inventory"
 
-                    parsed_output_netjson_json = sh_ip_int_brief_netjson_json_template.render(to_parse_interfaces=self.parsed_show_ip_interface_brief['interface'],device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ip_int_brief_netjson_html_template.render(device_alias = device.alias)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_inventory)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_inventory)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_inventory_nexus_template.render(to_parse_inventory_name=parsed_show_inventory['name'],filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
 
-                    # ----------------
-                    # Store IP Int Brief in Device Table in Database
-                    # ----------------
+                    if os.path.exists("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory.md" % device.alias):
+                        mind_maps.add("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory.md" % device.alias, "Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_mind_map.html" % device.alias)
 
-                    table.insert(self.parsed_show_ip_interface_brief)
+                parsed_output_netjson_json = sh_inventory_netjson_json_template.render(to_parse_inventory_name=parsed_show_inventory['name'],device_alias = device.alias)
+                parsed_output_netjson_html = sh_inventory_netjson_html_template.render(device_alias = device.alias)
 
-                # Show IP OSPF
-                if self.parsed_show_ip_ospf is not None:
-                    sh_ip_ospf_template = env.get_template('show_ip_ospf.j2')
-                    sh_ip_ospf_netjson_json_template = env.get_template('show_ip_ospf_netjson_json.j2')
-                    sh_ip_ospf_netjson_html_template = env.get_template('show_ip_ospf_netjson_html.j2')                    
-                    directory_names = "Show_IP_OSPF"
-                    file_names = "show_ip_ospf"                    
-                    
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_ip_ospf)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_ip_ospf)
+                with open("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ip_ospf_template.render(to_parse_ip_ospf=self.parsed_show_ip_ospf['vrf'],filetype_loop_jinja2=filetype)
+                with open("Camelot/Cisco/NXOS/Show_Inventory/%s_show_inventory_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+            # Show ip interface brief
+            if parsed_show_ip_interface_brief is not None:
+                sh_ip_int_brief_template = env.get_template('show_ip_interface_brief.j2')
+                sh_ip_int_brief_netjson_json_template = env.get_template('show_ip_interface_brief_netjson_json.j2')
+                sh_ip_int_brief_netjson_html_template = env.get_template('show_ip_interface_brief_netjson_html.j2')
+                directory_names = "Show_IP_Interface_Brief"
+                file_names = "show_ip_interface_brief"                    
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf.md --output Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_mind_map.html" % (device.alias,device.alias))
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_ip_interface_brief)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_ip_interface_brief)               
+    
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ip_int_brief_template.render(to_parse_interfaces=parsed_show_ip_interface_brief['interface'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_ip_ospf_netjson_json_template.render(to_parse_ip_ospf=self.parsed_show_ip_ospf['vrf'],device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ip_ospf_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief.md" % device.alias, "Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                parsed_output_netjson_json = sh_ip_int_brief_netjson_json_template.render(to_parse_interfaces=parsed_show_ip_interface_brief['interface'],device_alias = device.alias)
+                parsed_output_netjson_html = sh_ip_int_brief_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store IP OSPF in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                    table.insert(self.parsed_show_ip_ospf)
+                with open("Camelot/Cisco/NXOS/Show_IP_Interface_Brief/%s_show_ip_interface_brief_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                # Show IP OSPF Interface
-                if self.parsed_show_ip_ospf_interface is not None:
-                    sh_ip_ospf_interface_template = env.get_template('show_ip_ospf_interface.j2')
-                    sh_ip_ospf_interface_netjson_json_template = env.get_template('show_ip_ospf_interface_netjson_json.j2')
-                    sh_ip_ospf_interface_netjson_html_template = env.get_template('show_ip_ospf_interface_netjson_html.j2')                    
-                    directory_names = "Show_IP_OSPF_Interface"
-                    file_names = "show_ip_ospf_interface"                    
-                    
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_ip_ospf_interface)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_ip_ospf_interface)
+                # ----------------
+                # Store IP Int Brief in Device Table in Database
+                # ----------------
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ip_ospf_interface_template.render(to_parse_ip_ospf_interface=self.parsed_show_ip_ospf_interface['vrf'],filetype_loop_jinja2=filetype)
+                table.insert(parsed_show_ip_interface_brief, "parsed_show_ip_interface_brief")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+            # Show IP OSPF
+            if parsed_show_ip_ospf is not None:
+                sh_ip_ospf_template = env.get_template('show_ip_ospf.j2')
+                sh_ip_ospf_netjson_json_template = env.get_template('show_ip_ospf_netjson_json.j2')
+                sh_ip_ospf_netjson_html_template = env.get_template('show_ip_ospf_netjson_html.j2')                    
+                directory_names = "Show_IP_OSPF"
+                file_names = "show_ip_ospf"                    
+                
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_ip_ospf)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_ip_ospf)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface.md --output Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ip_ospf_template.render(to_parse_ip_ospf=parsed_show_ip_ospf['vrf'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_ip_ospf_interface_netjson_json_template.render(to_parse_ip_ospf_interface=self.parsed_show_ip_ospf_interface['vrf'],device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ip_ospf_interface_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf.md" % device.alias, "Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                parsed_output_netjson_json = sh_ip_ospf_netjson_json_template.render(to_parse_ip_ospf=parsed_show_ip_ospf['vrf'],device_alias = device.alias)
+                parsed_output_netjson_html = sh_ip_ospf_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store IP OSPF Interface in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                    table.insert(self.parsed_show_ip_ospf_interface)
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                # Show IP OSPF Neighbor Detail
-                if self.parsed_show_ip_ospf_neighbor_detail is not None:
-                    sh_ip_ospf_neighbor_detail_template = env.get_template('show_ip_ospf_neighbor_detail.j2')
-                    sh_ip_ospf_neighbor_detail_netjson_json_template = env.get_template('show_ip_ospf_neighbor_detail_netjson_json.j2')
-                    sh_ip_ospf_neighbor_detail_netjson_html_template = env.get_template('show_ip_ospf_neighbor_detail_netjson_html.j2')
-                    directory_names = "Show_IP_OSPF_Neighbor_Detail"
-                    file_names = "show_ip_ospf_neighbor_detail"                    
-                    
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_ip_ospf_neighbor_detail)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_ip_ospf_neighbor_detail)
+                # ----------------
+                # Store IP OSPF in Device Table in Database
+                # ----------------
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ip_ospf_neighbor_detail_template.render(to_parse_ip_ospf_neighbor_detail=self.parsed_show_ip_ospf_neighbor_detail['vrf'],filetype_loop_jinja2=filetype)
+                table.insert(parsed_show_ip_ospf, "parsed_show_ip_ospf")
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+            # Show IP OSPF Interface
+            if parsed_show_ip_ospf_interface is not None:
+                sh_ip_ospf_interface_template = env.get_template('show_ip_ospf_interface.j2')
+                sh_ip_ospf_interface_netjson_json_template = env.get_template('show_ip_ospf_interface_netjson_json.j2')
+                sh_ip_ospf_interface_netjson_html_template = env.get_template('show_ip_ospf_interface_netjson_html.j2')                    
+                directory_names = "Show_IP_OSPF_Interface"
+                file_names = "show_ip_ospf_interface"                    
+                
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_ip_ospf_interface)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_ip_ospf_interface)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail.md --output Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ip_ospf_interface_template.render(to_parse_ip_ospf_interface=parsed_show_ip_ospf_interface['vrf'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_ip_ospf_neighbor_detail_netjson_json_template.render(to_parse_ip_ospf=self.parsed_show_ip_ospf['vrf'],device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ip_ospf_neighbor_detail_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()               
+                if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface.md" % device.alias, "Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                parsed_output_netjson_json = sh_ip_ospf_interface_netjson_json_template.render(to_parse_ip_ospf_interface=parsed_show_ip_ospf_interface['vrf'],device_alias = device.alias)
+                parsed_output_netjson_html = sh_ip_ospf_interface_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store IP OSPF Neighbor Detail in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                    table.insert(self.parsed_show_ip_ospf_neighbor_detail)
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface/%s_show_ip_ospf_interface_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                # Show IP Route
-                if self.parsed_show_ip_route is not None:
-                    sh_ip_route_template = env.get_template('show_ip_route.j2')
-                    sh_ip_route_netjson_json_template = env.get_template('show_ip_route_netjson_json.j2')
-                    sh_ip_route_netjson_html_template = env.get_template('show_ip_route_netjson_html.j2')
-                    directory_names = "Show_IP_Route"
-                    file_names = "show_ip_route"                    
+                # ----------------
+                # Store IP OSPF Interface in Device Table in Database
+                # ----------------
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_ip_route)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_ip_route)
+                table.insert(parsed_show_ip_ospf_interface, "parsed_show_ip_ospf_interface")
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ip_route_template.render(to_parse_ip_route=self.parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype)
+            # Show IP OSPF Neighbor Detail
+            if parsed_show_ip_ospf_neighbor_detail is not None:
+                sh_ip_ospf_neighbor_detail_template = env.get_template('show_ip_ospf_neighbor_detail.j2')
+                sh_ip_ospf_neighbor_detail_netjson_json_template = env.get_template('show_ip_ospf_neighbor_detail_netjson_json.j2')
+                sh_ip_ospf_neighbor_detail_netjson_html_template = env.get_template('show_ip_ospf_neighbor_detail_netjson_html.j2')
+                directory_names = "Show_IP_OSPF_Neighbor_Detail"
+                file_names = "show_ip_ospf_neighbor_detail"                    
+                
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_ip_ospf_neighbor_detail)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_ip_ospf_neighbor_detail)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
-                    
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route.md --output Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ip_ospf_neighbor_detail_template.render(to_parse_ip_ospf_neighbor_detail=parsed_show_ip_ospf_neighbor_detail['vrf'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()              
+                if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail.md" % device.alias, "Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail/%s_show_ip_ospf_neighbor_detail_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                parsed_output_netjson_json = sh_ip_ospf_neighbor_detail_netjson_json_template.render(to_parse_ip_ospf=parsed_show_ip_ospf['vrf'],device_alias = device.alias)
+                parsed_output_netjson_html = sh_ip_ospf_neighbor_detail_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store IP Route in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()               
 
-                    table.insert(self.parsed_show_ip_route)
+                with open("Camelot/Cisco/NXOS/Show_IP_OSPF/%s_show_ip_ospf_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                # Show mac address-table
-                if self.parsed_show_mac_address_table is not None:
-                    sh_mac_address_table_template = env.get_template('show_mac_address_table.j2')
-                    sh_mac_address_table_netjson_json_template = env.get_template('show_mac_address_table_netjson_json.j2')
-                    sh_mac_address_table_netjson_html_template = env.get_template('show_mac_address_table_netjson_html.j2')
-                    directory_names = "Show_MAC_Address_Table"
-                    file_names = "show_mac_address_table"                    
+                # ----------------
+                # Store IP OSPF Neighbor Detail in Device Table in Database
+                # ----------------
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_mac_address_table)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_mac_address_table)
+                table.insert(parsed_show_ip_ospf_neighbor_detail, "parsed_show_ip_ospf_neighbor_detail")
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_mac_address_table_template.render(to_parse_mac_address_table=self.parsed_show_mac_address_table['mac_table'],filetype_loop_jinja2=filetype)
+            # Show IP Route
+            if parsed_show_ip_route is not None:
+                sh_ip_route_template = env.get_template('show_ip_route.j2')
+                sh_ip_route_netjson_json_template = env.get_template('show_ip_route_netjson_json.j2')
+                sh_ip_route_netjson_html_template = env.get_template('show_ip_route_netjson_html.j2')
+                directory_names = "Show_IP_Route"
+                file_names = "show_ip_route"                    
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_ip_route)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_ip_route)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table.md --output Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ip_route_template.render(to_parse_ip_route=parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_mac_address_table_netjson_json_template.render(to_parse_mac_address_table=self.parsed_show_mac_address_table['mac_table'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_mac_address_table_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                
+                if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route.md" % device.alias, "Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)
-                        fh.close()              
+                parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=parsed_show_ip_route['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
-                        fh.close()
+                with open("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()              
 
-                    # ----------------
-                    # Store MAC Address Table in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_IP_Route/%s_show_ip_route_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                    table.insert(self.parsed_show_mac_address_table)
+                # ----------------
+                # Store IP Route in Database
+                # ----------------
 
-                # Show Port-channel summary
-                if self.parsed_show_port_channel_summary is not None:
-                    sh_portchannel_summary_template = env.get_template('show_portchannel_summary.j2')
-                    sh_portchannel_summary_netjson_json_template = env.get_template('show_portchannel_summary_netjson_json.j2')
-                    sh_portchannel_summary_netjson_html_template = env.get_template('show_portchannel_summary_netjson_html.j2')
+                table.insert(parsed_show_ip_route, "parsed_show_ip_route")
 
-                    directory_names = "Show_Port_Channel_Summary"
-                    file_names = "show_port_channel_summary"
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_port_channel_summary)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_port_channel_summary)
+            # Show mac address-table
+            if parsed_show_mac_address_table is not None:
+                sh_mac_address_table_template = env.get_template('show_mac_address_table.j2')
+                sh_mac_address_table_netjson_json_template = env.get_template('show_mac_address_table_netjson_json.j2')
+                sh_mac_address_table_netjson_html_template = env.get_template('show_mac_address_table_netjson_html.j2')
+                directory_names = "Show_MAC_Address_Table"
+                file_names = "show_mac_address_table"                    
 
-                    for filetype in filetype_loop:                       
-                        parsed_output_type = sh_portchannel_summary_template.render(to_parse_etherchannel_summary=self.parsed_show_port_channel_summary['interfaces'],filetype_loop_jinja2=filetype)
-                      
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_mac_address_table)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_mac_address_table)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary.md --output Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_mac_address_table_template.render(to_parse_mac_address_table=parsed_show_mac_address_table['mac_table'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_portchannel_summary_netjson_json_template.render(to_parse_etherchannel_summary=self.parsed_show_port_channel_summary['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_portchannel_summary_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                if os.path.exists("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table.md" % device.alias, "Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                parsed_output_netjson_json = sh_mac_address_table_netjson_json_template.render(to_parse_mac_address_table=parsed_show_mac_address_table['mac_table'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_mac_address_table_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store Port-Channel in Device Table in Databse
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)
+                    fh.close()              
 
-                    table.insert(self.parsed_show_port_channel_summary)
+                with open("Camelot/Cisco/NXOS/Show_MAC_Address_Table/%s_show_mac_address_table_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+                    fh.close()
 
-                # Show version
-                if self.parsed_show_version is not None:
-                    sh_ver_template = env.get_template('show_version.j2')
-                    sh_ver_netjson_json_template = env.get_template('show_version_netjson_json.j2')
-                    sh_ver_netjson_html_template = env.get_template('show_version_netjson_html.j2')                    
-                    directory_names = "Show_Version"
-                    file_names = "show_version"                    
+                # ----------------
+                # Store MAC Address Table in Device Table in Database
+                # ----------------
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_version)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_version)
+                table.insert(parsed_show_mac_address_table, "parsed_show_mac_address_table")
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_ver_template.render(to_parse_version=self.parsed_show_version['platform'],filetype_loop_jinja2=filetype)
+            # Show Port-channel summary
+            if parsed_show_port_channel_summary is not None:
+                sh_portchannel_summary_template = env.get_template('show_portchannel_summary.j2')
+                sh_portchannel_summary_netjson_json_template = env.get_template('show_portchannel_summary_netjson_json.j2')
+                sh_portchannel_summary_netjson_html_template = env.get_template('show_portchannel_summary_netjson_html.j2')
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                directory_names = "Show_Port_Channel_Summary"
+                file_names = "show_port_channel_summary"
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_port_channel_summary)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_port_channel_summary)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_Version/%s_show_version.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_Version/%s_show_version.md --output Camelot/Cisco/NXOS/Show_Version/%s_show_version_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:                       
+                    parsed_output_type = sh_portchannel_summary_template.render(to_parse_etherchannel_summary=parsed_show_port_channel_summary['interfaces'],filetype_loop_jinja2=filetype)
+                  
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    parsed_output_netjson_json = sh_ver_netjson_json_template.render(to_parse_version=self.parsed_show_version['platform'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_ver_netjson_html_template.render(device_alias = device.alias)
+                if os.path.exists("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary.md" % device.alias, "Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Version/%s_show_version_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                parsed_output_netjson_json = sh_portchannel_summary_netjson_json_template.render(to_parse_etherchannel_summary=parsed_show_port_channel_summary['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_portchannel_summary_netjson_html_template.render(device_alias = device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_Version/%s_show_version_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                with open("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
+
+                with open("Camelot/Cisco/NXOS/Show_Port_Channel_Summary/%s_show_port_channel_summary_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+
+                # ----------------
+                # Store Port-Channel in Device Table in Databse
+                # ----------------
 
-                    # ----------------
-                    # Store Version in Device Table in Database
-                    # ----------------
+                table.insert(parsed_show_port_channel_summary, "parsed_show_port_channel_summary")
 
-                    table.insert(self.parsed_show_version)
+            # Show version
+            if parsed_show_version is not None:
+                sh_ver_template = env.get_template('show_version.j2')
+                sh_ver_netjson_json_template = env.get_template('show_version_netjson_json.j2')
+                sh_ver_netjson_html_template = env.get_template('show_version_netjson_html.j2')                    
+                directory_names = "Show_Version"
+                file_names = "show_version"                    
 
-                # Show vlan
-                if self.parsed_show_vlan is not None:
-                    sh_vlan_template = env.get_template('show_vlan.j2')
-                    sh_vlan_netjson_json_template = env.get_template('show_vlan_netjson_json.j2')
-                    sh_vlan_netjson_html_template = env.get_template('show_vlan_netjson_html.j2') 
-                    directory_names = "Show_VLAN"
-                    file_names = "show_vlan"                    
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_version)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_version)
 
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_vlan)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_vlan)
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_ver_template.render(to_parse_version=parsed_show_version['platform'],filetype_loop_jinja2=filetype)
 
-                    for filetype in filetype_loop:
-                        parsed_output_type = sh_vlan_template.render(to_parse_vlan=self.parsed_show_vlan['vlans'],filetype_loop_jinja2=filetype)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                if os.path.exists("Camelot/Cisco/NXOS/Show_Version/%s_show_version.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_Version/%s_show_version.md" % device.alias, "Camelot/Cisco/NXOS/Show_Version/%s_show_version_mind_map.html" % device.alias)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan.md --output Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_mind_map.html" % (device.alias,device.alias))
+                parsed_output_netjson_json = sh_ver_netjson_json_template.render(to_parse_version=parsed_show_version['platform'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_ver_netjson_html_template.render(device_alias = device.alias)
 
-                    parsed_output_netjson_json = sh_vlan_netjson_json_template.render(to_parse_vlan=self.parsed_show_vlan['vlans'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_vlan_netjson_html_template.render(device_alias = device.alias)
+                with open("Camelot/Cisco/NXOS/Show_Version/%s_show_version_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    with open("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                with open("Camelot/Cisco/NXOS/Show_Version/%s_show_version_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    with open("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                # ----------------
+                # Store Version in Device Table in Database
+                # ----------------
 
-                    # ----------------
-                    # Store VLAN in Device Table in Database
-                    # ----------------
+                table.insert(parsed_show_version, "parsed_show_version")
 
-                    table.insert(self.parsed_show_vlan)
-
-                # Show vrf
-                if self.parsed_show_vrf is not None:
-                    sh_vrf_template = env.get_template('show_vrf.j2')
-                    sh_vrf_netjson_json_template = env.get_template('show_vrf_netjson_json.j2')
-                    sh_vrf_netjson_html_template = env.get_template('show_vrf_netjson_html.j2')
-                    sh_vrf_detail_template = env.get_template('show_vrf_detail.j2')
-                    sh_vrf_detail_netjson_json_template = env.get_template('show_vrf_detail_netjson_json.j2')
-                    sh_vrf_detail_netjson_html_template = env.get_template('show_vrf_detail_netjson_html.j2')
-                    sh_ip_arp_vrf_template = env.get_template('show_ip_arp_vrf.j2')
-                    sh_ip_arp_vrf_statistics_template = env.get_template('show_ip_arp_vrf_statistics.j2')
-                    sh_ip_arp_vrf_netjson_json_template = env.get_template('show_ip_arp_vrf_netjson_json.j2')
-                    sh_ip_arp_vrf_netjson_html_template = env.get_template('show_ip_arp_vrf_netjson_html.j2')
-                    sh_ip_ospf_vrf_template = env.get_template('show_ip_ospf_vrf.j2')
-                    sh_ip_ospf_vrf_netjson_json_template = env.get_template('show_ip_ospf_vrf_netjson_json.j2')
-                    sh_ip_ospf_vrf_netjson_html_template = env.get_template('show_ip_ospf_vrf_netjson_html.j2')
-                    sh_ip_ospf_interface_vrf_template = env.get_template('show_ip_ospf_interface_vrf.j2')
-                    sh_ip_ospf_interface_vrf_netjson_json_template = env.get_template('show_ip_ospf_interface_vrf_netjson_json.j2')
-                    sh_ip_ospf_interface_vrf_netjson_html_template = env.get_template('show_ip_ospf_interface_vrf_netjson_html.j2')
-                    sh_ip_ospf_neighbor_detail_vrf_template = env.get_template('show_ip_ospf_neighbor_detail_vrf.j2')
-                    sh_ip_ospf_neighbor_detail_vrf_netjson_json_template = env.get_template('show_ip_ospf_neighbor_detail_vrf_netjson_json.j2')
-                    sh_ip_ospf_neighbor_detail_vrf_netjson_html_template = env.get_template('show_ip_ospf_neighbor_detail_vrf_netjson_html.j2')
-                    sh_ip_route_template = env.get_template('show_ip_route.j2')
-                    sh_ip_route_netjson_json_template = env.get_template('show_ip_route_netjson_json.j2')
-                    sh_ip_route_netjson_html_template = env.get_template('show_ip_route_netjson_html.j2')
-                    directory_names = "Show_VRF"
-                    file_names = "show_vrf"  
-
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_vrf)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_vrf)
-
-                    for filetype in filetype_loop:      
-                        parsed_output_type = sh_vrf_template.render(to_parse_vrf=self.parsed_show_vrf['vrfs'],filetype_loop_jinja2=filetype)
+            # Show vlan
+            if parsed_show_vlan is not None:
+                sh_vlan_template = env.get_template('show_vlan.j2')
+                sh_vlan_netjson_json_template = env.get_template('show_vlan_netjson_json.j2')
+                sh_vlan_netjson_html_template = env.get_template('show_vlan_netjson_html.j2') 
+                directory_names = "Show_VLAN"
+                file_names = "show_vlan"                    
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_vlan)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_vlan)
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf.md --output Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_mind_map.html" % (device.alias,device.alias))
+                for filetype in filetype_loop:
+                    parsed_output_type = sh_vlan_template.render(to_parse_vlan=parsed_show_vlan['vlans'],filetype_loop_jinja2=filetype)
 
-                    parsed_output_netjson_json = sh_vrf_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf['vrfs'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_vrf_netjson_html_template.render(device_alias = device.alias)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                if os.path.exists("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan.md" % device.alias, "Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_mind_map.html" % device.alias)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                parsed_output_netjson_json = sh_vlan_netjson_json_template.render(to_parse_vlan=parsed_show_vlan['vlans'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_vlan_netjson_html_template.render(device_alias = device.alias)
 
-                    # ----------------
-                    # Store VRF in Device Table in Database
-                    # ----------------
+                with open("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    table.insert(self.parsed_show_vrf)
+                with open("Camelot/Cisco/NXOS/Show_VLAN/%s_show_vlan_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    # For Each VRF
-                    for vrf in self.parsed_show_vrf['vrfs']:
+                # ----------------
+                # Store VLAN in Device Table in Database
+                # ----------------
 
-                        # Show IP ARP VRF <VRF> 
-                        with steps.start('Parsing ip arp vrf',continue_=True) as step:
-                            try:
-                                self.parsed_show_ip_arp_vrf = device.parse("show ip arp vrf %s" % vrf)
-                            except Exception as e:
-                                step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                table.insert(parsed_show_vlan, "parsed_show_vlan")
 
-                        with steps.start('Store data',continue_=True) as step:
+            # Show vrf
+            if parsed_show_vrf is not None:
+                sh_vrf_template = env.get_template('show_vrf.j2')
+                sh_vrf_netjson_json_template = env.get_template('show_vrf_netjson_json.j2')
+                sh_vrf_netjson_html_template = env.get_template('show_vrf_netjson_html.j2')
+                sh_vrf_detail_template = env.get_template('show_vrf_detail.j2')
+                sh_vrf_detail_netjson_json_template = env.get_template('show_vrf_detail_netjson_json.j2')
+                sh_vrf_detail_netjson_html_template = env.get_template('show_vrf_detail_netjson_html.j2')
+                sh_ip_arp_vrf_template = env.get_template('show_ip_arp_vrf.j2')
+                sh_ip_arp_vrf_statistics_template = env.get_template('show_ip_arp_vrf_statistics.j2')
+                sh_ip_arp_vrf_netjson_json_template = env.get_template('show_ip_arp_vrf_netjson_json.j2')
+                sh_ip_arp_vrf_netjson_html_template = env.get_template('show_ip_arp_vrf_netjson_html.j2')
+                sh_ip_ospf_vrf_template = env.get_template('show_ip_ospf_vrf.j2')
+                sh_ip_ospf_vrf_netjson_json_template = env.get_template('show_ip_ospf_vrf_netjson_json.j2')
+                sh_ip_ospf_vrf_netjson_html_template = env.get_template('show_ip_ospf_vrf_netjson_html.j2')
+                sh_ip_ospf_interface_vrf_template = env.get_template('show_ip_ospf_interface_vrf.j2')
+                sh_ip_ospf_interface_vrf_netjson_json_template = env.get_template('show_ip_ospf_interface_vrf_netjson_json.j2')
+                sh_ip_ospf_interface_vrf_netjson_html_template = env.get_template('show_ip_ospf_interface_vrf_netjson_html.j2')
+                sh_ip_ospf_neighbor_detail_vrf_template = env.get_template('show_ip_ospf_neighbor_detail_vrf.j2')
+                sh_ip_ospf_neighbor_detail_vrf_netjson_json_template = env.get_template('show_ip_ospf_neighbor_detail_vrf_netjson_json.j2')
+                sh_ip_ospf_neighbor_detail_vrf_netjson_html_template = env.get_template('show_ip_ospf_neighbor_detail_vrf_netjson_html.j2')
+                sh_ip_route_template = env.get_template('show_ip_route.j2')
+                sh_ip_route_netjson_json_template = env.get_template('show_ip_route_netjson_json.j2')
+                sh_ip_route_netjson_html_template = env.get_template('show_ip_route_netjson_html.j2')
+                directory_names = "Show_VRF"
+                file_names = "show_vrf"  
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.json" % (device.alias,vrf), "w") as fid:
-                                json.dump(self.parsed_show_ip_arp_vrf, fid, indent=4, sort_keys=True)
-                                fid.close()
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_vrf)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_vrf)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_ip_arp_vrf, yml, allow_unicode=True)
-                                yml.close()
+                for filetype in filetype_loop:      
+                    parsed_output_type = sh_vrf_template.render(to_parse_vrf=parsed_show_vrf['vrfs'],filetype_loop_jinja2=filetype)
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_arp_vrf_template.render(to_parse_ip_arp=self.parsed_show_ip_arp_vrf['interfaces'],filetype_loop_jinja2=filetype)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype)
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md --output Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                if os.path.exists("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf.md" % device.alias, "Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_mind_map.html" % device.alias)
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_arp_vrf_statistics_template.render(to_parse_ip_arp=self.parsed_show_ip_arp_vrf,filetype_loop_jinja2=filetype)
+                parsed_output_netjson_json = sh_vrf_netjson_json_template.render(to_parse_vrf=parsed_show_vrf['vrfs'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_vrf_netjson_html_template.render(device_alias = device.alias)
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrfs_%s_statistics.md --output Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                with open("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                            parsed_output_netjson_json = sh_ip_arp_vrf_netjson_json_template.render(to_parse_ip_arp=self.parsed_show_ip_arp_vrf['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_ip_arp_vrf_netjson_html_template.render(device_alias = device.alias)
+                with open("Camelot/Cisco/NXOS/Show_VRF/%s_show_vrf_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)               
+                # ----------------
+                # Store VRF in Device Table in Database
+                # ----------------
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                table.insert(parsed_show_vrf, "parsed_show_vrf")
 
-                            # ----------------
-                            # Store IP ARP VRF in Device Table in Database
-                            # ----------------
+                # For Each VRF
+                for vrf in parsed_show_vrf['vrfs']:
 
-                            table.insert(self.parsed_show_ip_arp_vrf)
+                    # Show IP ARP VRF <VRF> 
+                    with steps.start('Parsing ip arp vrf',continue_=True) as step:
+                        try:
+                            parsed_show_ip_arp_vrf = device.parse("show ip arp vrf %s" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                        # Show IP OSPF VRF <VRF> 
-                        with steps.start('Parsing ip ospf vrf',continue_=True) as step:
-                            try:
-                                self.parsed_show_ip_ospf_vrf = device.parse("show ip ospf vrf %s" % vrf)
-                            except Exception as e:
-                                step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                    with steps.start('Store data',continue_=True) as step:
+
+                        with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.json" % (device.alias,vrf), "w") as fid:
+                            json.dump(parsed_show_ip_arp_vrf, fid, indent=4, sort_keys=True)
+                            fid.close()
+
+                        with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_ip_arp_vrf, yml, allow_unicode=True)
+                            yml.close()
 
-                        with steps.start('Store data',continue_=True) as step:
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_arp_vrf_template.render(to_parse_ip_arp=parsed_show_ip_arp_vrf['interfaces'],filetype_loop_jinja2=filetype)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.json" % (device.alias,vrf), "w") as fid:
-                                json.dump(self.parsed_show_ip_ospf_vrf, fid, indent=4, sort_keys=True)
-                                fid.close()
+                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_mind_map.html" % (device.alias,vrf))
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_ip_ospf_vrf, yml, allow_unicode=True)
-                                yml.close()
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_arp_vrf_statistics_template.render(to_parse_ip_arp=parsed_show_ip_arp_vrf,filetype_loop_jinja2=filetype)
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_ospf_vrf_template.render(to_parse_ip_ospf=self.parsed_show_ip_ospf_vrf['vrf'],filetype_loop_jinja2=filetype)
+                            with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrfs_%s_statistics.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_statistics_mind_map.html" % (device.alias,vrf))
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.md --output Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                        parsed_output_netjson_json = sh_ip_arp_vrf_netjson_json_template.render(to_parse_ip_arp=parsed_show_ip_arp_vrf['interfaces'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_ip_arp_vrf_netjson_html_template.render(device_alias = device.alias)
 
-                            parsed_output_netjson_json = sh_ip_ospf_vrf_netjson_json_template.render(to_parse_ip_ospf=self.parsed_show_ip_ospf_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_ip_ospf_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
+                        with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)               
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)               
+                        with open("Camelot/Cisco/NXOS/Show_IP_ARP_VRF/%s_show_ip_arp_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                        # ----------------
+                        # Store IP ARP VRF in Device Table in Database
+                        # ----------------
 
-                            # ----------------
-                            # Store IP OSPF VRF in Device Table in Database
-                            # ----------------
+                        table.insert(parsed_show_ip_arp_vrf, "parsed_show_ip_arp_vrf")
 
-                            table.insert(self.parsed_show_ip_ospf_vrf)
+                    # Show IP OSPF VRF <VRF> 
+                    with steps.start('Parsing ip ospf vrf',continue_=True) as step:
+                        try:
+                            parsed_show_ip_ospf_vrf = device.parse("show ip ospf vrf %s" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                        # Show IP OSPF Interface VRF <VRF> 
-                        with steps.start('Parsing ip ospf interface vrf',continue_=True) as step:
-                            try:
-                                self.parsed_show_ip_ospf_interface_vrf = device.parse("show ip ospf interface vrf %s" % vrf)
-                            except Exception as e:
-                                step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                    with steps.start('Store data',continue_=True) as step:
 
-                        with steps.start('Store data',continue_=True) as step:
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.json" % (device.alias,vrf), "w") as fid:
+                            json.dump(parsed_show_ip_ospf_vrf, fid, indent=4, sort_keys=True)
+                            fid.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.json" % (device.alias,vrf), "w") as fid:
-                                json.dump(self.parsed_show_ip_ospf_interface_vrf, fid, indent=4, sort_keys=True)
-                                fid.close()
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_ip_ospf_vrf, yml, allow_unicode=True)
+                            yml.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_ip_ospf_interface_vrf, yml, allow_unicode=True)
-                                yml.close()
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_ospf_vrf_template.render(to_parse_ip_ospf=parsed_show_ip_ospf_vrf['vrf'],filetype_loop_jinja2=filetype)
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_ospf_interface_vrf_template.render(to_parse_ip_ospf_interface=self.parsed_show_ip_ospf_interface_vrf['vrf'],filetype_loop_jinja2=filetype)
+                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_mind_map.html" % (device.alias,vrf))
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.md --output Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                        parsed_output_netjson_json = sh_ip_ospf_vrf_netjson_json_template.render(to_parse_ip_ospf=parsed_show_ip_ospf_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_ip_ospf_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
 
-                            parsed_output_netjson_json = sh_ip_ospf_interface_vrf_netjson_json_template.render(to_parse_ip_ospf_interface=self.parsed_show_ip_ospf_interface_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_ip_ospf_interface_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)               
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)               
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_VRF/%s_show_ip_ospf_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                        # ----------------
+                        # Store IP OSPF VRF in Device Table in Database
+                        # ----------------
 
-                            # ----------------
-                            # Store IP OSPF VRF in Device Table in Database
-                            # ----------------
+                        table.insert(parsed_show_ip_ospf_vrf, "parsed_show_ip_ospf_vrf")
 
-                            table.insert(self.parsed_show_ip_ospf_interface_vrf)
+                    # Show IP OSPF Interface VRF <VRF> 
+                    with steps.start('Parsing ip ospf interface vrf',continue_=True) as step:
+                        try:
+                            parsed_show_ip_ospf_interface_vrf = device.parse("show ip ospf interface vrf %s" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                        # Show IP OSPF Neighbor VRF <VRF> 
-                        with steps.start('Parsing ip ospf neighbor detail vrf',continue_=True) as step:
-                            try:
-                                self.parsed_show_ip_ospf_neighbor_detail_vrf = device.parse("show ip ospf neighbor detail vrf %s" % vrf)
-                            except Exception as e:
-                                step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                    with steps.start('Store data',continue_=True) as step:
 
-                        with steps.start('Store data',continue_=True) as step:
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.json" % (device.alias,vrf), "w") as fid:
-                                try:
-                                    json.dump(self.parsed_show_ip_ospf_neighbor_detail_vrf, fid, indent=4, sort_keys=True)
-                                    fid.close()
-                                except Exception as e:
-                                    step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.json" % (device.alias,vrf), "w") as fid:
+                            json.dump(parsed_show_ip_ospf_interface_vrf, fid, indent=4, sort_keys=True)
+                            fid.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_ip_ospf_neighbor_detail_vrf, yml, allow_unicode=True)
-                                yml.close()
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_ip_ospf_interface_vrf, yml, allow_unicode=True)
+                            yml.close()
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_ospf_neighbor_detail_vrf_template.render(to_parse_ip_ospf_neighbor=self.parsed_show_ip_ospf_neighbor_detail_vrf['vrf'],filetype_loop_jinja2=filetype)
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_ospf_interface_vrf_template.render(to_parse_ip_ospf_interface=parsed_show_ip_ospf_interface_vrf['vrf'],filetype_loop_jinja2=filetype)
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.md --output Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_mind_map.html" % (device.alias,vrf))
 
-                            parsed_output_netjson_json = sh_ip_ospf_neighbor_detail_vrf_netjson_json_template.render(to_parse_ip_ospf_neighbor=self.parsed_show_ip_ospf_neighbor_detail_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_ip_ospf_neighbor_detail_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
+                        parsed_output_netjson_json = sh_ip_ospf_interface_vrf_netjson_json_template.render(to_parse_ip_ospf_interface=parsed_show_ip_ospf_interface_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_ip_ospf_interface_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)               
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)               
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Interface_VRF/%s_show_ip_ospf_interface_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
 
-                            # ----------------
-                            # Store IP OSPF VRF in Device Table in Database
-                            # ----------------
+                        # ----------------
+                        # Store IP OSPF VRF in Device Table in Database
+                        # ----------------
+
+                        table.insert(parsed_show_ip_ospf_interface_vrf, "parsed_show_ip_ospf_interface_vrf")
 
-                            table.insert(self.parsed_show_ip_ospf_neighbor_detail_vrf)
+                    # Show IP OSPF Neighbor VRF <VRF> 
+                    with steps.start('Parsing ip ospf neighbor detail vrf',continue_=True) as step:
+                        try:
+                            parsed_show_ip_ospf_neighbor_detail_vrf = device.parse("show ip ospf neighbor detail vrf %s" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                        # Show IP ROUTE VRF <VRF>
-                        with steps.start('Parsing ip route vrf',continue_=True) as step:
+                    with steps.start('Store data',continue_=True) as step:
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.json" % (device.alias,vrf), "w") as fid:
                             try:
-                                self.parsed_show_ip_route_vrf = device.parse("show ip route vrf %s" % vrf)
+                                json.dump(parsed_show_ip_ospf_neighbor_detail_vrf, fid, indent=4, sort_keys=True)
+                                fid.close()
                             except Exception as e:
                                 step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                        with steps.start('Store data',continue_=True) as step:
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_ip_ospf_neighbor_detail_vrf, yml, allow_unicode=True)
+                            yml.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.json" % (device.alias,vrf), "w") as fid:
-                                json.dump(self.parsed_show_ip_route_vrf, fid, indent=4, sort_keys=True)
-                                fid.close()
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_ospf_neighbor_detail_vrf_template.render(to_parse_ip_ospf_neighbor=parsed_show_ip_ospf_neighbor_detail_vrf['vrf'],filetype_loop_jinja2=filetype)
+
+                            with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_mind_map.html" % (device.alias,vrf))
+
+                        parsed_output_netjson_json = sh_ip_ospf_neighbor_detail_vrf_netjson_json_template.render(to_parse_ip_ospf_neighbor=parsed_show_ip_ospf_neighbor_detail_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_ip_ospf_neighbor_detail_vrf_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
+
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)               
+
+                        with open("Camelot/Cisco/NXOS/Show_IP_OSPF_Neighbor_Detail_VRF/%s_show_ip_ospf_neighbor_detail_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
+
+                        # ----------------
+                        # Store IP OSPF VRF in Device Table in Database
+                        # ----------------
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_ip_route_vrf, yml, allow_unicode=True)
-                                yml.close()
-                         
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_ip_route_template.render(to_parse_ip_route=self.parsed_show_ip_route_vrf['vrf'],filetype_loop_jinja2=filetype)
+                        table.insert(parsed_show_ip_ospf_neighbor_detail_vrf, "parsed_show_ip_ospf_neighbor_detail_vrf")
 
-                                with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
+                    # Show IP ROUTE VRF <VRF>
+                    with steps.start('Parsing ip route vrf',continue_=True) as step:
+                        try:
+                            parsed_show_ip_route_vrf = device.parse("show ip route vrf %s" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md" % (device.alias,vrf)):
-                                    os.system("markmap --no-open Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md --output Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                    with steps.start('Store data',continue_=True) as step:
 
-                            parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=self.parsed_show_ip_route_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
+                        with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.json" % (device.alias,vrf), "w") as fid:
+                            json.dump(parsed_show_ip_route_vrf, fid, indent=4, sort_keys=True)
+                            fid.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)
-                                fh.close()              
+                        with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_ip_route_vrf, yml, allow_unicode=True)
+                            yml.close()
+                     
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_ip_route_template.render(to_parse_ip_route=parsed_show_ip_route_vrf['vrf'],filetype_loop_jinja2=filetype)
 
-                            with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                            with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
                                 fh.close()
 
-                            # ----------------
-                            # Store IP Route VRF in Device Table in Database
-                            # ----------------
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md" % (device.alias,vrf)):
+                                mind_maps.add("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_mind_map.html" % (device.alias,vrf))
 
-                            table.insert(self.parsed_show_ip_route_vrf)
+                        parsed_output_netjson_json = sh_ip_route_netjson_json_template.render(to_parse_ip_route=parsed_show_ip_route_vrf['vrf'],filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_ip_route_netjson_html_template.render(device_alias = device.alias)
 
-                        # Show VRF <VRF> Detail 
-                        with steps.start('Parsing vrf vrf detail',continue_=True) as step:
-                            try:
-                                self.parsed_show_vrf_detail = device.parse("show vrf %s detail" % vrf)
-                            except Exception as e:
-                                step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                        with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)
+                            fh.close()              
 
-                        with steps.start('Store data',continue_=True) as step:
+                        with open("Camelot/Cisco/NXOS/Show_IP_Route_VRF/%s_show_ip_route_vrf_%s_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
+                            fh.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.json" % (device.alias,vrf), "w") as fid:
-                                json.dump(self.parsed_show_vrf_detail, fid, indent=4, sort_keys=True)
-                                fid.close()
+                        # ----------------
+                        # Store IP Route VRF in Device Table in Database
+                        # ----------------
 
-                            with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.yaml" % (device.alias,vrf), "w") as yml:
-                                yaml.dump(self.parsed_show_vrf_detail, yml, allow_unicode=True)
-                                yml.close()
+                        table.insert(parsed_show_ip_route_vrf, "parsed_show_ip_route_vrf")
 
-                            for filetype in filetype_loop:
-                                parsed_output_type = sh_vrf_detail_template.render(to_parse_vrf_detail=self.parsed_show_vrf_detail,filetype_loop_jinja2=filetype)
+                    # Show VRF <VRF> Detail 
+                    with steps.start('Parsing vrf vrf detail',continue_=True) as step:
+                        try:
+                            parsed_show_vrf_detail = device.parse("show vrf %s detail" % vrf)
+                        except Exception as e:
+                            step.failed('Could not parse it correctly\n{e}'.format(e=e))
 
-                                with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.%s" % (device.alias,vrf,filetype), "w") as fh:
-                                    fh.write(parsed_output_type)
-                                    fh.close()
-        
-                            if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.md" % (device.alias,vrf)):
-                                os.system("markmap --no-open Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.md --output Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_mind_map.html" % (device.alias,vrf,device.alias,vrf))
+                    with steps.start('Store data',continue_=True) as step:
 
-                            parsed_output_netjson_json = sh_vrf_detail_netjson_json_template.render(to_parse_vrf_detail=self.parsed_show_vrf_detail,filetype_loop_jinja2=filetype,device_alias = device.alias)
-                            parsed_output_netjson_html = sh_vrf_detail_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
+                        with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.json" % (device.alias,vrf), "w") as fid:
+                            json.dump(parsed_show_vrf_detail, fid, indent=4, sort_keys=True)
+                            fid.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_netgraph.json" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_json)               
+                        with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.yaml" % (device.alias,vrf), "w") as yml:
+                            yaml.dump(parsed_show_vrf_detail, yml, allow_unicode=True)
+                            yml.close()
 
-                            with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_netgraph.html" % (device.alias,vrf), "w") as fh:
-                                fh.write(parsed_output_netjson_html)
+                        for filetype in filetype_loop:
+                            parsed_output_type = sh_vrf_detail_template.render(to_parse_vrf_detail=parsed_show_vrf_detail,filetype_loop_jinja2=filetype)
 
-                            # ----------------
-                            # Store IP ARP VRF in Device Table in Database
-                            # ----------------
+                            with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.%s" % (device.alias,vrf,filetype), "w") as fh:
+                                fh.write(parsed_output_type)
+                                fh.close()
+    
+                        if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.md" % (device.alias,vrf)):
+                            mind_maps.add("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail.md" % (device.alias,vrf), "Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_mind_map.html" % (device.alias,vrf))
 
-                            table.insert(self.parsed_show_vrf_detail)
+                        parsed_output_netjson_json = sh_vrf_detail_netjson_json_template.render(to_parse_vrf_detail=parsed_show_vrf_detail,filetype_loop_jinja2=filetype,device_alias = device.alias)
+                        parsed_output_netjson_html = sh_vrf_detail_netjson_html_template.render(device_alias = device.alias,vrf = vrf)
 
-                # Show vrf all detail
-                if self.parsed_show_vrf_all_detail is not None:
-                    sh_vrf_all_detail_template = env.get_template('show_vrf_all_detail.j2')
-                    sh_vrf_all_detail_netjson_json_template = env.get_template('show_vrf_all_detail_netjson_json.j2')
-                    sh_vrf_all_detail_netjson_html_template = env.get_template('show_vrf_all_detail_netjson_html.j2') 
-                    directory_names = "Show_VRF_All_Detail"
-                    file_names = "show_vrf_all_detail"
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_vrf_all_detail)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_vrf_all_detail)
+                        with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_netgraph.json" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_json)               
 
-                    for filetype in filetype_loop:      
-                        parsed_output_type = sh_vrf_all_detail_template.render(to_parse_vrf=self.parsed_show_vrf_all_detail,filetype_loop_jinja2=filetype)
+                        with open("Camelot/Cisco/NXOS/Show_VRF_Detail/%s_show_vrf_%s_detail_netgraph.html" % (device.alias,vrf), "w") as fh:
+                            fh.write(parsed_output_netjson_html)
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                        # ----------------
+                        # Store IP ARP VRF in Device Table in Database
+                        # ----------------
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail.md --output Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_mind_map.html" % (device.alias,device.alias))
+                        table.insert(parsed_show_vrf_detail, "parsed_show_vrf_detail")
 
-                    parsed_output_netjson_json = sh_vrf_all_detail_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf_all_detail,filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_vrf_all_detail_netjson_html_template.render(device_alias = device.alias)
+            # Show vrf all detail
+            if parsed_show_vrf_all_detail is not None:
+                sh_vrf_all_detail_template = env.get_template('show_vrf_all_detail.j2')
+                sh_vrf_all_detail_netjson_json_template = env.get_template('show_vrf_all_detail_netjson_json.j2')
+                sh_vrf_all_detail_netjson_html_template = env.get_template('show_vrf_all_detail_netjson_html.j2') 
+                directory_names = "Show_VRF_All_Detail"
+                file_names = "show_vrf_all_detail"
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_vrf_all_detail)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_vrf_all_detail)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                for filetype in filetype_loop:      
+                    parsed_output_type = sh_vrf_all_detail_template.render(to_parse_vrf=parsed_show_vrf_all_detail,filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
 
-                    # ----------------
-                    # Store VRF Detail in Device Table in Databse
-                    # ----------------
+                if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail.md" % device.alias, "Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_mind_map.html" % device.alias)
 
-                    table.insert(self.parsed_show_vrf_all_detail)
+                parsed_output_netjson_json = sh_vrf_all_detail_netjson_json_template.render(to_parse_vrf=parsed_show_vrf_all_detail,filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_vrf_all_detail_netjson_html_template.render(device_alias = device.alias)
 
-                # Show vrf all interface
-                if self.parsed_show_vrf_all_interface is not None:
-                    sh_vrf_all_interface_template = env.get_template('show_vrf_all_interface.j2')
-                    sh_vrf_all_interface_netjson_json_template = env.get_template('show_vrf_all_interface_netjson_json.j2')
-                    sh_vrf_all_interface_netjson_html_template = env.get_template('show_vrf_all_interface_netjson_html.j2') 
+                with open("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
 
-                    directory_names = "Show_VRF_All_Interface"
-                    file_names = "show_vrf_all_interface"
-                    self.save_to_json_file(device, directory_names, file_names, self.parsed_show_vrf_all_interface)
-                    self.save_to_yaml_file(device, directory_names, file_names, self.parsed_show_vrf_all_interface)
+                with open("Camelot/Cisco/NXOS/Show_VRF_All_Detail/%s_show_vrf_all_detail_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
 
-                    for filetype in filetype_loop:      
-                        parsed_output_type = sh_vrf_all_interface_template.render(to_parse_vrf=self.parsed_show_vrf_all_interface,filetype_loop_jinja2=filetype)
+                # ----------------
+                # Store VRF Detail in Device Table in Databse
+                # ----------------
 
-                        self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
+                table.insert(parsed_show_vrf_all_detail, "parsed_show_vrf_all_detail")
 
-                    if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface.md" % device.alias):
-                        os.system("markmap --no-open Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface.md --output Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_mind_map.html" % (device.alias,device.alias))
+            # Show vrf all interface
+            if parsed_show_vrf_all_interface is not None:
+                sh_vrf_all_interface_template = env.get_template('show_vrf_all_interface.j2')
+                sh_vrf_all_interface_netjson_json_template = env.get_template('show_vrf_all_interface_netjson_json.j2')
+                sh_vrf_all_interface_netjson_html_template = env.get_template('show_vrf_all_interface_netjson_html.j2') 
 
-                    parsed_output_netjson_json = sh_vrf_all_interface_netjson_json_template.render(to_parse_vrf=self.parsed_show_vrf_all_interface,filetype_loop_jinja2=filetype,device_alias = device.alias)
-                    parsed_output_netjson_html = sh_vrf_all_interface_netjson_html_template.render(device_alias = device.alias)
+                directory_names = "Show_VRF_All_Interface"
+                file_names = "show_vrf_all_interface"
+                self.save_to_json_file(device, directory_names, file_names, parsed_show_vrf_all_interface)
+                self.save_to_yaml_file(device, directory_names, file_names, parsed_show_vrf_all_interface)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_netgraph.json" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_json)               
+                for filetype in filetype_loop:      
+                    parsed_output_type = sh_vrf_all_interface_template.render(to_parse_vrf=parsed_show_vrf_all_interface,filetype_loop_jinja2=filetype)
 
-                    with open("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_netgraph.html" % device.alias, "w") as fh:
-                        fh.write(parsed_output_netjson_html)
+                    self.save_to_specified_file_type(device, directory_names, file_names, parsed_output_type, filetype) 
 
-                    # ----------------
-                    # Store VRF Interface in Device Table in Databse
-                    # ----------------
+                if os.path.exists("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface.md" % device.alias):
+                    mind_maps.add("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface.md" % device.alias, "Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_mind_map.html" % device.alias)
 
-                    table.insert(self.parsed_show_vrf_all_interface)
+                parsed_output_netjson_json = sh_vrf_all_interface_netjson_json_template.render(to_parse_vrf=parsed_show_vrf_all_interface,filetype_loop_jinja2=filetype,device_alias = device.alias)
+                parsed_output_netjson_html = sh_vrf_all_interface_netjson_html_template.render(device_alias = device.alias)
 
-        db.close()
-        # Goodbye Banner
-        print(Panel.fit(Text.from_markup(FINISHED)))    
+                with open("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_netgraph.json" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_json)               
+
+                with open("Camelot/Cisco/NXOS/Show_VRF_All_Interface/%s_show_vrf_all_interface_netgraph.html" % device.alias, "w") as fh:
+                    fh.write(parsed_output_netjson_html)
+
+                # ----------------
+                # Store VRF Interface in Device Table in Databse
+                # ----------------
+
+                table.insert(parsed_show_vrf_all_interface, "parsed_show_vrf_all_interface")
 
 # ----------------
 # Save Functions 
 # ----------------
     def save_to_json_file(self, device, directory, file_names, content):
         file_path = "Camelot/Cisco/NXOS/{}/{}_{}.json".format(directory, device.alias, file_names)
-        with open(file_path, "w") as json_file:
+        with timings.timed("write", device.alias, file_path), open(file_path, "w") as json_file:
             json.dump(content, json_file, indent=4, sort_keys=True)
-            json_file.close()
     
     def save_to_yaml_file(self, device, directory, file_names, content):
         file_path = "Camelot/Cisco/NXOS/{}/{}_{}.yaml".format(directory, device.alias, file_names)
-        with open(file_path, "w") as yml_file:
+        with timings.timed("write", device.alias, file_path), open(file_path, "w") as yml_file:
             yaml.dump(content, yml_file, allow_unicode=True)
-            yml_file.close()
     
     def save_to_specified_file_type(self, device, directory, file_names, content, file_type):
         file_path = "Camelot/Cisco/NXOS/{}/{}_{}.{}".format(directory, device.alias, file_names, file_type)
-        with open(file_path, "w") as opened_file:
-            opened_file.write(content)
-            opened_file.close()
\ No newline at end of file
+        with timings.timed("write", device.alias, file_path), open(file_path, "w") as opened_file:
+            opened_file.write(content)
\ No newline at end of file
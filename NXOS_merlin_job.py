@@ -3,13 +3,33 @@ To run the job:
 
 $ pyats run job NXOS_merlin_job.py --testbed-file testbed/testbed_nxos.yaml
 
+Collect up to N devices concurrently:
+
+$ pyats run job NXOS_merlin_job.py --testbed-file testbed/testbed_nxos.yaml --max-workers 8
+
 '''
 
 import os
+import argparse
 from genie.testbed import load
 
+# ----------------
+# Custom job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--max-workers', dest='max_workers', type=int, default=1,
+                    help='number of devices collected concurrently')
+parser.add_argument('--max-connections', dest='max_connections', type=int, default=10,
+                    help='number of devices connected to concurrently')
+parser.add_argument('--connect-timeout', dest='connect_timeout', type=int, default=120,
+                    help='seconds to wait for each device to connect before skipping it')
+parser.add_argument('--timing-dir', dest='timing_dir',
+                    help='folder of the stage timing report and Prometheus textfile (default: Camelot/Cisco/NXOS/Timing)')
+
 def main(runtime):
 
+    args, _ = parser.parse_known_args()
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -22,8 +42,12 @@ def main(runtime):
         # Use the one provided
         testbed = runtime.testbed
 
+    # Only override the timing default when it was given
+    timing_args = {'timing_dir': args.timing_dir} if args.timing_dir is not None else {}
+
     # Find the location of the script in relation to the job file
     testscript = os.path.join(os.path.dirname(__file__), 'NXOS_merlin.py')
 
     # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
\ No newline at end of file
+    runtime.tasks.run(testscript=testscript, testbed=testbed, max_workers=args.max_workers,
+                      max_connections=args.max_connections, connect_timeout=args.connect_timeout, **timing_args)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from requests_ntlm import HttpNtlmAuth
+from mind_map import mind_maps
 
 #Enter your SharePoint site and target library
 sharePointUrl = 'https://mydomain.com'
@@ -20,8 +21,9 @@ if hasattr(self, 'parsed_show_version'):
         with open("Camelot/Cisco/IOS_XE/Show_Version/%s_show_version.%s" % (device.alias,filetype), "w") as fh:
             fh.write(parsed_output_type)
 
-        if os.path.exists("Camelot/Cisco/IOS_XE/Show_Version/%s_show_version.md" % device.alias):
-            os.system("markmap --no-open Camelot/Cisco/IOS_XE/Show_Version/%s_show_version.md --output Camelot/Cisco/IOS_XE/Show_Version/%s_show_version_mind_map.html" % (device.alias,device.alias))
+    # Built with the script's other mind maps by mind_maps.build()
+    if os.path.exists("Camelot/Cisco/IOS_XE/Show_Version/%s_show_version.md" % device.alias):
+        mind_maps.add("Camelot/Cisco/IOS_XE/Show_Version/%s_show_version.md" % device.alias, "Camelot/Cisco/IOS_XE/Show_Version/%s_show_version_mind_map.html" % device.alias)
     
     ##############
     # SHAREPOINT #
@@ -0,0 +1,433 @@
+# ----------------
+# Pipeline benchmark suite
+# ----------------
+# Offline throughput and peak memory of the collection pipeline after parsing: the
+# feature registry's table, template and NetJSON renders and save_to_* writers, Grail
+# inserts, and the ISE and Elastic HTTP paths against local stub servers. The parsed data
+# is synthetic and sized for a large fleet (100k-entry MAC table, 500k routes, 5k
+# interfaces, 200k ISE endpoints at --scale 1), or recorded: the JSON a previous run wrote
+# under --recorded, scaled up to the same sizes.
+#
+# Every case is compared with the stored baseline; a throughput drop or a peak memory
+# increase beyond --threshold percent is a regression, and the exit status is 1.
+#
+# Run from the repository root:
+#   python benchmarks/pipeline.py --scale 0.1
+#   python benchmarks/pipeline.py --save-baseline
+#   python benchmarks/pipeline.py --recorded Camelot/Cisco/IOS_XE --only store_mac_table,grail_insert
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feature_engine import FeatureEngine
+from render_cache import RenderManifest
+from netjson_builder import NetJSONBuilder
+from mind_map import mind_maps
+from grail import open_grail
+from elastic_documents import elastic_documents, explode_maps
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--scale', type=float, default=1.0, help='fraction of the full fleet sizes')
+parser.add_argument('--only', help='comma separated cases to run')
+parser.add_argument('--repeat', type=int, default=1, help='timed runs per case, the fastest is kept')
+parser.add_argument('--no-memory', dest='memory', action='store_false', help='skip the tracemalloc pass measuring peak memory')
+parser.add_argument('--recorded', help='folder of parsed JSON written by a run (such as Camelot/Cisco/IOS_XE) to scale up instead of synthetic data')
+parser.add_argument('--registry', default='registry/ios_xe.yaml')
+parser.add_argument('--baseline', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json'))
+parser.add_argument('--save-baseline', dest='save_baseline', action='store_true', help='store this run as the baseline')
+parser.add_argument('--threshold', type=float, default=10.0, help='percent change reported as a regression')
+parser.add_argument('--output', help='write the results as JSON')
+
+# Entries of each dataset at --scale 1
+fleet = {
+    "mac_table": 100000,
+    "routes": 500000,
+    "interfaces": 5000,
+    "ise_endpoints": 200000,
+    # Endpoints whose details are requested one by one, as ISE_merlin does
+    "ise_details": 5000,
+}
+
+# Dataset -> the registry feature whose outputs render it, and the map its size is counted in
+features = {
+    "mac_table": ("parsed_show_mac_address_table", explode_maps["show_mac_address_table"][0]),
+    "routes": ("parsed_show_ip_route", explode_maps["show_ip_route"][0]),
+    "interfaces": ("parsed_show_int", ()),
+}
+
+# ----------------
+# Synthetic data, shaped like Genie's parsers
+# ----------------
+def mac(number: int) -> str:
+    return "0050.%04x.%04x" % (number >> 16 & 0xffff, number & 0xffff)
+
+def synthetic_mac_table(entries: int) -> dict:
+    vlans = {}
+    for number in range(entries):
+        vlan = str(number % 4094 + 1)
+        interface = "GigabitEthernet%d/0/%d" % (number // 48 % 8 + 1, number % 48 + 1)
+        vlans.setdefault(vlan, {"vlan": int(vlan), "mac_addresses": {}})["mac_addresses"][mac(number)] = {
+            "mac_address": mac(number),
+            "interfaces": {interface: {"interface": interface, "entry_type": "dynamic"}},
+        }
+    return {"mac_table": {"vlans": vlans}, "total_mac_addresses": entries}
+
+def synthetic_routes(entries: int) -> dict:
+    routes = {}
+    for number in range(entries):
+        prefix = "10.%d.%d.0/24" % (number >> 8 & 0xff, number & 0xff) if number < 65536 else "%d.%d.%d.0/24" % (11 + (number >> 16), number >> 8 & 0xff, number & 0xff)
+        routes[prefix] = {
+            "route": prefix,
+            "active": True,
+            "metric": number % 100,
+            "route_preference": 110,
+            "source_protocol": "ospf",
+            "source_protocol_codes": "O",
+            "next_hop": {"next_hop_list": {1: {
+                "index": 1,
+                "next_hop": "192.168.%d.%d" % (number % 4, number % 250 + 1),
+                "outgoing_interface": "TenGigabitEthernet1/1/%d" % (number % 4 + 1),
+                "updated": "1w2d",
+            }}},
+        }
+    return {"vrf": {"default": {"address_family": {"ipv4": {"routes": routes}}}}}
+
+def synthetic_interfaces(entries: int) -> dict:
+    interfaces = {}
+    for number in range(entries):
+        name = "GigabitEthernet%d/%d/%d" % (number // 480 + 1, number // 48 % 10, number % 48 + 1)
+        interfaces[name] = {
+            "description": "Access port %d" % number,
+            "type": "Gigabit Ethernet",
+            "connected": number % 3 != 0,
+            "enabled": True,
+            "bandwidth": 1000000,
+            "port_speed": "1000mb/s",
+            "duplex_mode": "full",
+            "ipv4": {"10.%d.%d.1/24" % (number >> 8 & 0xff, number & 0xff): {"ip": "10.%d.%d.1" % (number >> 8 & 0xff, number & 0xff), "prefix_length": "24"}},
+            "line_protocol": "up",
+            "oper_status": "up",
+            "mac_address": mac(number),
+            "media_type": "10/100/1000BaseTX",
+            "delay": 10,
+            "encapsulations": {"encapsulation": "arpa"},
+            "keepalive": 10,
+            "mtu": 1500,
+            "port_channel": {"port_channel_member": False},
+            "counters": {"in_crc_errors": 0, "in_errors": number % 7, "out_errors": 0, "in_pkts": number * 1000, "out_pkts": number * 900},
+            "queues": {"queue_strategy": "fifo", "input_queue_drops": 0, "total_output_drop": number % 11},
+        }
+    return interfaces
+
+synthetic = {
+    "mac_table": synthetic_mac_table,
+    "routes": synthetic_routes,
+    "interfaces": synthetic_interfaces,
+}
+
+# ----------------
+# Recorded data, scaled up
+# ----------------
+def large_map(data, path):
+    """The map at path, walking every key at a "*" (the first one is enough here)"""
+    for segment in path:
+        if not isinstance(data, dict) or not data:
+            return None
+        data = next(iter(data.values())) if segment == "*" else data.get(segment)
+    return data if isinstance(data, dict) else None
+
+def entry_count(data, path) -> int:
+    """Entries of the maps at path, summed over every key at a "*" segment"""
+    if not isinstance(data, dict):
+        return 0
+    if not path:
+        return len(data)
+    if path[0] == "*":
+        return sum(entry_count(value, path[1:]) for value in data.values())
+    return entry_count(data.get(path[0]), path[1:])
+
+def scale_up(data: dict, path: tuple, entries: int) -> dict:
+    """Copy entries of the (first) map at path, with suffixed keys, until the maps at path
+    hold entries"""
+    target = large_map(data, path)
+    if not target:
+        return data
+    missing = entries - entry_count(data, path)
+    originals = list(target.items())
+    copy = 1
+    while missing > 0:
+        for key, value in originals[:missing]:
+            target["%s-%d" % (key, copy)] = value
+        missing -= len(originals[:missing])
+        copy += 1
+    return data
+
+def recorded_data(engine, root: str, dataset: str, entries: int):
+    """The first JSON a run wrote for the dataset's feature, scaled up; None when absent"""
+    feature_name, path = features[dataset]
+    feature = next(feature for feature in engine.registry.features if feature['name'] == feature_name)
+    directory = os.path.join(root, feature['directory'])
+    suffix = "_%s.json" % feature['file_name']
+    if not os.path.isdir(directory):
+        return None
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith(suffix):
+            with open(os.path.join(directory, file_name)) as recorded:
+                return scale_up(json.load(recorded), path, entries)
+    return None
+
+# ----------------
+# Stub servers, in their own process so they do not compete for this one's GIL
+# ----------------
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, document, headers=()):
+        body = json.dumps(document).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for header in headers:
+            self.send_header(*header)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        base = "http://%s:%s" % self.server.server_address[:2]
+        if url.path == "/":
+            # Elasticsearch product check
+            self.reply({"version": {"number": "7.17.0", "build_flavor": "default"}, "tagline": "You Know, for Search"},
+                       [("X-Elastic-Product", "Elasticsearch")])
+        elif url.path.startswith("/ers/config/endpoint/"):
+            number = int(url.path.rsplit("-", 1)[1])
+            self.reply({"ERSEndPoint": {"id": "ep-%d" % number, "name": mac(number), "mac": mac(number),
+                                        "groupId": "group-%d" % (number % 20), "staticGroupAssignment": False,
+                                        "profileId": "profile-%d" % (number % 50), "staticProfileAssignment": False}})
+        else:
+            # /ers/config/<total>/endpoint?size=&page=: the listing's size is in its path
+            total = int(url.path.split("/")[3])
+            query = parse_qs(url.query)
+            size, page = int(query["size"][0]), int(query["page"][0])
+            resources = [{"id": "ep-%d" % number, "name": mac(number), "link": {"href": "%s/ers/config/endpoint/ep-%d" % (base, number)}}
+                         for number in range((page - 1) * size, min(total, page * size))]
+            self.reply({"SearchResult": {"total": total, "resources": resources}})
+
+    def do_POST(self):
+        # Elasticsearch _bulk: every document accepted
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.reply({"took": 1, "errors": False, "items": []}, [("X-Elastic-Product", "Elasticsearch")])
+
+    do_PUT = do_POST
+
+def serve(ports):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    ports.put(server.server_port)
+    server.serve_forever()
+
+# ----------------
+# Cases
+# ----------------
+class BenchmarkDevice:
+    """What the feature engine reads from a testbed device"""
+    alias = "bench-device"
+    name = "bench-device"
+    platform = "cat9k"
+
+cases = {}
+
+def case(name: str, dataset: str, unit: str):
+    def register(function):
+        cases[name] = (dataset, unit, function)
+        return function
+    return register
+
+def store(context, dataset: str) -> int:
+    """The real store path of a registry feature: writers, renders and mind maps"""
+    feature_name, path = features[dataset]
+    feature = next(feature for feature in context['engine'].registry.features if feature['name'] == feature_name)
+    context['engine'].store_feature(BenchmarkDevice(), feature, context['data'][dataset])
+    mind_maps.build()
+    return entry_count(context['data'][dataset], path)
+
+@case("store_mac_table", "mac_table", "entries")
+def store_mac_table(context):
+    return store(context, "mac_table")
+
+@case("store_routes", "routes", "routes")
+def store_routes(context):
+    return store(context, "routes")
+
+@case("store_interfaces", "interfaces", "interfaces")
+def store_interfaces(context):
+    return store(context, "interfaces")
+
+@case("netjson_routes", "routes", "routes")
+def netjson_routes(context):
+    graph = NetJSONBuilder.build('show_ip_route_netjson', context['data']['routes']['vrf'], BenchmarkDevice.alias)
+    graph.write(os.path.join(context['output'], "netjson_routes.json"))
+    return entry_count(context['data']['routes'], features['routes'][1])
+
+@case("writers_mac_table", "mac_table", "entries")
+def writers_mac_table(context):
+    engine = context['engine']
+    engine.save_to_json_file(BenchmarkDevice(), "Show_MAC_Address_Table", "writers", context['data']['mac_table'])
+    engine.save_to_yaml_file(BenchmarkDevice(), "Show_MAC_Address_Table", "writers", context['data']['mac_table'])
+    return entry_count(context['data']['mac_table'], features['mac_table'][1])
+
+@case("grail_insert", "interfaces", "documents")
+def grail_insert(context):
+    grail = open_grail(os.path.join(context['output'], "Grail_DB_%d" % time.perf_counter_ns()))
+    table = grail.table(BenchmarkDevice.alias)
+    interfaces = context['data']['interfaces']
+    for name, interface in interfaces.items():
+        table.insert({name: interface}, "parsed_show_int")
+    grail.close()
+    return len(interfaces)
+
+@case("elastic_bulk", "mac_table", "documents")
+def elastic_bulk(context):
+    from elasticsearch import Elasticsearch
+    from elastic_sink import BulkSink
+    sink = BulkSink(Elasticsearch(context['stub']))
+    for document in elastic_documents("show_mac_address_table", context['data']['mac_table'], exploded=["show_mac_address_table"]):
+        sink.index("bench_show_mac_address_table", document)
+    stats = sink.close()
+    return stats.documents
+
+def ise_client(context, total: int):
+    from ise_client import ERSClient
+    client = ERSClient("127.0.0.1", "bench", "bench", rate=0)
+    client.base_url = "%s/ers/config/%d" % (context['stub'], total)
+    return client
+
+@case("ise_listing", "ise_endpoints", "endpoints")
+def ise_listing(context):
+    with ise_client(context, context['sizes']['ise_endpoints']) as client:
+        return sum(len(page.resources) for page in client.pages("endpoint", details=False))
+
+@case("ise_details", "ise_details", "endpoints")
+def ise_details(context):
+    with ise_client(context, context['sizes']['ise_details']) as client:
+        return sum(len(page.details) for page in client.pages("endpoint"))
+
+# ----------------
+# Runner
+# ----------------
+def measure(function, context, repeat: int, memory: bool):
+    best = None
+    for attempt in range(max(1, repeat)):
+        started = time.perf_counter()
+        items = function(context)
+        seconds = time.perf_counter() - started
+        best = seconds if best is None else min(best, seconds)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        function(context)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return items, best, peak
+
+def compare(result: dict, baseline: dict, threshold: float):
+    """Percent changes of throughput and peak memory, and whether either regressed"""
+    if not baseline:
+        return None, None, False
+    throughput = 100.0 * (result['throughput'] / baseline['throughput'] - 1) if baseline.get('throughput') else None
+    memory = 100.0 * (result['peak_bytes'] / baseline['peak_bytes'] - 1) if result.get('peak_bytes') and baseline.get('peak_bytes') else None
+    regressed = (throughput is not None and throughput < -threshold) or (memory is not None and memory > threshold)
+    return throughput, memory, regressed
+
+def delta(value) -> str:
+    return "%+.1f%%" % value if value is not None else "-"
+
+def main():
+    args = parser.parse_args()
+    selected = args.only.split(",") if args.only else list(cases)
+    unknown = [name for name in selected if name not in cases]
+    if unknown:
+        parser.error("unknown case(s) %s; cases: %s" % (", ".join(unknown), ", ".join(cases)))
+
+    sizes = {dataset: max(1, int(entries * args.scale)) for dataset, entries in fleet.items()}
+    output = tempfile.mkdtemp(prefix="merlin_bench_")
+    engine = FeatureEngine(args.registry)
+    engine.registry.root = output
+    engine.renders = RenderManifest(output, enabled=False)
+    for feature in engine.registry.features:
+        os.makedirs(os.path.join(output, feature['directory']), exist_ok=True)
+
+    context = {"engine": engine, "output": output, "sizes": sizes, "data": {}, "sources": {}}
+    for name in selected:
+        dataset = cases[name][0]
+        if dataset in synthetic and dataset not in context['data']:
+            data = recorded_data(engine, args.recorded, dataset, sizes[dataset]) if args.recorded else None
+            context['sources'][dataset] = "recorded" if data is not None else "synthetic"
+            context['data'][dataset] = data if data is not None else synthetic[dataset](sizes[dataset])
+
+    ports = multiprocessing.Queue()
+    stub = multiprocessing.Process(target=serve, args=(ports,), daemon=True)
+    stub.start()
+    context['stub'] = "http://127.0.0.1:%d" % ports.get(timeout=30)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('scale') != args.scale:
+            print("Baseline %s was recorded at --scale %s, not compared" % (args.baseline, baseline.get('scale')))
+            baseline = {}
+
+    results = {}
+    try:
+        for name in selected:
+            dataset, unit, function = cases[name]
+            items, seconds, peak = measure(function, context, args.repeat, args.memory)
+            results[name] = {"dataset": dataset, "source": context['sources'].get(dataset, "stub"), "items": items, "unit": unit,
+                             "seconds": seconds, "throughput": items / seconds if seconds else 0.0, "peak_bytes": peak}
+    finally:
+        stub.terminate()
+        shutil.rmtree(output, ignore_errors=True)
+
+    print("scale %s, Python %s, %s CPUs" % (args.scale, platform.python_version(), os.cpu_count()))
+    print("%-20s %10s %-10s %9s %12s %10s %10s %10s" % ("case", "items", "source", "seconds", "items/s", "peak MiB", "d items/s", "d memory"))
+    regressions = []
+    for name, result in results.items():
+        throughput, memory, regressed = compare(result, baseline.get('cases', {}).get(name), args.threshold)
+        if regressed:
+            regressions.append(name)
+        print("%-20s %10d %-10s %9.2f %12.0f %10s %10s %10s%s" % (
+            name, result['items'], result['source'], result['seconds'], result['throughput'],
+            "%.1f" % (result['peak_bytes'] / 1048576.0) if result['peak_bytes'] is not None else "-",
+            delta(throughput), delta(memory), "  REGRESSION" if regressed else ""))
+
+    report = {"scale": args.scale, "python": platform.python_version(), "cpus": os.cpu_count(), "cases": results}
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+    if args.save_baseline:
+        # Cases not run this time keep their previous baseline
+        if baseline:
+            report['cases'] = dict(baseline.get('cases', {}), **results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=4)
+        print("Baseline saved to %s" % args.baseline)
+    if regressions:
+        print("Regressed beyond %.0f%%: %s" % (args.threshold, ", ".join(regressions)))
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
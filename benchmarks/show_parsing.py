@@ -0,0 +1,140 @@
+# ----------------
+# Show command parsing benchmark
+# ----------------
+# Wall time of collecting show commands from a fleet of simulated devices, parsing on the
+# device threads (device.parse) against executing on the device threads and parsing in a
+# parse_pool.ParsePool. Devices answer after --latency seconds with a synthetic
+# "show mac address-table" of --entries lines; the output is parsed by a regex parser of
+# the same shape as Genie's, or by Genie itself with --genie when it is installed.
+#
+# Run from the repository root:
+#   python benchmarks/show_parsing.py
+#   python benchmarks/show_parsing.py --devices 16 --max-workers 16 --parse-workers 8 --genie
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli_archive import OfflineSteps
+from general_functionalities import ParseShowCommandFunction, ParallelDeviceFunction
+from parse_pool import ParsePool, parse_output
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--devices', type=int, default=8)
+parser.add_argument('--commands', type=int, default=6, help='show commands per device')
+parser.add_argument('--entries', type=int, default=20000, help='MAC table lines per command output')
+parser.add_argument('--latency', type=float, default=0.2, help='seconds each command takes on the device')
+parser.add_argument('--max-workers', dest='max_workers', type=int, default=8, help='device threads')
+parser.add_argument('--parse-workers', dest='parse_workers', type=int, default=os.cpu_count() or 1)
+parser.add_argument('--genie', action='store_true', help="parse with Genie's iosxe parser")
+
+command = "show mac address-table"
+
+mac_line = re.compile(r"^\s*(?P<vlan>\d+)\s+(?P<mac>\S+)\s+(?P<type>\S+)\s+(?P<port>\S+)$")
+
+# Like Genie's parsers, every line is tried against the patterns of the lines that may
+# precede the one it matches
+other_lines = [re.compile(pattern) for pattern in (
+    r"^Total +Mac +Addresses +for +this +criterion: +(?P<total>\d+)$",
+    r"^(?P<vlan>All|\d+) +(?P<mac>[0-9a-f.]+) +STATIC +(?P<port>CPU)$",
+    r"^Multicast +Entries$",
+    r"^(?P<vlan>\d+) +(?P<mac>[0-9a-f.]+) +(?P<type>IGMP|igmp) +(?P<ports>(\S+,)*\S+)$",
+    r"^ +(?P<ports>(\S+,)*\S+)$",
+    r"^(?P<vlan>\d+) +(?P<mac>[0-9a-f.]+) +(?P<type>\S+) +(?P<protocols>\S+) +(?P<port>\S+) *$",
+    r"^(?P<vlan>\d+) +(?P<mac>[0-9a-f.]+) +(?P<type>\S+) +(?P<learn>Yes|No) +(?P<age>\d+|-) +(?P<port>\S+)$",
+    r"^(?P<vlan>\d+) +(?P<mac>[0-9a-f.]+) +(?P<type>\S+) +(?P<port>Drop|Router|Switch|Vl\d+)$",
+)]
+
+def mac_table_output(entries: int) -> str:
+    lines = ["          Mac Address Table", "-------------------------------------------", "",
+             "Vlan    Mac Address       Type        Ports", "----    -----------       --------    -----"]
+    for entry in range(entries):
+        lines.append("%4d    %04x.%04x.%04x    DYNAMIC     Gi1/0/%d" % (entry % 4094 + 1, 0x0050, entry >> 16, entry & 0xffff, entry % 48 + 1))
+    lines.append("Total Mac Addresses for this criterion: %d" % entries)
+    return "\n".join(lines)
+
+def regex_parse(os_name, platform, command, output):
+    """Genie's mac_table structure, built line by line with a regex like its parsers"""
+    vlans = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if any(pattern.match(line) for pattern in other_lines):
+            continue
+        match = mac_line.match(line)
+        if match:
+            group = match.groupdict()
+            vlan = vlans.setdefault(group['vlan'], {"vlan": int(group['vlan']), "mac_addresses": {}})
+            vlan["mac_addresses"][group['mac']] = {
+                "mac_address": group['mac'],
+                "interfaces": {group['port']: {"interface": group['port'], "entry_type": group['type'].lower()}},
+            }
+    return {"mac_table": {"vlans": vlans}}
+
+class SimulatedDevice:
+    """Answers every command with the same output after latency seconds"""
+    def __init__(self, alias, output, latency, parser):
+        self.alias = alias
+        self.os = "iosxe"
+        self.platform = None
+        self.output = output
+        self.latency = latency
+        self.parser = parser
+
+    def execute(self, command):
+        # The session is blocked on the network, not on the GIL
+        time.sleep(self.latency)
+        return self.output
+
+    def parse(self, command):
+        return self.parser(self.os, self.platform, command, self.execute(command))
+
+def collect(devices, commands, max_workers, pool=None):
+    steps = OfflineSteps()
+
+    def collect_device(step, device):
+        if pool is None:
+            for command_name in commands:
+                ParseShowCommandFunction.parse_show_command(steps, device, command_name)
+        else:
+            ParseShowCommandFunction.parse_show_commands(steps, device, commands, pool)
+
+    started = time.perf_counter()
+    ParallelDeviceFunction.run_per_device(steps, devices, collect_device, max_workers)
+    return time.perf_counter() - started, len(steps.failures)
+
+def main():
+    args = parser.parse_args()
+    parse = parse_output if args.genie else regex_parse
+    output = mac_table_output(args.entries)
+    devices = [SimulatedDevice("device%d" % number, output, args.latency, parse) for number in range(args.devices)]
+    # Distinct command names so every command is parsed; the output is the same
+    commands = ["%s | exclude %d" % (command, number) if number else command for number in range(args.commands)]
+    if args.genie:
+        # Genie only knows the plain command
+        commands = [command] * args.commands
+
+    started = time.perf_counter()
+    parse(devices[0].os, devices[0].platform, command, output)
+    parse_seconds = time.perf_counter() - started
+
+    results = [("parse on device threads", collect(devices, commands, args.max_workers))]
+    pool = ParsePool(args.parse_workers, parser=parse)
+    try:
+        # Start the worker processes outside of the timing
+        pool._executor.submit(int).result()
+        results.append(("parse pool, %d processes" % pool.max_workers, collect(devices, commands, args.max_workers, pool)))
+    finally:
+        pool.close()
+
+    print("%d devices x %d commands, %.2fs latency, %d entries (%.0f ms to parse one), %d device threads, %s parser"
+          % (args.devices, len(commands), args.latency, args.entries, parse_seconds * 1000, args.max_workers, "Genie" if args.genie else "regex"))
+    print("%-32s %10s %10s %10s" % ("", "wall (s)", "speedup", "failures"))
+    baseline = results[0][1][0]
+    for name, (seconds, failures) in results:
+        print("%-32s %10.2f %9.1fx %10d" % (name, seconds, baseline / seconds, failures))
+
+if __name__ == '__main__':
+    main()
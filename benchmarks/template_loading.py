@@ -0,0 +1,71 @@
+# ----------------
+# Template loading benchmark
+# ----------------
+# Startup and first-render latency of the Jinja2 templates, with and without the
+# shared bytecode-cached environments from template_loader.
+#
+# Run from the repository root:
+#   python benchmarks/template_loading.py
+#   python benchmarks/template_loading.py --template-dir templates/cisco/nxos
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jinja2 import Environment, FileSystemLoader
+import template_loader
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--template-dir', dest='template_dir', default='templates/cisco/ios_xe')
+parser.add_argument('--render', default='show_version.j2', help='template used for the first-render timing')
+
+def load_all(env):
+    started = time.perf_counter()
+    count = template_loader.precompile(env)
+    return count, time.perf_counter() - started
+
+def first_render(env, template_name):
+    started = time.perf_counter()
+    try:
+        env.get_template(template_name).render(filetype_loop_jinja2="csv")
+    except Exception:
+        # Most templates need parsed device data; compile time is what is measured here
+        pass
+    return time.perf_counter() - started
+
+def fresh_environment(template_dir):
+    template_loader._environments.clear()
+    return template_loader.template_environment(template_dir)
+
+def main():
+    args = parser.parse_args()
+    cache_dir = tempfile.mkdtemp(prefix="merlin_jinja2_")
+    template_loader.bytecode_cache_dir = cache_dir
+    results = []
+
+    try:
+        env = Environment(loader=FileSystemLoader(args.template_dir))
+        results.append(("no bytecode cache", load_all(env), first_render(Environment(loader=FileSystemLoader(args.template_dir)), args.render)))
+
+        cold_render = first_render(fresh_environment(args.template_dir), args.render)
+        cold = load_all(fresh_environment(args.template_dir))
+        results.append(("bytecode cache, cold", cold, cold_render))
+
+        warm = load_all(fresh_environment(args.template_dir))
+        env = fresh_environment(args.template_dir)
+        template_loader.precompile(env)
+        results.append(("bytecode cache, warm + precompiled", warm, first_render(env, args.render)))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("%s" % args.template_dir)
+    print("%-36s %10s %14s %18s" % ("", "templates", "load all (ms)", "first render (ms)"))
+    for name, (count, load_seconds), render_seconds in results:
+        print("%-36s %10d %14.1f %18.2f" % (name, count, load_seconds * 1000, render_seconds * 1000))
+
+if __name__ == '__main__':
+    main()
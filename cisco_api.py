@@ -0,0 +1,336 @@
+# ----------------
+# Python
+# ----------------
+import os
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.auth import AuthBase
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rate_limiter import RateLimiter
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+token_url = os.environ.get("MERLIN_CISCO_TOKEN_URL", "https://cloudsso.cisco.com/as/token.oauth2")
+
+# Tokens are kept here between runs, per client id, until they expire
+token_cache_path = os.environ.get("MERLIN_CISCO_TOKEN_CACHE", ".cisco_api_tokens.json")
+
+# A token is refreshed this many seconds before ISSO says it expires
+refresh_margin = int(os.environ.get("MERLIN_CISCO_TOKEN_MARGIN", "300"))
+
+api_url = os.environ.get("MERLIN_CISCO_API_URL", "https://api.cisco.com")
+
+# sn2info takes up to 75 comma separated serial numbers per coverage request; batches
+# are sent max_workers at a time, at most rate requests per second
+sn2info_batch_size = int(os.environ.get("MERLIN_SN2INFO_BATCH_SIZE", "75"))
+sn2info_workers = int(os.environ.get("MERLIN_SN2INFO_WORKERS", "4"))
+sn2info_rate = float(os.environ.get("MERLIN_SN2INFO_RATE", "5"))
+
+# PSIRT advisories, software suggestions and serial number coverage are kept here between
+# runs, and reused by every script asking about the same version, PID or serial number
+# until they are result_ttl hours old; 0 asks the APIs every time
+result_cache_path = os.environ.get("MERLIN_CISCO_API_CACHE", ".cisco_api_cache.sqlite")
+result_ttl = float(os.environ.get("MERLIN_CISCO_API_CACHE_TTL", "24"))
+
+result_schema = """
+CREATE TABLE IF NOT EXISTS results (
+    api TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (api, key)
+) WITHOUT ROWID;
+"""
+
+# ----------------
+# Tokens
+# ----------------
+class TokenManager:
+    """OAuth client-credential tokens for the Cisco support APIs, shared by every script
+
+    One token per client id is requested from ISSO and reused, in this run and the next,
+    until refresh_margin seconds before it expires. Only the client id, never the
+    secret, is written to the token cache.
+    """
+    def __init__(self, path: str = token_cache_path, url: str = None, margin: int = None):
+        self.path = path
+        self.url = url
+        self.margin = margin
+        self.requested = 0
+        self.reused = 0
+        self._tokens = None
+        self._lock = threading.Lock()
+        # One lock per client id so two clients refresh in parallel, one client once
+        self._client_locks = {}
+
+    def _load(self):
+        if self._tokens is not None:
+            return
+        self._tokens = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path) as cache:
+                    self._tokens = json.load(cache)
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring the Cisco API token cache %s: %r" % (self.path, e))
+
+    def _save(self):
+        if not self.path:
+            return
+        now = time.time()
+        tokens = {client_id: token for client_id, token in self._tokens.items() if token['expires_at'] > now}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        # Bearer tokens: written owner-only, and replaced atomically
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".cisco_api_tokens")
+        try:
+            with os.fdopen(descriptor, "w") as cache:
+                json.dump(tokens, cache)
+            os.chmod(temporary, 0o600)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            log.warning("Could not save the Cisco API token cache %s: %r" % (self.path, e))
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _client_lock(self, client_id: str):
+        with self._lock:
+            return self._client_locks.setdefault(client_id, threading.Lock())
+
+    def token(self, client_id: str, client_secret: str, force: bool = False) -> dict:
+        """{'token_type', 'access_token', 'expires_at'} for the client, from the cache
+        unless it is missing, close to expiry or force is set"""
+        margin = refresh_margin if self.margin is None else self.margin
+        with self._client_lock(client_id):
+            with self._lock:
+                self._load()
+                token = self._tokens.get(client_id)
+            if not force and token and token['expires_at'] - margin > time.time():
+                self.reused += 1
+                return token
+
+            response = requests.post(self.url or token_url, data={"grant_type": "client_credentials", "client_id": client_id, "client_secret": client_secret})
+            response.raise_for_status()
+            token_json = response.json()
+            token = {
+                "token_type": token_json.get('token_type', "Bearer"),
+                "access_token": token_json['access_token'],
+                "expires_at": time.time() + int(token_json.get('expires_in', 3599)),
+            }
+            self.requested += 1
+            with self._lock:
+                self._tokens[client_id] = token
+                self._save()
+            log.info("Requested a Cisco API token for %s..., valid %ss" % (client_id[:6], token_json.get('expires_in', 3599)))
+            return token
+
+    def headers(self, client_id: str, client_secret: str) -> dict:
+        token = self.token(client_id, client_secret)
+        return {"Authorization": "%s %s" % (token['token_type'], token['access_token'])}
+
+tokens = TokenManager()
+
+class CiscoOAuth(AuthBase):
+    """requests auth for api.cisco.com: every request carries a current token, and a
+    request rejected with 401 is sent once more with a new token"""
+    def __init__(self, client_id: str, client_secret: str, manager: TokenManager = None):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.manager = manager or tokens
+
+    def __call__(self, request):
+        request.headers.update(self.manager.headers(self.client_id, self.client_secret))
+        request.register_hook('response', self._retry_unauthorized)
+        return request
+
+    def _retry_unauthorized(self, response, **kwargs):
+        if response.status_code != 401 or getattr(response.request, '_merlin_retried', False):
+            return response
+        token = self.manager.token(self.client_id, self.client_secret, force=True)
+        response.content
+        response.close()
+        retry = response.request.copy()
+        retry._merlin_retried = True
+        retry.headers['Authorization'] = "%s %s" % (token['token_type'], token['access_token'])
+        retried = response.connection.send(retry, **kwargs)
+        retried.history.append(response)
+        retried.request = retry
+        return retried
+
+# ----------------
+# Result cache
+# ----------------
+class APIResultCache:
+    """Results of the Cisco support APIs, keyed by API and the version, PID or serial
+    number looked up, shared by every script and run until they are ttl hours old
+
+    The database is only opened on first use. Hits and misses are counted per API for
+    report() at the end of the run.
+    """
+    def __init__(self, path: str = result_cache_path, ttl: float = None):
+        self.path = path
+        self.ttl = ttl
+        self.hits = Counter()
+        self.misses = Counter()
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            with self._connection:
+                self._connection.executescript(result_schema)
+        return self._connection
+
+    def _oldest(self) -> float:
+        ttl = result_ttl if self.ttl is None else self.ttl
+        return time.time() - ttl * 3600 if ttl > 0 else None
+
+    def get_many(self, api: str, keys) -> dict:
+        """key -> cached result for the keys with a result younger than the ttl"""
+        keys = list(dict.fromkeys(keys))
+        oldest = self._oldest()
+        results = {}
+        if keys and oldest is not None:
+            with self._lock:
+                connection = self._connect()
+                # SQLite allows 999 parameters per statement
+                for index in range(0, len(keys), 900):
+                    chunk = keys[index:index + 900]
+                    rows = connection.execute("SELECT key, result FROM results WHERE api = ? AND fetched_at >= ? AND key IN (%s)" % ",".join("?" * len(chunk)),
+                                              [api, oldest] + chunk).fetchall()
+                    results.update((key, json.loads(result)) for key, result in rows)
+        self.hits[api] += len(results)
+        self.misses[api] += len(keys) - len(results)
+        return results
+
+    def get(self, api: str, key: str):
+        return self.get_many(api, [key]).get(key)
+
+    def put_many(self, api: str, results: dict):
+        if not results:
+            return
+        now = time.time()
+        rows = [(api, key, now, json.dumps(result)) for key, result in results.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO results (api, key, fetched_at, result) VALUES (?, ?, ?, ?)", rows)
+
+    def put(self, api: str, key: str, result):
+        self.put_many(api, {key: result})
+
+    def fetch(self, api: str, key: str, url: str, auth=None, session=None):
+        """The JSON result of GET url, from the cache when key was looked up within the
+        ttl; only successful responses are cached"""
+        result = self.get(api, key)
+        if result is not None:
+            return result
+        with timings.timed("http", "cisco_api", api):
+            response = (session or requests).get(url, auth=auth)
+            result = response.json()
+        if response.ok:
+            self.put(api, key, result)
+        return result
+
+    def report(self) -> list:
+        """One line per API: hits, misses and hit rate in this run"""
+        lines = []
+        for api in sorted(set(self.hits) | set(self.misses)):
+            lookups = self.hits[api] + self.misses[api]
+            lines.append("Cisco API cache %s: %s hits, %s misses, %.0f%% hit rate" % (
+                api, self.hits[api], self.misses[api], 100.0 * self.hits[api] / lookups if lookups else 0))
+        return lines
+
+    def log_report(self):
+        for line in self.report():
+            log.info(line)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+api_results = APIResultCache()
+
+# ----------------
+# Serial number coverage
+# ----------------
+def api_session(auth, max_workers: int = 1) -> requests.Session:
+    """A pooled session for api.cisco.com that backs off on 429 and 5xx"""
+    retry = Retry(total=5, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504), respect_retry_after_header=True, raise_on_status=False)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(1, max_workers), max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.auth = auth
+    return session
+
+def serial_coverage(serials, auth, batch_size: int = None, max_workers: int = None, rate: float = None, cache: APIResultCache = None):
+    """Look up the sn2info coverage summary of every distinct serial number in batches,
+    taking those looked up within the cache ttl from the cache
+
+    Returns ({serial number: coverage record}, [(batch, exception)] for failed batches).
+    """
+    batch_size = max(1, batch_size or sn2info_batch_size)
+    max_workers = max(1, max_workers or sn2info_workers)
+    limiter = RateLimiter(sn2info_rate if rate is None else rate)
+    cache = cache or api_results
+    unique = list(dict.fromkeys(serial.strip() for serial in serials if serial and serial.strip()))
+    coverage = cache.get_many("sn2info", unique)
+    missing = [serial for serial in unique if serial not in coverage]
+    batches = [missing[index:index + batch_size] for index in range(0, len(missing), batch_size)]
+    session = api_session(auth, max_workers)
+
+    def lookup(batch):
+        records = []
+        page_index = 1
+        while True:
+            limiter.wait()
+            with timings.timed("http", "cisco_api", "sn2info"):
+                response = session.get("%s/sn2info/v2/coverage/summary/serial_numbers/%s" % (api_url, ",".join(batch)),
+                                       params={"page_index": page_index} if page_index > 1 else None)
+                response.raise_for_status()
+            coverage_json = response.json()
+            records.extend(coverage_json.get('serial_numbers', []))
+            pagination = coverage_json.get('pagination_response_record') or {}
+            if page_index >= int(pagination.get('last_index') or 1):
+                return records
+            page_index += 1
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(batch, executor.submit(lookup, batch)) for batch in batches]
+        for batch, future in futures:
+            try:
+                looked_up = {record.get('sr_no'): record for record in future.result()}
+            except Exception as e:
+                log.warning("sn2info lookup of %s serial numbers failed: %r" % (len(batch), e))
+                errors.append((batch, e))
+                continue
+            coverage.update(looked_up)
+            cache.put_many("sn2info", looked_up)
+    session.close()
+
+    log.info("sn2info: %s serial numbers, %s distinct, %s cached, %s batches" % (len(serials), len(unique), len(unique) - len(missing), len(batches)))
+    return coverage, errors
@@ -0,0 +1,182 @@
+# ----------------
+# Python
+# ----------------
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "1" archives the raw output of every command a run sends to a device under
+# <archive_root>/<device alias>/<run timestamp>/, so the run can be replayed offline;
+# archive_root is the script's own folder unless MERLIN_CLI_ARCHIVE_DIR is set
+archive = os.environ.get("MERLIN_CLI_ARCHIVE", "0") == "1"
+archive_root = os.environ.get("MERLIN_CLI_ARCHIVE_DIR")
+
+# Processes parsing archived output in an offline replay
+replay_workers = int(os.environ.get("MERLIN_REPLAY_WORKERS", str(os.cpu_count() or 1)))
+
+index_name = "index.json"
+
+def timestamp() -> str:
+    """Name of a run's snapshot folders: UTC, sortable"""
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+
+def command_file(command: str) -> str:
+    # Readable, and unique even when two commands only differ in punctuation
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", command).strip("_")[:100]
+    return "%s_%s.txt" % (slug, hashlib.sha1(command.encode()).hexdigest()[:8])
+
+# ----------------
+# Capture
+# ----------------
+class CommandRecorder:
+    """Writes the raw output of every command executed on a device to its snapshot folder
+
+    Genie's parsers and Ops learn() all go through device.execute, so wrapping it captures
+    both. Each output is written as soon as it arrives; index.json, listing the commands
+    and the device's os and platform, is written on close.
+    """
+    def __init__(self, device, directory: str):
+        self.device = device
+        self.directory = directory
+        self.commands = {}
+        self._lock = threading.Lock()
+        self._execute = None
+        self._shadowed = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        # An execute already set on the instance (such as a command cache) is restored on close
+        self._shadowed = self.device.__dict__.get('execute')
+        self._execute = self.device.execute
+        # Bound method kept aside; the instance attribute shadows the class method
+        self.device.execute = self._recording_execute
+        return self
+
+    def _recording_execute(self, command, *args, **kwargs):
+        output = self._execute(command, *args, **kwargs)
+        if isinstance(command, str) and isinstance(output, str):
+            self.record(command, output)
+        return output
+
+    def record(self, command: str, output: str):
+        file_name = command_file(command)
+        with open(os.path.join(self.directory, file_name), "w") as raw:
+            raw.write(output)
+        with self._lock:
+            self.commands[command] = file_name
+
+    def close(self):
+        if self._execute is not None:
+            if self._shadowed is not None:
+                self.device.execute = self._shadowed
+            else:
+                del self.device.execute
+            self._execute = None
+        index = {
+            "device": self.device.alias,
+            "os": getattr(self.device, 'os', None),
+            "platform": getattr(self.device, 'platform', None),
+            "collected_at": os.path.basename(self.directory),
+            "commands": self.commands,
+        }
+        with open(os.path.join(self.directory, index_name), "w") as index_file:
+            json.dump(index, index_file, indent=4, sort_keys=True)
+        log.info("Archived %s commands of %s in %s" % (len(self.commands), self.device.alias, self.directory))
+
+@contextmanager
+def recording(device, root: str, run_timestamp: str, enabled: bool = True):
+    """Archive the device's commands for the duration of the block when enabled"""
+    if not enabled:
+        yield None
+        return
+    recorder = CommandRecorder(device, os.path.join(root, device.alias, run_timestamp)).start()
+    try:
+        yield recorder
+    finally:
+        recorder.close()
+
+# ----------------
+# Replay
+# ----------------
+def snapshot(root: str, alias: str, which: str = "latest"):
+    """The snapshot folder of a device: the latest one or the one named which, None when
+    the device has none"""
+    device_dir = os.path.join(root, alias)
+    if not os.path.isdir(device_dir):
+        return None
+    snapshots = sorted(name for name in os.listdir(device_dir) if os.path.exists(os.path.join(device_dir, name, index_name)))
+    if not snapshots:
+        return None
+    if which == "latest":
+        return os.path.join(device_dir, snapshots[-1])
+    return os.path.join(device_dir, which) if which in snapshots else None
+
+class ReplayOutput:
+    """The archived outputs of one snapshot, served in place of device.execute"""
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, index_name)) as index_file:
+            self.index = json.load(index_file)
+
+    def execute(self, command, *args, **kwargs):
+        file_name = self.index['commands'].get(command)
+        if file_name is None:
+            raise KeyError("'%s' is not in the archive %s" % (command, self.directory))
+        with open(os.path.join(self.directory, file_name)) as raw:
+            return raw.read()
+
+def replay(device, directory: str) -> ReplayOutput:
+    """Make an unconnected testbed device answer from a snapshot"""
+    output = ReplayOutput(directory)
+    device.execute = output.execute
+    device.is_connected = lambda *args, **kwargs: True
+    return output
+
+def replay_device(directory: str):
+    """A Genie device answering from a snapshot, for worker processes without a testbed"""
+    from genie.conf.base import Device
+    output = ReplayOutput(directory)
+    index = output.index
+    if index.get('platform'):
+        device = Device(index['device'], os=index['os'], platform=index['platform'])
+        device.custom.setdefault("abstraction", {})["order"] = ["os", "platform"]
+    else:
+        device = Device(index['device'], os=index['os'])
+        device.custom.setdefault("abstraction", {})["order"] = ["os"]
+    device.alias = index['device']
+    device.execute = output.execute
+    device.is_connected = lambda *args, **kwargs: True
+    return device
+
+class OfflineSteps:
+    """aetest steps stand-in for worker processes: a failed step is logged and kept"""
+    def __init__(self):
+        self.failures = []
+
+    @contextmanager
+    def start(self, name: str, continue_: bool = True):
+        step = OfflineStep(name, self.failures)
+        yield step
+
+class OfflineStep:
+    def __init__(self, name: str, failures: list):
+        self.name = name
+        self.failures = failures
+
+    def failed(self, reason: str = None):
+        self.failures.append((self.name, reason))
+        log.warning("%s: %s" % (self.name, reason))
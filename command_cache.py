@@ -0,0 +1,109 @@
+# ----------------
+# Python
+# ----------------
+import os
+import logging
+import threading
+from contextlib import contextmanager
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "1" sends each distinct show command to a device once per run: Genie's Ops learn() and
+# the show commands parsed afterwards run many of the same commands, and the later ones
+# are answered from the output of the first
+enabled = os.environ.get("MERLIN_COMMAND_CACHE", "1") == "1"
+
+# Commands whose output is cached; anything else, such as configuration, always reaches
+# the device
+cached_prefixes = ("show ",)
+
+# ----------------
+# Cache
+# ----------------
+class CommandCache:
+    """The output of every show command executed on a device during one run
+
+    Genie's parsers and Ops learn() all go through device.execute, so wrapping it serves
+    both. Like cli_archive.CommandRecorder, which it can be nested in or around.
+    """
+    def __init__(self, device):
+        self.device = device
+        self.outputs = {}
+        self.executed = 0
+        self.saved = 0
+        self._lock = threading.Lock()
+        self._execute = None
+        self._shadowed = None
+
+    def start(self):
+        # An execute already set on the instance (a recorder or a replay) is restored on close
+        self._shadowed = self.device.__dict__.get('execute')
+        self._execute = self.device.execute
+        self.device.execute = self._cached_execute
+        return self
+
+    def _cached_execute(self, command, *args, **kwargs):
+        if not isinstance(command, str) or not command.strip().startswith(cached_prefixes):
+            return self._execute(command, *args, **kwargs)
+        key = " ".join(command.split())
+        with self._lock:
+            if key in self.outputs:
+                self.saved += 1
+                return self.outputs[key]
+        output = self._execute(command, *args, **kwargs)
+        with self._lock:
+            self.executed += 1
+            if isinstance(output, str):
+                self.outputs[key] = output
+        return output
+
+    def close(self):
+        if self._execute is not None:
+            if self._shadowed is not None:
+                self.device.execute = self._shadowed
+            else:
+                del self.device.execute
+            self._execute = None
+        self.outputs.clear()
+        report.add(self.device.alias, self.executed, self.saved)
+        log.info("%s: %s show commands executed, %s device round trips saved" % (self.device.alias, self.executed, self.saved))
+
+@contextmanager
+def caching(device, enabled: bool = enabled):
+    """Cache the device's show command output for the duration of the block when enabled"""
+    if not enabled:
+        yield None
+        return
+    cache = CommandCache(device).start()
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+# ----------------
+# Report
+# ----------------
+class CommandCacheReport:
+    """Device round trips saved by the command caches of a run"""
+    def __init__(self):
+        self.devices = {}
+        self._lock = threading.Lock()
+
+    def add(self, alias: str, executed: int, saved: int):
+        with self._lock:
+            previous_executed, previous_saved = self.devices.get(alias, (0, 0))
+            self.devices[alias] = (previous_executed + executed, previous_saved + saved)
+
+    def __str__(self):
+        executed = sum(executed for executed, saved in self.devices.values())
+        saved = sum(saved for executed, saved in self.devices.values())
+        return "%s device round trips saved, %s show commands executed on %s devices" % (saved, executed, len(self.devices))
+
+report = CommandCacheReport()
@@ -0,0 +1,140 @@
+# ----------------
+# Python
+# ----------------
+import os
+import logging
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# Characters replaced by "_" in field names; Genie keys such as Ethernet1/1 or
+# port-channel1 would otherwise not be usable as Elastic field names
+field_characters = os.environ.get("MERLIN_ELASTIC_FIELD_CHARACTERS", "/-")
+
+# "nested" keeps Genie's structure, "flat" joins the keys of nested maps with
+# flat_separator into one level of fields
+layout = os.environ.get("MERLIN_ELASTIC_LAYOUT", "nested")
+flat_separator = os.environ.get("MERLIN_ELASTIC_FLAT_SEPARATOR", "__")
+
+# "1" lowercases string values, like the elastic_standards.j2 template used to
+lowercase = os.environ.get("MERLIN_ELASTIC_LOWERCASE", "0") == "1"
+
+# Comma separated features (see explode_maps) indexed as one document per entry of their
+# large map instead of one document per device, or "all"
+explode = [feature.strip() for feature in os.environ.get("MERLIN_ELASTIC_EXPLODE", "").split(",") if feature.strip()]
+
+# Feature -> (path to its large map, field holding each entry's key). A "*" in a path
+# matches every key of that map, kept in a field named after the segment before it.
+explode_maps = {
+    "learned_interface": ((), "interface"),
+    "learned_routing": (("vrf", "*", "address_family", "*", "routes"), "route"),
+    "show_interface_status": (("interfaces",), "interface"),
+    "show_ip_interface_brief": (("interface",), "interface"),
+    "show_ip_route": (("vrf", "*", "address_family", "*", "routes"), "route"),
+    "show_mac_address_table": (("mac_table", "vlans", "*", "mac_addresses"), "mac_address"),
+}
+
+# ----------------
+# Normalization
+# ----------------
+class Normalizer:
+    """Turns Genie learn() and parse() structures into Elastic documents in one walk
+
+    Keys become strings with field_characters replaced by "_", values keep their JSON
+    type, and sets and tuples become lists.
+    """
+    def __init__(self, field_characters: str = field_characters, layout: str = layout,
+                 flat_separator: str = flat_separator, lowercase: bool = lowercase):
+        self.table = str.maketrans({character: "_" for character in field_characters})
+        self.flat = layout == "flat"
+        self.flat_separator = flat_separator
+        self.lowercase = lowercase
+        self._fields = {}
+        # Values returned as they are; str is only one of them when not lowercasing
+        self._scalars = {type(None), bool, int, float} | (set() if lowercase else {str})
+
+    def field(self, key) -> str:
+        # Genie repeats the same keys in every entry of a large map
+        name = self._fields.get(key)
+        if name is None:
+            name = self._fields[key] = str(key).translate(self.table)
+        return name
+
+    def value(self, value):
+        kind = type(value)
+        if kind is dict:
+            fields = self._fields
+            value_of = self.value
+            return {fields[key] if key in fields else self.field(key): item if type(item) in self._scalars else value_of(item)
+                    for key, item in value.items()}
+        if kind is str:
+            return value.lower() if self.lowercase else value
+        if kind in self._scalars:
+            return value
+        if isinstance(value, dict):
+            return self.value(dict(value))
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [self.value(item) for item in value]
+        if isinstance(value, bool):
+            return bool(value)
+        for scalar in (str, int, float):
+            if isinstance(value, scalar):
+                return self.value(scalar(value))
+        return str(value)
+
+    def flatten(self, document: dict, prefix: str = "", flat: dict = None) -> dict:
+        flat = {} if flat is None else flat
+        for key, value in document.items():
+            if isinstance(value, dict) and value:
+                self.flatten(value, prefix + key + self.flat_separator, flat)
+            else:
+                flat[prefix + key] = value
+        return flat
+
+    def document(self, data) -> dict:
+        document = self.value(data)
+        if self.flat and isinstance(document, dict):
+            return self.flatten(document)
+        return document
+
+    def entries(self, data: dict, path: tuple, key_field: str) -> list:
+        """One document per entry of the map at path, with the keys matched by "*" and
+        the entry's own key as fields"""
+        documents = []
+        for context, entries in self._walk(data, path, {}, None):
+            for key, entry in entries.items():
+                document = self.document(entry) if isinstance(entry, dict) else {"value": self.value(entry)}
+                document.update(context)
+                document[key_field] = str(key)
+                documents.append(document)
+        return documents
+
+    def _walk(self, data, path: tuple, context: dict, previous):
+        if not isinstance(data, dict):
+            return
+        if not path:
+            yield context, data
+            return
+        segment, rest = path[0], path[1:]
+        if segment == "*":
+            for key, value in data.items():
+                yield from self._walk(value, rest, dict(context, **{self.field(previous): str(key)}), segment)
+        elif segment in data:
+            yield from self._walk(data[segment], rest, context, segment)
+
+normalizer = Normalizer()
+
+def elastic_documents(feature: str, data, exploded=None) -> list:
+    """The Elastic documents of one device's feature: one normalized document, or one per
+    entry of its large map when the feature is exploded"""
+    exploded = explode if exploded is None else exploded
+    if feature in explode_maps and (feature in exploded or "all" in exploded):
+        path, key_field = explode_maps[feature]
+        return normalizer.entries(data, path, key_field)
+    return [normalizer.document(data)]
@@ -0,0 +1,121 @@
+# ----------------
+# Python
+# ----------------
+import os
+import logging
+from datetime import datetime, timezone
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "device" writes <device>_<feature> indices, one per device and feature. "feature"
+# writes one <prefix>-<feature> index per feature and "data_stream" one data stream per
+# feature; every document then carries its device and collection time, so the number of
+# indices and shards no longer grows with the number of devices.
+index_mode = os.environ.get("MERLIN_ELASTIC_INDEX_MODE", "device")
+index_prefix = os.environ.get("MERLIN_ELASTIC_INDEX_PREFIX", "merlin")
+
+# Shards and replicas of every index the template matches
+shards = int(os.environ.get("MERLIN_ELASTIC_SHARDS", "1"))
+replicas = int(os.environ.get("MERLIN_ELASTIC_REPLICAS", "1"))
+
+# Ingest pipeline stamping each document with the time Elastic received it; installed with
+# the index template, so it is the default pipeline of every index the script writes
+pipeline = os.environ.get("MERLIN_ELASTIC_PIPELINE", "merlin_pipeline")
+
+index_modes = ("device", "feature", "data_stream")
+
+pipeline_body = {
+    "description": "timestamp",
+    "processors": [
+        {
+            "set": {
+                "field": "_source.ingest_time",
+                "value": "{{_ingest.timestamp}}"
+            }
+        }
+    ]
+}
+
+# ----------------
+# Index layout
+# ----------------
+class IndexLayout:
+    """Where each feature's documents go, and the index template and pipeline that must
+    exist before they are written"""
+    def __init__(self, mode: str = index_mode, prefix: str = index_prefix, shards: int = shards,
+                 replicas: int = replicas, pipeline: str = pipeline):
+        if mode not in index_modes:
+            raise ValueError("Unknown Elastic index mode %r, expected one of %s" % (mode, ", ".join(index_modes)))
+        self.mode = mode
+        self.prefix = prefix
+        self.shards = shards
+        self.replicas = replicas
+        self.pipeline = pipeline
+        # Data streams only accept create operations
+        self.op_type = "create" if mode == "data_stream" else "index"
+
+    def index(self, feature: str, device: str) -> str:
+        if self.mode == "device":
+            return "%s_%s" % (device.lower(), feature)
+        return "%s-%s" % (self.prefix, feature)
+
+    def stamp(self, document: dict, device: str, collected_at: str) -> dict:
+        """Add the device and the client side collection time to a document written to a
+        shared index"""
+        if self.mode != "device":
+            document["device"] = device
+            document["collected_at"] = collected_at
+            if self.mode == "data_stream":
+                document["@timestamp"] = collected_at
+        return document
+
+    @staticmethod
+    def now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def template(self, features) -> dict:
+        settings = {"index.default_pipeline": self.pipeline}
+        if self.mode == "device":
+            return {"index_patterns": ["*_%s" % feature for feature in features], "priority": 200,
+                    "template": {"settings": settings}}
+        settings.update({"number_of_shards": self.shards, "number_of_replicas": self.replicas})
+        template = {
+            "index_patterns": ["%s-*" % self.prefix],
+            "priority": 200,
+            "template": {
+                "settings": settings,
+                "mappings": {
+                    "properties": {
+                        "device": {"type": "keyword"},
+                        "collected_at": {"type": "date"},
+                        "ingest_time": {"type": "date"},
+                    }
+                },
+            },
+        }
+        if self.mode == "data_stream":
+            template["data_stream"] = {}
+            template["template"]["mappings"]["properties"]["@timestamp"] = {"type": "date"}
+        return template
+
+    def install(self, client, features):
+        """Put the ingest pipeline and the index template; a failure is logged, since the
+        user may lack the privileges and have installed them by hand"""
+        # feature and data_stream share one template name, since two templates with the
+        # same index patterns and priority cannot coexist
+        name = "%s_device" % self.prefix if self.mode == "device" else self.prefix
+        try:
+            client.ingest.put_pipeline(id=self.pipeline, body=pipeline_body)
+            client.indices.put_index_template(name=name, body=self.template(features))
+        except Exception as e:
+            log.warning("Could not install the Elastic pipeline %s and index template %s: %r" % (self.pipeline, name, e))
+            return False
+        log.info("Installed the Elastic pipeline %s and index template %s (%s mode)" % (self.pipeline, name, self.mode))
+        return True
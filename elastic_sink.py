@@ -0,0 +1,193 @@
+# ----------------
+# Python
+# ----------------
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# A bulk request is sent once it holds batch_size documents or batch_bytes of NDJSON,
+# with up to max_inflight requests in flight at once. Override with the job's
+# --elastic-batch-size, --elastic-batch-bytes and --elastic-inflight, or these variables.
+batch_size = int(os.environ.get("MERLIN_ELASTIC_BATCH_SIZE", "500"))
+batch_bytes = int(os.environ.get("MERLIN_ELASTIC_BATCH_BYTES", str(5 * 1024 * 1024)))
+max_inflight = int(os.environ.get("MERLIN_ELASTIC_INFLIGHT", "4"))
+
+# Items rejected with one of these statuses (or a bulk request that failed outright) are
+# sent again, up to retries times with exponential backoff; other rejections are final
+retries = int(os.environ.get("MERLIN_ELASTIC_RETRIES", "3"))
+backoff_factor = float(os.environ.get("MERLIN_ELASTIC_BACKOFF", "1"))
+retry_status = (429, 500, 502, 503, 504)
+
+# "1" sends batches while the run is still collecting, "0" holds every document until
+# the end of the run
+stream = os.environ.get("MERLIN_ELASTIC_STREAM", "1") == "1"
+
+# ----------------
+# Ingestion results
+# ----------------
+class BulkStats:
+    """What a BulkSink sent in one run"""
+    def __init__(self):
+        self.documents = 0
+        self.bytes = 0
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def __str__(self):
+        elapsed = self.elapsed or 1e-9
+        return "%s documents indexed, %.1f MB sent in %s bulk requests, %s items retried, %s failed, %.1fs (%.0f documents/s, %.2f MB/s)" % (
+            self.documents, self.bytes / 1e6, self.requests, self.retried, self.failed,
+            self.elapsed, self.documents / elapsed, self.bytes / 1e6 / elapsed)
+
+# ----------------
+# Sink
+# ----------------
+class BulkSink:
+    """Collects index operations and ships them to Elasticsearch through the _bulk API
+
+    client is an Elasticsearch client, or anything with a bulk(body=...) method returning
+    the bulk response. Documents are dicts, or JSON text already rendered for Elastic.
+    """
+    def __init__(self, client, batch_size: int = batch_size, batch_bytes: int = batch_bytes,
+                 max_inflight: int = max_inflight, retries: int = retries,
+                 backoff_factor: float = backoff_factor, stream: bool = stream):
+        self.client = client
+        self.batch_size = max(1, batch_size)
+        self.batch_bytes = max(1, batch_bytes)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.stream = stream
+        self.stats = BulkStats()
+        # (action line, source line) pairs of the batch being filled
+        self._batch = []
+        self._batch_size = 0
+        self._held = []
+        self._futures = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._inflight = threading.BoundedSemaphore(max(1, max_inflight))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_inflight), thread_name_prefix="elastic")
+
+    def index(self, index: str, document, id: str = None, op_type: str = "index"):
+        """Queue a document; op_type "create" is required by data streams"""
+        action = {op_type: {"_index": index}}
+        if id is not None:
+            action[op_type]["_id"] = id
+        if isinstance(document, str):
+            # JSON text never needs a raw newline, and NDJSON cannot have one
+            source = document.replace("\n", " ")
+        elif orjson is not None:
+            source = orjson.dumps(document, default=str).decode()
+        else:
+            source = json.dumps(document, default=str)
+        self._add(json.dumps(action), source)
+
+    def _add(self, action: str, source: str):
+        size = len(action) + len(source) + 2
+        with self._lock:
+            if self._batch and self._batch_size + size > self.batch_bytes:
+                self._ship(self._take())
+            self._batch.append((action, source))
+            self._batch_size += size
+            if len(self._batch) >= self.batch_size:
+                self._ship(self._take())
+
+    def _take(self) -> list:
+        batch, self._batch, self._batch_size = self._batch, [], 0
+        return batch
+
+    def _ship(self, batch: list):
+        if not batch:
+            return
+        if not self.stream:
+            self._held.append(batch)
+        else:
+            self._submit(batch)
+
+    def _submit(self, batch: list):
+        # Blocks the caller while max_inflight batches are already being sent
+        self._inflight.acquire()
+        future = self._executor.submit(self._send, batch)
+        future.add_done_callback(lambda future: self._inflight.release())
+        self._futures.append(future)
+
+    def _send(self, batch: list):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+            payload = "".join("%s\n%s\n" % item for item in batch)
+            error = None
+            retry = []
+            rejected = 0
+            try:
+                with timings.timed("http", "elastic", "bulk"):
+                    response = self.client.bulk(body=payload)
+            except Exception as e:
+                error = e
+                retry = batch
+            else:
+                items = response['items'] if response.get('errors') else []
+                for item, result in zip(batch, items):
+                    result = next(iter(result.values()))
+                    if result.get('status', 200) in retry_status:
+                        retry.append(item)
+                    elif result.get('status', 200) >= 300:
+                        rejected += 1
+                        log.warning("Elastic rejected a document for %s: %s" % (result.get('_index'), result.get('error')))
+            with self._stats_lock:
+                self.stats.requests += 1
+                self.stats.bytes += len(payload)
+                self.stats.documents += len(batch) - len(retry) - rejected
+                self.stats.failed += rejected
+                if retry and attempt < self.retries:
+                    self.stats.retried += len(retry)
+            if not retry:
+                return
+            batch = retry
+        with self._stats_lock:
+            self.stats.failed += len(batch)
+        log.warning("Elastic bulk: gave up on %s documents after %s retries%s" % (len(batch), self.retries, ": %r" % error if error else ""))
+
+    def flush(self):
+        """Send the partly filled batch and wait for every batch in flight"""
+        with self._lock:
+            self._ship(self._take())
+            held, self._held = self._held, []
+            for batch in held:
+                self._submit(batch)
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> BulkStats:
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self.stats.elapsed = time.monotonic() - self.stats.started
+        log.info("Elastic bulk: %s" % self.stats)
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
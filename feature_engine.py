@@ -0,0 +1,281 @@
+# ----------------
+# Python
+# ----------------
+import json
+import yaml
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from rich import print
+from rich.panel import Panel
+from rich.text import Text
+from ascii_art import LEARN, RUNNING
+from general_functionalities import ParseShowCommandFunction, ParseLearnFunction
+from table_renderer import TableRenderer, table_models
+from netjson_builder import NetJSONBuilder, netjson_models
+from render_cache import RenderManifest, digest, digest_data
+from template_loader import template_environment, precompile
+from mind_map import mind_maps
+from topology import FleetTopology
+from cli_archive import OfflineSteps, replay_device
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Filetypes
+# ----------------
+
+filetype_loop = ["csv","md","html"]
+
+# ----------------
+# Registry
+# ----------------
+class FeatureRegistry:
+    """The features, show commands and templates one platform collects, loaded from registry/<platform>.yaml"""
+    def __init__(self, registry_file: str):
+        with open(registry_file) as fh:
+            registry = yaml.safe_load(fh)
+        self.root = registry['root']
+        self.template_dir = registry['template_dir']
+        self.features = registry['features']
+
+    @staticmethod
+    def applies_to(entry: dict, device) -> bool:
+        platforms = entry.get('platforms')
+        if platforms and device.platform not in platforms:
+            return False
+        return device.platform not in entry.get('exclude_platforms', [])
+
+    def features_for(self, device):
+        return [feature for feature in self.features if self.applies_to(feature, device)]
+
+    def template_names(self):
+        """Every Jinja2 template the registry renders"""
+        for feature in self.features:
+            for output in feature['outputs']:
+                if 'template' in output:
+                    yield output['template']
+                if 'netjson' in output:
+                    if output['netjson'] not in netjson_models:
+                        yield '%s_json.j2' % output['netjson']
+                    yield '%s_html.j2' % output['netjson']
+
+# ----------------
+# Collection
+# ----------------
+def collect_features(registry: FeatureRegistry, steps, device, parse_pool=None) -> dict:
+    """Learn and parse every registry feature that applies to the device; with a ParsePool
+    the show commands' output is parsed in its processes"""
+    features = registry.features_for(device)
+    results = {}
+
+    print(Panel.fit(Text.from_markup(LEARN)))
+    for feature in [feature for feature in features if 'learn' in feature]:
+        results[feature['name']] = ParseLearnFunction.parse_learn(steps, device, feature['learn'])
+
+    print(Panel.fit(Text.from_markup(RUNNING)))
+    commands = [feature for feature in features if 'command' in feature]
+    if parse_pool is not None:
+        parsed = ParseShowCommandFunction.parse_show_commands(steps, device, [feature['command'] for feature in commands], parse_pool)
+        for feature in commands:
+            results[feature['name']] = parsed[feature['command']]
+    else:
+        for feature in commands:
+            results[feature['name']] = ParseShowCommandFunction.parse_show_command(steps, device, feature['command'])
+
+    return results
+
+# Registries loaded by a replay worker process, by file
+_registries = {}
+
+def replay_collect(registry_file: str, directory: str):
+    """Replay worker: parse one archived snapshot, returns (results, failed steps)"""
+    registry = _registries.get(registry_file)
+    if registry is None:
+        registry = _registries[registry_file] = FeatureRegistry(registry_file)
+    steps = OfflineSteps()
+    results = collect_features(registry, steps, replay_device(directory))
+    return results, steps.failures
+
+# ----------------
+# Engine
+# ----------------
+class FeatureEngine:
+    """Collects and stores every registry feature for a device"""
+    def __init__(self, registry_file: str):
+        self.registry_file = registry_file
+        self.registry = FeatureRegistry(registry_file)
+        self.env = template_environment(self.registry.template_dir)
+        precompile(self.env, self.registry.template_names())
+        self.topology = FleetTopology()
+        # What every artifact was rendered from last run, to skip the unchanged ones
+        self.renders = RenderManifest(self.registry.root)
+
+    def collect(self, steps, device, parse_pool=None) -> dict:
+        """Learn and parse every feature that applies to the device, keyed by feature name"""
+        return collect_features(self.registry, steps, device, parse_pool)
+
+    def replay(self, snapshots: dict, max_workers: int = None) -> dict:
+        """Parse archived snapshots ({device alias: snapshot folder}) in a process pool,
+        without touching the network; returns {device alias: results}"""
+        collected = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {alias: executor.submit(replay_collect, self.registry_file, directory) for alias, directory in snapshots.items()}
+            for alias, future in futures.items():
+                try:
+                    collected[alias], failures = future.result()
+                except Exception as e:
+                    log.warning("Could not replay %s from %s: %r" % (alias, snapshots[alias], e))
+                    continue
+                for name, reason in failures:
+                    log.warning("%s (replay): %s failed: %s" % (alias, name, reason))
+        log.info("Replayed %s of %s snapshots" % (len(collected), len(snapshots)))
+        return collected
+
+    def store(self, steps, device, results: dict, table):
+        """Write every collected feature to disk and to the device table"""
+        for feature in self.registry.features_for(device):
+            data = results.get(feature['name'])
+            if data is None:
+                continue
+            with steps.start(f"Storing {feature['name']}", continue_=True):
+                self.store_feature(device, feature, data)
+                table.insert(data, feature['name'])
+                if 'topology' in feature:
+                    self.topology.add(feature['topology'], device.name, data)
+
+    def write_topology(self):
+        """Write the fleet topology merged from every device's neighbors"""
+        directory = "{}/Topology".format(self.registry.root)
+        self.topology.write("{}/fleet_topology_netgraph.json".format(directory))
+        with open("{}/fleet_topology_netgraph.html".format(directory), "w") as html_file:
+            html_file.write(self.env.get_template('fleet_topology_netjson_html.j2').render())
+
+    def store_feature(self, device, feature: dict, data: dict):
+        directory = feature['directory']
+        data_digest = digest_data(data)
+        device_ip = self.device_ip(device)
+
+        def save_data():
+            self.save_to_json_file(device, directory, feature['file_name'], data)
+            self.save_to_yaml_file(device, directory, feature['file_name'], data)
+
+        self.render_once("%s:data" % self.file_prefix(device, directory, feature['file_name']), data_digest,
+                         [self.file_path(device, directory, feature['file_name'], file_type) for file_type in ("json", "yaml")], save_data, device.alias)
+
+        for output in feature['outputs']:
+            if not self.registry.applies_to(output, device):
+                continue
+
+            content = data
+            try:
+                for key in output.get('keys', []):
+                    content = content[key]
+            except (KeyError, TypeError):
+                log.info("%s: %s has no %s, skipping %s" % (device.alias, feature['name'], output['keys'], output.get('table', output.get('template', output.get('netjson')))))
+                continue
+
+            file_name = output.get('file_name', feature['file_name'])
+            # The output's content is data walked down output's keys
+            content_digest = digest(data_digest, output.get('keys', []))
+            table_files = [self.file_path(device, directory, file_name, filetype) for filetype in filetype_loop] + [self.mind_map_path(device, directory, file_name)]
+
+            if 'table' in output:
+                def render_table():
+                    TableRenderer.render(output['table'], content, self.file_prefix(device, directory, file_name))
+                    self.save_mind_map(device, directory, file_name)
+
+                self.render_once("%s:table" % self.file_prefix(device, directory, file_name),
+                                 digest(content_digest, self.renders.code_source(TableRenderer.render), self.renders.code_source(table_models[output['table']][2]), table_models[output['table']][:2]),
+                                 table_files, render_table, device.alias)
+
+            if 'template' in output:
+                def render_template():
+                    template = self.env.get_template(output['template'])
+                    for filetype in filetype_loop:
+                        parsed_output_type = template.render(filetype_loop_jinja2=filetype, **{output['variable']: content})
+                        self.save_to_specified_file_type(device, directory, file_name, parsed_output_type, filetype)
+                    self.save_mind_map(device, directory, file_name)
+
+                self.render_once("%s:template" % self.file_prefix(device, directory, file_name),
+                                 digest(content_digest, self.renders.template_source(self.env, output['template']), output['variable'], filetype_loop),
+                                 table_files, render_template, device.alias)
+
+            if 'netjson' in output:
+                def render_netjson():
+                    if output['netjson'] in netjson_models:
+                        graph = NetJSONBuilder.build(output['netjson'], content, device.alias, device_ip)
+                        graph.write(self.file_path(device, directory, '%s_netgraph' % file_name, 'json'))
+                    else:
+                        netjson_json_template = self.env.get_template('%s_json.j2' % output['netjson'])
+                        parsed_output_netjson_json = netjson_json_template.render(device_alias=device.alias, device_ip=device_ip, **{output['variable']: content})
+                        self.save_to_specified_file_type(device, directory, '%s_netgraph' % file_name, parsed_output_netjson_json, 'json')
+                    netjson_html_template = self.env.get_template('%s_html.j2' % output['netjson'])
+                    parsed_output_netjson_html = netjson_html_template.render(device_alias=device.alias)
+                    self.save_to_specified_file_type(device, directory, '%s_netgraph' % file_name, parsed_output_netjson_html, 'html')
+
+                if output['netjson'] in netjson_models:
+                    graph_source = digest(self.renders.code_source(NetJSONBuilder.build), self.renders.code_source(netjson_models[output['netjson']][2]))
+                else:
+                    graph_source = self.renders.template_source(self.env, '%s_json.j2' % output['netjson'])
+                self.render_once("%s:netjson" % self.file_prefix(device, directory, file_name),
+                                 digest(content_digest, graph_source, self.renders.template_source(self.env, '%s_html.j2' % output['netjson']), output['variable'], device.alias, device_ip),
+                                 [self.file_path(device, directory, '%s_netgraph' % file_name, file_type) for file_type in ("json", "html")], render_netjson, device.alias)
+
+    def render_once(self, key: str, artifact_digest: str, files: list, render, device: str = None) -> bool:
+        """Run render unless the artifact was rendered from the same digest last run and
+        its files are still there; returns whether it ran"""
+        if self.renders.fresh(key, artifact_digest, files):
+            return False
+        # Timed whole, file writes included; the writes are also timed on their own
+        with timings.timed("render", device, key):
+            render()
+        self.renders.record(key, artifact_digest)
+        return True
+
+    def finish(self):
+        """Save the render manifest and report how many artifacts were reused"""
+        self.renders.save()
+        log.info("Renders: %s" % self.renders)
+        return self.renders
+
+    @staticmethod
+    def device_ip(device):
+        try:
+            return device.connections.cli.ip
+        except (AttributeError, KeyError):
+            return None
+
+# ----------------
+# Save Functions
+# ----------------
+    def file_prefix(self, device, directory, file_name):
+        return "{}/{}/{}_{}".format(self.registry.root, directory, device.alias, file_name)
+
+    def file_path(self, device, directory, file_name, file_type):
+        return "{}.{}".format(self.file_prefix(device, directory, file_name), file_type)
+
+    def save_to_json_file(self, device, directory, file_name, content):
+        path = self.file_path(device, directory, file_name, "json")
+        with timings.timed("write", device.alias, path), open(path, "w") as json_file:
+            json.dump(content, json_file, indent=4, sort_keys=True)
+
+    def save_to_yaml_file(self, device, directory, file_name, content):
+        path = self.file_path(device, directory, file_name, "yaml")
+        with timings.timed("write", device.alias, path), open(path, "w") as yml_file:
+            yaml.dump(content, yml_file, allow_unicode=True)
+
+    def save_to_specified_file_type(self, device, directory, file_name, content, file_type):
+        path = self.file_path(device, directory, file_name, file_type)
+        with timings.timed("write", device.alias, path), open(path, "w") as opened_file:
+            opened_file.write(content)
+
+    def mind_map_path(self, device, directory, file_name):
+        return self.file_path(device, directory, "%s_mind_map" % file_name, "html")
+
+    def save_mind_map(self, device, directory, file_name):
+        mind_maps.add(self.file_path(device, directory, file_name, "md"), self.mind_map_path(device, directory, file_name))
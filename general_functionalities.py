@@ -1,3 +1,12 @@
+import time
+import logging
+import threading
+import traceback
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from stage_timing import timings
+
+log = logging.getLogger(__name__)
 
 
 class ParseShowCommandFunction:
@@ -5,17 +14,56 @@ class ParseShowCommandFunction:
     def parse_show_command(steps, device, command_name: str):
         with steps.start(f"Parsing {command_name}", continue_=True) as step:
             try:
-                return device.parse(command_name)
+                with timings.timed("parse", device.alias, command_name):
+                    return device.parse(command_name)
             except Exception as e:
                 step.failed('Could not parse it correctly\n{e}'.format(e=e))
                 return None
 
+    @staticmethod
+    def parse_show_commands(steps, device, command_names, pool):
+        """Execute every command in this thread and parse their output in pool's processes
+
+        Parsing of one command overlaps the execution of the next. A command whose pooled
+        parse fails for any reason but empty output is parsed again on the device, since
+        some parsers run more than one command. Returns command name -> parsed output.
+        """
+        futures = {}
+        for command_name in command_names:
+            try:
+                futures[command_name] = pool.submit(device, command_name)
+            except Exception as e:
+                futures[command_name] = e
+
+        results = {}
+        for command_name, future in futures.items():
+            with steps.start(f"Parsing {command_name}", continue_=True) as step:
+                try:
+                    if isinstance(future, Exception):
+                        raise future
+                    results[command_name] = future.result()
+                    continue
+                except Exception as e:
+                    error = e
+                if type(error).__name__ == 'SchemaEmptyParserError':
+                    step.failed('Could not parse it correctly\n{e}'.format(e=error))
+                    results[command_name] = None
+                    continue
+                try:
+                    with timings.timed("parse", device.alias, command_name):
+                        results[command_name] = device.parse(command_name)
+                except Exception as e:
+                    step.failed('Could not parse it correctly\n{e}'.format(e=e))
+                    results[command_name] = None
+        return results
+
 class ParseLearnFunction:
     @staticmethod
     def parse_learn(steps, device, function_name: str):
             with steps.start(f'Learning {function_name}',continue_=True) as step:
                 try:
-                    return device.learn(function_name).info
+                    with timings.timed("learn", device.alias, function_name):
+                        return device.learn(function_name).info
                 except Exception as e:
                     step.failed('Could not learn it correctly\n{e}'.format(e=e))
                     return None
@@ -25,7 +73,8 @@ class ParseConfigFunction:
     def parse_learn(steps, device, function_name: str):
             with steps.start(f'Learning {function_name}',continue_=True) as step:
                 try:
-                    return device.learn(function_name)
+                    with timings.timed("learn", device.alias, function_name):
+                        return device.learn(function_name)
                 except Exception as e:
                     step.failed('Could not learn it correctly\n{e}'.format(e=e))
                     return None
@@ -35,7 +84,147 @@ class ParseDictFunction:
     def parse_learn(steps, device, function_name: str):
             with steps.start(f'Learning {function_name}',continue_=True) as step:
                 try:
-                    return device.learn(function_name).to_dict()
+                    with timings.timed("learn", device.alias, function_name):
+                        return device.learn(function_name).to_dict()
                 except Exception as e:
                     step.failed('Could not learn it correctly\n{e}'.format(e=e))
-                    return None                                  
\ No newline at end of file
+                    return None
+
+class ConnectFunction:
+    @staticmethod
+    def connect_devices(testbed, max_connections: int = 10, timeout: int = 120):
+        """Connect to every device, max_connections at a time, giving each one timeout seconds
+
+        Returns (connected, unreachable) where unreachable maps device alias to the reason.
+        A connect past its deadline cannot be stopped: its thread is left behind, and keeps
+        the interpreter from exiting until the connect returns. If it ever connects, the
+        session is closed, so a device reported unreachable is not left logged in to.
+        """
+        started = {}
+
+        def disconnect_late(future, device):
+            if future.cancelled() or future.exception() is not None:
+                return
+            try:
+                device.disconnect()
+            except Exception as e:
+                log.warning("Could not disconnect %s after its connect deadline: %r" % (device.alias, e))
+
+        def connect_one(device):
+            started[device.alias] = time.monotonic()
+            with timings.timed("connect", device.alias):
+                device.connect(learn_hostname=True, connection_timeout=timeout)
+
+        devices = {device.alias: device for device in testbed}
+        unreachable = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, max_connections))
+        pending = {executor.submit(connect_one, device): alias for alias, device in devices.items()}
+        while pending:
+            done, _ = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                alias = pending.pop(future)
+                if future.exception() is not None:
+                    unreachable[alias] = repr(future.exception())
+            # Anything still connecting past its deadline is given up on
+            now = time.monotonic()
+            for future, alias in list(pending.items()):
+                if alias in started and now - started[alias] > timeout:
+                    unreachable[alias] = 'no connection after %s seconds' % timeout
+                    pending.pop(future)
+                    future.add_done_callback(lambda future, device=devices[alias]: disconnect_late(future, device))
+        executor.shutdown(wait=False)
+
+        connected = [device for alias, device in devices.items() if alias not in unreachable]
+        return connected, unreachable
+
+class ParallelDeviceFunction:
+    @staticmethod
+    def run_per_device(steps, devices, function, max_workers: int = 1):
+        """Run function(step, device) for every device, max_workers at a time
+
+        aetest steps are not thread safe, so above one worker each device thread records
+        its steps in RecordedSteps, and they are opened on steps from this thread as the
+        devices finish. Returns device alias -> what function returned, None if it raised.
+        """
+        results = {}
+        devices = list(devices)
+        if max_workers <= 1 or len(devices) <= 1:
+            for device in devices:
+                with steps.start(f"Collecting {device.alias}", continue_=True) as step:
+                    results[device.alias] = None
+                    results[device.alias] = function(step, device)
+            return results
+
+        def run_one(device):
+            recorded = RecordedSteps()
+            with recorded.start(f"Collecting {device.alias}", continue_=True) as step:
+                results[device.alias] = None
+                results[device.alias] = function(step, device)
+            return recorded
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in as_completed([executor.submit(run_one, device) for device in devices]):
+                future.result().replay(steps)
+        return results
+
+class RecordedSteps:
+    """aetest steps stand-in for device threads: the steps started and their results are
+    kept, in order, until replay() opens them on the real steps"""
+    def __init__(self, name: str = None):
+        self.name = name
+        self.children = []
+        self.result = None
+        self.reason = None
+
+    @contextmanager
+    def start(self, name: str, continue_: bool = True):
+        step = RecordedSteps(name)
+        self.children.append(step)
+        try:
+            yield step
+        except StepResult:
+            if not continue_ and step.result != 'passed':
+                raise
+        except Exception:
+            step.result, step.reason = 'errored', traceback.format_exc()
+            if not continue_:
+                raise
+
+    # Like aetest, a result ends the step
+    def passed(self, reason: str = None):
+        self._end('passed', reason)
+
+    def failed(self, reason: str = None):
+        self._end('failed', reason)
+
+    def errored(self, reason: str = None):
+        self._end('errored', reason)
+
+    def skipped(self, reason: str = None):
+        self._end('skipped', reason)
+
+    def _end(self, result: str, reason: str):
+        self.result, self.reason = result, reason
+        raise StepResult(result)
+
+    def replay(self, steps):
+        """Open the recorded steps on steps; call from the thread that owns them"""
+        for child in self.children:
+            with steps.start(child.name, continue_=True) as step:
+                child.replay(step)
+                if child.result is not None:
+                    getattr(step, child.result)(child.reason)
+
+class StepResult(Exception):
+    """Raised by RecordedSteps to end a step, as aetest's step results do"""
+
+class ThreadSafeTable:
+    """TinyDB rewrites the whole file on insert; serialise inserts across device workers"""
+    _lock = threading.Lock()
+
+    def __init__(self, table):
+        self.table = table
+
+    def insert(self, document, feature: str = None):
+        with self._lock, timings.timed("db_insert", getattr(self.table, 'name', None), feature):
+            return self.table.insert(document, feature)
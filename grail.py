@@ -0,0 +1,200 @@
+# ----------------
+# Python
+# ----------------
+import os
+import json
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timezone
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "sqlite" keeps every run in <path>.sqlite; "tinydb" is the original <path>.json,
+# recreated on every run.
+backend = os.environ.get("MERLIN_GRAIL_BACKEND", "sqlite")
+
+# Inserts are buffered and written this many documents per transaction
+batch_size = int(os.environ.get("MERLIN_GRAIL_BATCH_SIZE", "500"))
+
+schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    device TEXT NOT NULL,
+    feature TEXT,
+    collected_at TEXT NOT NULL,
+    document TEXT NOT NULL CHECK (json_valid(document))
+);
+CREATE INDEX IF NOT EXISTS documents_device ON documents(device, feature, collected_at);
+CREATE INDEX IF NOT EXISTS documents_feature ON documents(feature, collected_at);
+CREATE INDEX IF NOT EXISTS documents_collected_at ON documents(collected_at);
+CREATE INDEX IF NOT EXISTS documents_run ON documents(run_id, device);
+"""
+
+def open_grail(path: str):
+    """Open the Grail at path (without extension) with the configured backend"""
+    if backend == "tinydb":
+        from tinydb import TinyDB
+        if os.path.exists("%s.json" % path):
+            os.remove("%s.json" % path)
+        return TinyDBGrail(TinyDB("%s.json" % path))
+    return GrailDB("%s.sqlite" % path)
+
+# ----------------
+# TinyDB backend
+# ----------------
+class TinyDBGrail:
+    """The original TinyDB Grail behind the GrailDB table API"""
+    def __init__(self, db):
+        self.db = db
+
+    def table(self, name: str):
+        return TinyDBGrailTable(self.db.table(name))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.db.close()
+
+class TinyDBGrailTable:
+    def __init__(self, table):
+        self.table = table
+
+    def insert(self, document: dict, feature: str = None):
+        return self.table.insert(document)
+
+    def __getattr__(self, name):
+        return getattr(self.table, name)
+
+# ----------------
+# SQLite backend
+# ----------------
+class GrailDB:
+    """The Grail in SQLite: one JSON document per insert, indexed on device, feature and time
+
+    Each run is recorded in runs and tables only show the current run, like the TinyDB
+    file that used to be recreated every run. Earlier runs stay available through history().
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = []
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(schema)
+            self.run_id = self._connection.execute("INSERT INTO runs (started_at) VALUES (?)", (self.now(),)).lastrowid
+
+    @staticmethod
+    def now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def table(self, name: str):
+        return GrailTable(self, name)
+
+    def insert(self, device: str, document: dict, feature: str = None):
+        row = (self.run_id, device, feature, self.now(), json.dumps(document, default=str))
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= batch_size:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany("INSERT INTO documents (run_id, device, feature, collected_at, document) VALUES (?, ?, ?, ?, ?)", self._pending)
+        log.debug("Grail: wrote %s documents" % len(self._pending))
+        self._pending = []
+
+    def query(self, sql: str, parameters=()):
+        """Run a read query against the Grail, after writing any buffered documents"""
+        with self._lock:
+            self._flush()
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def documents(self, device: str, feature: str = None, run_id: int = None):
+        sql = "SELECT doc_id, document FROM documents WHERE device = ?"
+        parameters = [device]
+        if feature is not None:
+            sql += " AND feature = ?"
+            parameters.append(feature)
+        if run_id is not None:
+            sql += " AND run_id = ?"
+            parameters.append(run_id)
+        return [(doc_id, json.loads(document)) for doc_id, document in self.query(sql + " ORDER BY doc_id", parameters)]
+
+    def history(self, device: str, feature: str = None):
+        """(collected_at, document) for a device across every run, oldest first"""
+        sql = "SELECT collected_at, document FROM documents WHERE device = ?"
+        parameters = [device]
+        if feature is not None:
+            sql += " AND feature = ?"
+            parameters.append(feature)
+        return [(collected_at, json.loads(document)) for collected_at, document in self.query(sql + " ORDER BY collected_at", parameters)]
+
+    def tables(self) -> set:
+        return {device for (device,) in self.query("SELECT DISTINCT device FROM documents WHERE run_id = ?", (self.run_id,))}
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+class GrailTable:
+    """TinyDB table look-alike for one device in the current run
+
+    search() and get() take TinyDB Query conditions, or any callable taking a document.
+    """
+    def __init__(self, db: GrailDB, name: str):
+        self.db = db
+        self.name = name
+
+    def insert(self, document: dict, feature: str = None):
+        self.db.insert(self.name, document, feature)
+
+    def insert_multiple(self, documents, feature: str = None):
+        for document in documents:
+            self.insert(document, feature)
+
+    def all(self, feature: str = None) -> list:
+        return [document for doc_id, document in self.db.documents(self.name, feature, self.db.run_id)]
+
+    def search(self, condition) -> list:
+        return [document for document in self.all() if condition(document)]
+
+    def get(self, condition):
+        for document in self.all():
+            if condition(document):
+                return document
+        return None
+
+    def contains(self, condition) -> bool:
+        return self.get(condition) is not None
+
+    def count(self, condition) -> int:
+        return len(self.search(condition))
+
+    def __len__(self):
+        return len(self.all())
+
+    def __iter__(self):
+        return iter(self.all())
@@ -0,0 +1,119 @@
+# ----------------
+# Python
+# ----------------
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+cache_path = os.environ.get("MERLIN_ISE_CACHE", "Camelot/Cisco/ISE/ERS_Cache/ers_cache.sqlite")
+
+# Every run saves the details it fetches; an incremental run only requests the details
+# of new and changed resources and takes the others from the cache
+incremental = os.environ.get("MERLIN_ISE_INCREMENTAL", "0") == "1"
+
+# ERS listings only carry a resource's id, name, description and link, so edits to any
+# other detail field are not visible in them. Cached details older than this many hours
+# are requested again anyway; 0 keeps them until the listing entry changes.
+max_age = float(os.environ.get("MERLIN_ISE_CACHE_MAX_AGE", "0"))
+
+schema = """
+CREATE TABLE IF NOT EXISTS resources (
+    node TEXT NOT NULL,
+    path TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    detail TEXT NOT NULL,
+    PRIMARY KEY (node, path, id)
+) WITHOUT ROWID;
+"""
+
+def fingerprint(resource: dict) -> str:
+    """Hash of a resource's listing entry, which changes when ISE reports a change"""
+    return hashlib.sha1(json.dumps(resource, sort_keys=True, default=str).encode()).hexdigest()
+
+# ----------------
+# Cache
+# ----------------
+class ERSCache:
+    """Last seen detail of every ERS resource, keyed by ISE node, ERS path and resource id"""
+    def __init__(self, path: str = cache_path, max_age: float = max_age):
+        self.path = path
+        self.max_age = max_age * 3600
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(schema)
+
+    def ids(self, node: str, path: str) -> set:
+        with self._lock:
+            return {resource_id for (resource_id,) in self._connection.execute("SELECT id FROM resources WHERE node = ? AND path = ?", (node, path))}
+
+    def fresh(self, node: str, path: str, resources: list) -> dict:
+        """id -> cached detail for the resources whose listing entry is unchanged and
+        whose detail is not older than max_age"""
+        fingerprints = {resource['id']: fingerprint(resource) for resource in resources}
+        if not fingerprints:
+            return {}
+        oldest = time.time() - self.max_age if self.max_age else 0
+        placeholders = ",".join("?" * len(fingerprints))
+        with self._lock:
+            rows = self._connection.execute("SELECT id, fingerprint, fetched_at, detail FROM resources WHERE node = ? AND path = ? AND id IN (%s)" % placeholders,
+                                            [node, path] + list(fingerprints)).fetchall()
+        return {resource_id: json.loads(detail) for resource_id, cached, fetched_at, detail in rows
+                if cached == fingerprints[resource_id] and fetched_at >= oldest}
+
+    def store(self, node: str, path: str, fetched: list):
+        """Save (listing entry, detail) pairs fetched from ISE"""
+        if not fetched:
+            return
+        now = time.time()
+        rows = [(node, path, resource['id'], fingerprint(resource), now, json.dumps(detail)) for resource, detail in fetched]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO resources (node, path, id, fingerprint, fetched_at, detail) VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def delete(self, node: str, path: str, ids):
+        ids = [(node, path, resource_id) for resource_id in ids]
+        if not ids:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM resources WHERE node = ? AND path = ? AND id = ?", ids)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+# ----------------
+# Sync results
+# ----------------
+class SyncStats:
+    """What an incremental sync of one ERS path found, compared with the cache"""
+    def __init__(self, path: str):
+        self.path = path
+        self.new = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.deleted = 0
+        self.requests = 0
+
+    def __str__(self):
+        return "%s: %s new, %s changed, %s unchanged, %s deleted, %s requests" % (
+            self.path, self.new, self.changed, self.unchanged, self.deleted, self.requests)
@@ -0,0 +1,224 @@
+# ----------------
+# Python
+# ----------------
+import os
+import math
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ise_cache import SyncStats
+from rate_limiter import RateLimiter
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# ISE throttles the ERS API per node, so requests are spread out to at most `rate` per
+# second over `max_workers` pooled connections. Override with the job's --ise-workers
+# and --ise-rate, or these variables.
+max_workers = int(os.environ.get("MERLIN_ISE_WORKERS", "8"))
+rate = float(os.environ.get("MERLIN_ISE_RATE", "20"))
+
+# Throttled (429) and unavailable (5xx) responses are retried with exponential backoff,
+# waiting for Retry-After when ISE sends one
+retries = int(os.environ.get("MERLIN_ISE_RETRIES", "5"))
+backoff_factor = float(os.environ.get("MERLIN_ISE_BACKOFF", "0.5"))
+retry_status = (429, 500, 502, 503, 504)
+
+json_headers = { "Content-Type": "application/json", "Accept": "application/json"}
+xml_headers = { "Content-Type": "application/xml", "Accept": "application/xml"}
+
+# ----------------
+# ERS pages
+# ----------------
+class ERSPage:
+    """One page of an ERS listing and the details of every resource on it"""
+    def __init__(self, number: int, pages: int, listing: dict):
+        self.number = number
+        self.pages = pages
+        self.listing = listing
+        self.details = []
+        # (resource, exception) for details that could not be fetched
+        self.errors = []
+
+    @property
+    def resources(self) -> list:
+        return self.listing.get('SearchResult', {}).get('resources', [])
+
+# ----------------
+# Client
+# ----------------
+class ERSClient:
+    """Pooled, rate limited and retrying client for the ISE ERS and MnT APIs
+
+    Listing pages and resource details share one connection pool: the details of a page
+    are requested as soon as the page arrives, while later pages are still in flight.
+
+    With an ERSCache every fetched detail is saved, and resources that vanished from a
+    listing are deleted from it. With incremental=True, a resource whose listing entry is
+    unchanged is served from the cache instead of being requested again.
+    """
+    def __init__(self, host: str, username: str, password: str, max_workers: int = max_workers,
+                 rate: float = rate, retries: int = retries, backoff_factor: float = backoff_factor,
+                 port: int = 9060, verify: bool = False, cache=None, incremental: bool = False):
+        self.base_url = "https://%s:%s/ers/config" % (host, port)
+        self.mnt_base_url = "https://%s/admin/API/mnt" % host
+        self.host = host
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(rate)
+        self.requests = 0
+        self.cache = cache
+        self.incremental = incremental and cache is not None
+        # ERS path -> SyncStats of the last listing
+        self.sync_stats = {}
+
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=retry_status,
+                      respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.auth = (username, password)
+        self.session.headers.update(json_headers)
+        self.session.verify = verify
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ise")
+        self._count_lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return "%s/%s" % (self.base_url, path)
+
+    def mnt_url(self, path: str) -> str:
+        return "%s/%s" % (self.mnt_base_url, path)
+
+    def request(self, url: str, headers: dict = None) -> requests.Response:
+        self.limiter.wait()
+        with self._count_lock:
+            self.requests += 1
+        with timings.timed("http", "ise", url.split("?")[0].rsplit("/", 1)[0]):
+            response = self.session.get(url, headers=headers)
+            response.raise_for_status()
+        return response
+
+    def get(self, url: str) -> dict:
+        return self.request(url).json()
+
+    def fetch_all(self, urls, headers: dict = None):
+        """Yield (url, response or exception) for every url in order, fetched concurrently"""
+        futures = deque()
+        for url in urls:
+            futures.append((url, self._executor.submit(self.request, url, headers)))
+        while futures:
+            url, future = futures.popleft()
+            try:
+                yield url, future.result()
+            except Exception as e:
+                yield url, e
+
+    # ----------------
+    # Pipelined listing
+    # ----------------
+    def pages(self, path: str, size: int = 100, details: bool = True, prefetch: int = None):
+        """Yield every ERSPage of an ERS listing in order, with its resource details
+
+        At most prefetch pages (default: max_workers) are requested ahead of the caller,
+        which bounds memory on large listings such as endpoints.
+        """
+        prefetch = prefetch or self.max_workers
+        stats = self.sync_stats[path] = SyncStats(path)
+        requests_before = self.requests
+        # Ids cached by earlier runs: those not seen in this listing were deleted from ISE
+        known = self.cache.ids(self.host, path) if self.cache is not None and details else set()
+        seen = set()
+        complete = True
+
+        first = self.get(self.url("%s?size=%i&page=1" % (path, size)))
+        pages = max(1, math.ceil(first['SearchResult']['total'] / size))
+        log.info("ISE %s: %s resources in %s pages" % (path, first['SearchResult']['total'], pages))
+
+        pending = deque()
+        next_page = 1
+        while next_page <= pages and len(pending) < prefetch:
+            pending.append((next_page, self._executor.submit(self._page, path, size, next_page, pages, first if next_page == 1 else None, details)))
+            next_page += 1
+
+        while pending:
+            number, future = pending.popleft()
+            if next_page <= pages:
+                pending.append((next_page, self._executor.submit(self._page, path, size, next_page, pages, None, details)))
+                next_page += 1
+            try:
+                page, detail_futures = future.result()
+            except Exception as e:
+                page, detail_futures = ERSPage(number, pages, {}), []
+                page.errors.append((None, e))
+                complete = False
+
+            fetched = []
+            for resource, detail_future, cached in detail_futures:
+                seen.add(resource['id'])
+                try:
+                    detail = detail_future.result()
+                except Exception as e:
+                    page.errors.append((resource, e))
+                    continue
+                page.details.append(detail)
+                if cached:
+                    stats.unchanged += 1
+                else:
+                    fetched.append((resource, detail))
+                    if resource['id'] in known:
+                        stats.changed += 1
+                    else:
+                        stats.new += 1
+            if self.cache is not None:
+                self.cache.store(self.host, path, fetched)
+            yield page
+
+        # Only a complete listing shows which resources are gone
+        if self.cache is not None and details and complete:
+            deleted = known - seen
+            self.cache.delete(self.host, path, deleted)
+            stats.deleted = len(deleted)
+        stats.requests = self.requests - requests_before
+        log.info("ISE %s" % stats)
+
+    def _page(self, path, size, number, pages, listing, details):
+        # Runs in the pool: the page's details are queued as soon as the page arrives,
+        # behind the pages already in flight, without waiting for the caller
+        if listing is None:
+            listing = self.get(self.url("%s?size=%i&page=%i" % (path, size, number)))
+        page = ERSPage(number, pages, listing)
+        if not details:
+            return page, []
+        cached = self.cache.fresh(self.host, path, page.resources) if self.incremental else {}
+        detail_futures = []
+        for resource in page.resources:
+            if resource['id'] in cached:
+                future = Future()
+                future.set_result(cached[resource['id']])
+                detail_futures.append((resource, future, True))
+            else:
+                detail_futures.append((resource, self._executor.submit(self.get, resource['link']['href']), False))
+        return page, detail_futures
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        log.info("ISE client: %s requests to %s" % (self.requests, self.host))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
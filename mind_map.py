@@ -0,0 +1,98 @@
+# ----------------
+# Python
+# ----------------
+import os
+import html
+import logging
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "python" writes the mind map page directly; the markdown is turned into the mind map
+# in the browser by markmap-autoloader, so no Node process is started per file.
+# "markmap" keeps the markmap CLI (one process per file, run in parallel).
+backend = os.environ.get("MERLIN_MIND_MAP_BACKEND", "python")
+
+mind_map_page = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title}</title>
+<style>
+* {{ margin: 0; padding: 0; }}
+.markmap > svg {{ width: 100vw; height: 100vh; }}
+</style>
+</head>
+<body>
+<div class="markmap"><script type="text/template">
+{markdown}
+</script></div>
+<script src="https://cdn.jsdelivr.net/npm/markmap-autoloader@0.16"></script>
+</body>
+</html>
+"""
+
+# ----------------
+# Mind maps
+# ----------------
+def write_mind_map(md_file: str, html_file: str):
+    """Turn one markdown file into a mind map page"""
+    if backend == "markmap":
+        subprocess.run(["markmap", "--no-open", md_file, "--output", html_file], check=True, stdout=subprocess.DEVNULL)
+        return
+
+    with open(md_file) as md:
+        # The markdown sits in a <script> block; only a closing script tag can end it early
+        markdown = md.read().replace("</script", "<\\/script")
+    with open(html_file, "w") as page:
+        page.write(mind_map_page.format(title=html.escape(os.path.basename(md_file)), markdown=markdown))
+
+class MindMapQueue:
+    """Mind maps requested during collection, built together once collection is done"""
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def add(self, md_file: str, html_file: str):
+        # Keyed by output so a page rewritten during the run is only built once, from its final markdown
+        with self._lock:
+            self._pending[html_file] = md_file
+
+    def build(self, max_workers: int = None) -> int:
+        """Build every queued mind map in parallel, returns the number built"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        jobs = [(md_file, html_file) for html_file, md_file in pending.items() if os.path.exists(md_file)]
+        if not jobs:
+            return 0
+
+        built = 0
+        def timed_mind_map(md_file, html_file):
+            with timings.timed("mind_map", None, md_file):
+                write_mind_map(md_file, html_file)
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4)) as executor:
+            futures = {executor.submit(timed_mind_map, md_file, html_file): md_file for md_file, html_file in jobs}
+            for future, md_file in futures.items():
+                try:
+                    future.result()
+                    built += 1
+                except Exception as e:
+                    log.warning("Could not build the mind map for %s: %r" % (md_file, e))
+
+        log.info("Built %s mind maps" % built)
+        return built
+
+mind_maps = MindMapQueue()
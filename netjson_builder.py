@@ -0,0 +1,172 @@
+# ----------------
+# Python
+# ----------------
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import json
+
+# ----------------
+# Graph
+# ----------------
+class NetJSONGraph:
+    """A NetJSON NetworkGraph with one node per id and one link per source/target pair"""
+    def __init__(self, label: str):
+        self.label = label
+        # Insertion ordered hash indexes (node id -> None, (source, target) -> cost),
+        # the first node added is the graph root
+        self._nodes = {}
+        self._links = {}
+
+    def node(self, node_id) -> str:
+        if type(node_id) is not str:
+            node_id = str(node_id)
+        self._nodes.setdefault(node_id)
+        return node_id
+
+    def link(self, source, target, cost: int = 1):
+        # Called once per edge of large tables, so a repeated link returns before touching the nodes
+        if (source, target) in self._links:
+            return
+        source = self.node(source)
+        target = self.node(target)
+        self._links.setdefault((source, target), cost)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "NetworkGraph",
+            "label": self.label,
+            "protocol": "OLSR",
+            "version": "0.6.6.2",
+            "metric": "ETX",
+            "nodes": [{"id": node_id} for node_id in self._nodes],
+            "links": [{"source": source, "target": target, "cost": cost} for (source, target), cost in self._links.items()],
+        }
+
+    def dumps(self) -> bytes:
+        return dumps(self.to_dict())
+
+    def write(self, file_path: str):
+        write_json(file_path, self.to_dict())
+
+def dumps(content) -> bytes:
+    """Compact JSON, through orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+def write_json(file_path: str, content):
+    with open(file_path, "wb") as json_file:
+        json_file.write(dumps(content))
+
+# ----------------
+# Graph models
+# ----------------
+# A graph model walks the parsed Genie data once and adds its nodes and links to the
+# graph, replacing the matching <name>_json.j2 template. Missing values render as an
+# empty label, like an undefined Jinja2 variable.
+
+def learned_arp_graph(graph, root, to_parse_arp):
+    for interface, value in to_parse_arp.items():
+        neighbors = value.get('ipv4', {}).get('neighbors', {})
+        if neighbors:
+            graph.link(root, interface, 1)
+        for neighbor, entry in neighbors.items():
+            neighbor_node = "Neighbor IP: %s" % neighbor
+            graph.link(interface, neighbor_node, 2)
+            graph.link(neighbor_node, "Neighbor MAC: %s" % entry.get('link_layer_address', ''), 2)
+
+def learned_routing_graph(graph, root, to_parse_routing):
+    for vrf, vrf_value in to_parse_routing.items():
+        for address_family, af_value in vrf_value.get('address_family', {}).items():
+            for route, entry in af_value.get('routes', {}).items():
+                vrf_node = "VRF: %s" % vrf
+                af_node = "Address Family: %s" % address_family
+                route_node = "Route: %s" % route
+                next_hop = entry.get('next_hop', {})
+                if 'next_hop_list' in next_hop:
+                    hops = [("Hop: %s" % index, "Next Hop: %s" % hop.get('next_hop', '')) for index, hop in next_hop['next_hop_list'].items()]
+                    details = [("Metric: %s" % entry.get('metric', ''), 2), ("Preference: %s" % entry.get('route_preference', ''), 2)]
+                else:
+                    hops = []
+                    details = [("Outgoing Interface: %s" % interface, 1) for interface in next_hop.get('outgoing_interface', {})]
+                graph.link(root, vrf_node, 1)
+                graph.link(vrf_node, af_node, 1)
+                graph.link(af_node, route_node, 1)
+                graph.link(route_node, "Active: %s" % entry.get('active', ''), 2)
+                for detail, cost in details:
+                    graph.link(route_node, detail, cost)
+                graph.link(route_node, "Source Protocol: %s" % entry.get('source_protocol', ''), 2)
+                graph.link(route_node, "Code: %s" % entry.get('source_protocol_codes', ''), 2)
+                for hop_node, next_hop_node in hops:
+                    graph.link(route_node, hop_node, 1)
+                    graph.link(hop_node, next_hop_node, 1)
+
+def show_ip_route_graph(graph, root, to_parse_ip_route):
+    for vrf_value in to_parse_ip_route.values():
+        for af_value in vrf_value.get('address_family', {}).values():
+            for route, entry in af_value.get('routes', {}).items():
+                graph.link(root, route, 2)
+                for hop in entry.get('next_hop', {}).get('next_hop_list', {}).values():
+                    graph.link(route, hop.get('next_hop', ''), 2)
+
+def show_cdp_neighbor_graph(graph, root, to_parse_cdp_neighbors):
+    for neighbor in to_parse_cdp_neighbors.get('index', {}).values():
+        graph.link(root, neighbor.get('device_id', ''), 1)
+
+def show_cdp_neighbor_details_graph(graph, root, to_parse_cdp_neighbors):
+    for neighbor in to_parse_cdp_neighbors.values():
+        for entry in neighbor.get('entry_addresses', {}):
+            graph.link(root, entry, 1)
+
+def learned_lldp_graph(graph, root, to_parse_lldp):
+    counters = to_parse_lldp.get('counters', {})
+    for label, value in (("Enabled", to_parse_lldp.get('enabled', '')),
+                         ("Hello Timer", to_parse_lldp.get('hello_timer', '')),
+                         ("Hold Timer", to_parse_lldp.get('hold_timer', '')),
+                         ("Aged Out Entries", counters.get('entries_aged_out', '')),
+                         ("Frame Discards", counters.get('frame_discard', '')),
+                         ("Frame Input Errors", counters.get('frame_error_in', '')),
+                         ("Input Frames", counters.get('frame_in', '')),
+                         ("Output Frames", counters.get('frame_out', '')),
+                         ("TLV Discards", counters.get('tlv_discard', '')),
+                         ("TLV Unknown", counters.get('tlv_unknown', ''))):
+        graph.link(root, "%s: %s" % (label, value), 1)
+
+def learned_lldp_interfaces_graph(graph, root, to_parse_lldp):
+    for interface, value in to_parse_lldp.items():
+        graph.link(root, interface, 1)
+        for port, port_value in value.get('port_id', {}).items():
+            for neighbor, entry in port_value.get('neighbors', {}).items():
+                neighbor_node = "Neighbor: %s" % neighbor
+                port_node = "Port: %s" % port
+                graph.link(interface, neighbor_node, 1)
+                graph.link(neighbor_node, port_node, 1)
+                graph.link(port_node, "Description: %s" % entry.get('port_description', ''), 2)
+                for capability in entry.get('capabilities', {}):
+                    graph.link(port_node, "Capability: %s" % capability, 2)
+                graph.link(neighbor_node, "Management Address: %s" % entry.get('management_address', ''), 2)
+
+# name: (label, graph root, graph model)
+netjson_models = {
+    'learned_arp_netjson': ("Learn ARP", 'device_alias', learned_arp_graph),
+    'learned_routing_netjson': ("Show Routing", 'device_alias', learned_routing_graph),
+    'show_ip_route_netjson': ("Show IP Route", 'device_alias', show_ip_route_graph),
+    'show_cdp_neighbor_netjson': ("Show CDP Neighbor", 'device_alias', show_cdp_neighbor_graph),
+    'show_cdp_neighbor_details_netjson': ("Show CDP Neighbor Details", 'device_ip', show_cdp_neighbor_details_graph),
+    'learned_lldp_netjson': ("Learn LLDP Counters", 'device_alias', learned_lldp_graph),
+    'learned_lldp_interfaces_netjson': ("Learn LLDP Interfaces", 'device_alias', learned_lldp_interfaces_graph),
+}
+
+# ----------------
+# Builder
+# ----------------
+class NetJSONBuilder:
+    @staticmethod
+    def build(model: str, data, device_alias: str, device_ip: str = None) -> NetJSONGraph:
+        label, root, add_to_graph = netjson_models[model]
+        graph = NetJSONGraph(label)
+        root_node = graph.node(device_ip if root == 'device_ip' and device_ip else device_alias)
+        add_to_graph(graph, root_node, data)
+        return graph
@@ -0,0 +1,131 @@
+# ----------------
+# Python
+# ----------------
+import os
+import json
+import yaml
+import logging
+import threading
+from mind_map import mind_maps
+
+try:
+    from yaml import CDumper as Dumper
+except ImportError:
+    from yaml import Dumper
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "array" writes <name>.json as one JSON array, "jsonl" writes <name>.jsonl with one
+# document per line
+json_format = os.environ.get("MERLIN_JSON_FORMAT", "array")
+
+# Bytes buffered per file before a write reaches the disk
+buffer_size = int(os.environ.get("MERLIN_WRITE_BUFFER", str(1024 * 1024)))
+
+# ----------------
+# Writer
+# ----------------
+class OutputWriter:
+    """Every output of one artifact written by many documents: <folder>/<name>.json/.yaml
+    and the csv/md/html tables, each opened once and written through a large buffer.
+
+    The JSON file holds one array (or one line per document) and the YAML file one
+    sequence, so both stay valid however many documents are written.
+    """
+    def __init__(self, folder: str, name: str, title: str, columns: list, template, template_variable: str,
+                 filetypes=("csv", "md", "html"), json_format: str = json_format):
+        self.folder = folder
+        self.name = name
+        self.template = template
+        self.template_variable = template_variable
+        self.filetypes = filetypes
+        self.json_format = json_format
+        self.documents = 0
+        self._lock = threading.Lock()
+
+        if json_format == "jsonl":
+            self._json = self._open("jsonl")
+        else:
+            self._json = self._open("json")
+            self._json.write("[")
+        self._yaml = self._open("yaml")
+        self._tables = {filetype: self._open(filetype) for filetype in filetypes}
+        self._write_headers(title, columns)
+
+    def _open(self, extension: str):
+        return open(os.path.join(self.folder, "%s.%s" % (self.name, extension)), "w", buffering=buffer_size)
+
+    def _write_headers(self, title: str, columns: list):
+        if "csv" in self._tables:
+            self._tables["csv"].write(",".join(columns))
+        if "md" in self._tables:
+            self._tables["md"].write("# %s\n| %s |\n| %s |" % (title, " | ".join(columns), " | ".join("-" * len(column) for column in columns)))
+        if "html" in self._tables:
+            self._tables["html"].write("<html><body><h1>%s</h1><table style=\"width:100%%\">\n<tr>%s</tr>" % (title, "".join("<th>%s</th>" % column for column in columns)))
+
+    def write(self, document, to_render=None, **context):
+        """Add a document to the JSON and YAML files and its rows to the tables,
+        rendered from to_render when the template only takes part of the document;
+        context holds any other template variables"""
+        if to_render is None:
+            to_render = document
+        # Serialized and rendered outside the lock, written in one call per file
+        if self.json_format == "jsonl":
+            json_text = json.dumps(document, sort_keys=True) + "\n"
+        else:
+            json_text = json.dumps(document, indent=4, sort_keys=True)
+        yaml_text = yaml.dump([document], Dumper=Dumper, allow_unicode=True)
+        rows = {filetype: self.template.render(filetype_loop_jinja2=filetype, **dict(context, **{self.template_variable: to_render})) for filetype in self._tables}
+
+        with self._lock:
+            if self.json_format != "jsonl":
+                json_text = ("\n" if not self.documents else ",\n") + json_text
+            self._json.write(json_text)
+            self._yaml.write(yaml_text)
+            for filetype, fh in self._tables.items():
+                fh.write(rows[filetype])
+            self.documents += 1
+
+    def close(self):
+        with self._lock:
+            if self.json_format != "jsonl":
+                self._json.write("\n]\n" if self.documents else "]\n")
+            if "html" in self._tables:
+                self._tables["html"].write("</table></body></html>")
+            for fh in [self._json, self._yaml] + list(self._tables.values()):
+                fh.close()
+        if "md" in self._tables:
+            mind_maps.add(os.path.join(self.folder, "%s.md" % self.name), os.path.join(self.folder, "%s_mind_map.html" % self.name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class OutputWriters:
+    """The run's open writers, one per artifact, closed together at the end of the run"""
+    def __init__(self):
+        self._writers = {}
+        self._lock = threading.Lock()
+
+    def get(self, folder: str, name: str, *args, **kwargs) -> OutputWriter:
+        with self._lock:
+            writer = self._writers.get((folder, name))
+            if writer is None:
+                writer = self._writers[(folder, name)] = OutputWriter(folder, name, *args, **kwargs)
+            return writer
+
+    def close(self):
+        with self._lock:
+            writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            writer.close()
+        log.info("Closed %s output writers" % len(writers))
@@ -0,0 +1,90 @@
+# ----------------
+# Python
+# ----------------
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from stage_timing import timings
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# Processes parsing show command output. 0 keeps device.parse(command), which holds the
+# device's session while Genie's parser runs under the GIL; above 0 the device thread
+# only runs device.execute and moves on to the next command while the output is parsed.
+parse_workers = int(os.environ.get("MERLIN_PARSE_WORKERS", "0"))
+
+# ----------------
+# Worker
+# ----------------
+# Genie devices of a worker process, one per (os, platform)
+_devices = {}
+
+def parse_output(os_name: str, platform: str, command: str, output: str):
+    """Parse raw output in a worker process, like filter_plugins/parse_genie.py"""
+    device = _devices.get((os_name, platform))
+    if device is None:
+        from genie.conf.base import Device
+        from pyats.datastructures import AttrDict
+        if platform:
+            device = Device("parse_worker", os=os_name, platform=platform)
+            device.custom.setdefault("abstraction", {})["order"] = ["os", "platform"]
+        else:
+            device = Device("parse_worker", os=os_name)
+            device.custom.setdefault("abstraction", {})["order"] = ["os"]
+        device.cli = AttrDict({"execute": None})
+        _devices[(os_name, platform)] = device
+    return device.parse(command, output=output)
+
+# ----------------
+# Pool
+# ----------------
+def start_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+class ParsePool:
+    """Process pool parsing the output of show commands executed in the device threads
+
+    Shared by every device of a run, so the parsing of one device's output overlaps the
+    command execution of all of them. parser is the worker function, parse_output unless
+    given. Workers are started from a forkserver (spawn where there is none): forking
+    the device threads' process while they hold SSH sessions and locks can deadlock
+    the children.
+    """
+    def __init__(self, max_workers: int = parse_workers, parser=None):
+        self.max_workers = max(1, max_workers)
+        if (os.cpu_count() or 1) < 2:
+            log.warning("Parse pool on a single CPU: output is parsed no faster and also has to be sent between processes")
+        self.parser = parser or parse_output
+        self.executed = 0
+        self.execute_seconds = 0.0
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=start_context())
+
+    def submit(self, device, command: str):
+        """Execute command on the device in the calling thread, and parse its output in
+        the pool; returns the Future of the parsed output"""
+        started = time.perf_counter()
+        with timings.timed("execute", getattr(device, 'alias', None), command):
+            output = device.execute(command)
+        with self._lock:
+            self.executed += 1
+            self.execute_seconds += time.perf_counter() - started
+        return self._executor.submit(self.parser, getattr(device, 'os', None), getattr(device, 'platform', None), command, output)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        log.info("Parse pool: %s commands executed in %.1fs of device time, parsed in %s processes" % (self.executed, self.execute_seconds, self.max_workers))
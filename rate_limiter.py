@@ -0,0 +1,25 @@
+# ----------------
+# Python
+# ----------------
+import time
+import threading
+
+# ----------------
+# Rate limiting
+# ----------------
+class RateLimiter:
+    """Hands out evenly spaced request slots, shared by every thread of a client"""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
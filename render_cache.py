@@ -0,0 +1,119 @@
+# ----------------
+# Python
+# ----------------
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import os
+import json
+import hashlib
+import inspect
+import logging
+import tempfile
+import threading
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "1" skips rendering, writing and mind mapping an artifact whose data, template and
+# output format hash the same as in the last run, as long as its files still exist
+enabled = os.environ.get("MERLIN_RENDER_CACHE", "1") == "1"
+
+# Manifest file name, kept in the root folder of the outputs it describes
+manifest_name = os.environ.get("MERLIN_RENDER_MANIFEST", ".render_manifest.json")
+
+# ----------------
+# Hashing
+# ----------------
+def digest_data(data) -> str:
+    """Hash of the canonical JSON of parsed data: key order does not matter"""
+    if orjson is not None:
+        try:
+            return hashlib.sha1(orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)).hexdigest()
+        except TypeError:
+            # orjson cannot sort mixed int and str keys
+            pass
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+def digest(*parts) -> str:
+    return hashlib.sha1("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+# ----------------
+# Manifest
+# ----------------
+class RenderManifest:
+    """The hash every artifact was rendered from in the last run, keyed by its file prefix
+
+    fresh() tells whether an artifact can be reused; record() is called once it has been
+    written. save() keeps the entries of artifacts not produced in this run, such as
+    those of devices that were unreachable.
+    """
+    def __init__(self, root: str, enabled: bool = enabled):
+        self.path = os.path.join(root, manifest_name)
+        self.enabled = enabled
+        self.reused = 0
+        self.regenerated = 0
+        self._lock = threading.Lock()
+        self._sources = {}
+        self._entries = {}
+        if enabled and os.path.exists(self.path):
+            try:
+                with open(self.path) as manifest:
+                    self._entries = json.load(manifest)
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring the render manifest %s: %r" % (self.path, e))
+
+    def template_source(self, env, template_name: str) -> str:
+        """Hash of a template's source, read once per run"""
+        key = ("template", id(env), template_name)
+        with self._lock:
+            if key not in self._sources:
+                self._sources[key] = digest(env.loader.get_source(env, template_name)[0])
+            return self._sources[key]
+
+    def code_source(self, function) -> str:
+        """Hash of a Python model's source, standing in for a template's"""
+        key = ("code", function)
+        with self._lock:
+            if key not in self._sources:
+                self._sources[key] = digest(inspect.getsource(function))
+            return self._sources[key]
+
+    def fresh(self, key: str, artifact_digest: str, files) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            reused = self._entries.get(key) == artifact_digest and all(os.path.exists(file) for file in files)
+            if reused:
+                self.reused += 1
+            return reused
+
+    def record(self, key: str, artifact_digest: str):
+        with self._lock:
+            self.regenerated += 1
+            self._entries[key] = artifact_digest
+
+    def save(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".render_manifest")
+            try:
+                with os.fdopen(descriptor, "w") as manifest:
+                    json.dump(self._entries, manifest, sort_keys=True)
+                os.replace(temporary, self.path)
+            except OSError as e:
+                log.warning("Could not save the render manifest %s: %r" % (self.path, e))
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+
+    def __str__(self):
+        return "%s artifacts reused, %s regenerated" % (self.reused, self.regenerated)
@@ -400,7 +400,22 @@
 
       var data = opts.prepareData(graph),
         links = data.links,
-        nodes = data.nodes;
+        nodes = data.nodes,
+        // graphs written with x and y on every node are already laid out:
+        // pin the nodes and draw them once instead of running the force layout
+        laidOut =
+          nodes.length > 0 &&
+          nodes.every(function(n) {
+            return typeof n.x === "number" && typeof n.y === "number";
+          });
+
+      if (laidOut) {
+        nodes.forEach(function(n) {
+          n.fixed = true;
+          n.px = n.x;
+          n.py = n.y;
+        });
+      }
 
       // disable some transitions while dragging
       drag
@@ -582,6 +597,11 @@
           opts.onEnd(url, opts);
         });
 
+      if (laidOut) {
+        force.tick();
+        force.stop();
+      }
+
       return force;
     };
 
@@ -0,0 +1,156 @@
+# ----------------
+# Python
+# ----------------
+import os
+import csv
+import json
+import time
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Settings
+# ----------------
+# "1" times every connect, learn, parse, render, file write, mind map, database insert
+# and HTTP call of a run; the report is written where the script asks for it
+enabled = os.environ.get("MERLIN_TIMING", "1") == "1"
+
+# Prometheus textfile written with the report, for node_exporter's textfile collector;
+# defaults to merlin_<script>.prom next to the report
+prometheus_file = os.environ.get("MERLIN_TIMING_PROMETHEUS")
+
+report_name = "stage_timings"
+
+# ----------------
+# Timings
+# ----------------
+class StageTimings:
+    """Durations of a run's work, by stage (connect, learn, parse, ...), device and name
+    (the command, feature, file or API), kept in memory until write()"""
+    def __init__(self, enabled: bool = enabled):
+        self.enabled = enabled
+        self.started = time.time()
+        self.records = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timed(self, stage: str, device: str = None, name: str = None):
+        """Time the block; an exception escaping it is recorded as a failure and re-raised"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(stage, device, name, time.perf_counter() - started, ok)
+
+    def record(self, stage: str, device: str, name: str, seconds: float, ok: bool = True):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.records.append((stage, device or "", name or "", seconds, ok))
+
+    def summary(self) -> list:
+        """[(stage, device, calls, total seconds, max seconds, failures)], slowest first"""
+        totals = {}
+        with self._lock:
+            records = list(self.records)
+        for stage, device, name, seconds, ok in records:
+            calls, total, longest, failures = totals.get((stage, device), (0, 0.0, 0.0, 0))
+            totals[(stage, device)] = (calls + 1, total + seconds, max(longest, seconds), failures + (not ok))
+        rows = [(stage, device) + values for (stage, device), values in totals.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    # ----------------
+    # Report
+    # ----------------
+    def write(self, directory: str, script: str, prometheus: str = prometheus_file):
+        """Write <directory>/stage_timings.json and .csv and the Prometheus textfile"""
+        if not self.enabled:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            records = list(self.records)
+        finished = time.time()
+        summary = self.summary()
+
+        report = {
+            "script": script,
+            "started": self.started,
+            "duration": finished - self.started,
+            "summary": [dict(zip(("stage", "device", "calls", "seconds", "max_seconds", "failures"), row)) for row in summary],
+            "records": [dict(zip(("stage", "device", "name", "seconds", "ok"), record)) for record in records],
+        }
+        json_path = os.path.join(directory, "%s.json" % report_name)
+        atomic_write(json_path, lambda report_file: json.dump(report, report_file, indent=4))
+
+        def write_csv(report_file):
+            writer = csv.writer(report_file)
+            writer.writerow(["stage", "device", "name", "seconds", "ok"])
+            writer.writerows(records)
+        atomic_write(os.path.join(directory, "%s.csv" % report_name), write_csv)
+
+        prometheus = prometheus or os.path.join(directory, "merlin_%s.prom" % script)
+        atomic_write(prometheus, lambda prom_file: prom_file.write(prometheus_text(script, summary, self.started, finished)))
+
+        log.info("Stage timings of %s records written to %s and %s" % (len(records), json_path, prometheus))
+        return json_path
+
+    def __str__(self):
+        lines = ["%-12s %-24s %6s %10s %8s" % ("stage", "device", "calls", "seconds", "max")]
+        for stage, device, calls, total, longest, failures in self.summary()[:15]:
+            lines.append("%-12s %-24s %6d %10.2f %8.2f" % (stage, device or "-", calls, total, longest))
+        return "\n".join(lines)
+
+def label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def prometheus_text(script: str, summary: list, started: float, finished: float) -> str:
+    metrics = (
+        ("merlin_stage_seconds", "Seconds spent in a stage for a device during the last run", 3),
+        ("merlin_stage_calls", "Calls of a stage for a device during the last run", 2),
+        ("merlin_stage_max_seconds", "Longest single call of a stage for a device during the last run", 4),
+        ("merlin_stage_failures", "Calls of a stage for a device that raised during the last run", 5),
+    )
+    lines = []
+    for metric, help_text, column in metrics:
+        lines.append("# HELP %s %s" % (metric, help_text))
+        lines.append("# TYPE %s gauge" % metric)
+        for row in summary:
+            lines.append('%s{script="%s",stage="%s",device="%s"} %s' % (metric, label(script), label(row[0]), label(row[1]), row[column]))
+    lines.append("# HELP merlin_run_duration_seconds Duration of the last run")
+    lines.append("# TYPE merlin_run_duration_seconds gauge")
+    lines.append('merlin_run_duration_seconds{script="%s"} %s' % (label(script), finished - started))
+    lines.append("# HELP merlin_run_timestamp_seconds When the last run finished")
+    lines.append("# TYPE merlin_run_timestamp_seconds gauge")
+    lines.append('merlin_run_timestamp_seconds{script="%s"} %s' % (label(script), finished))
+    return "\n".join(lines) + "\n"
+
+def atomic_write(path: str, write):
+    """Readers such as node_exporter never see a half written file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".%s" % os.path.basename(path))
+    try:
+        with os.fdopen(descriptor, "w", newline="") as opened_file:
+            write(opened_file)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+timings = StageTimings()
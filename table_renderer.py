@@ -0,0 +1,99 @@
+# ----------------
+# Python
+# ----------------
+import csv
+import html
+
+# ----------------
+# Row models
+# ----------------
+# A row model walks the parsed Genie data once and yields flat rows. The same rows
+# are then streamed to the CSV, Markdown and HTML files together, instead of a Jinja2
+# template walking the whole structure again for every filetype.
+# Missing values render as an empty cell, like an undefined Jinja2 variable.
+
+def learned_arp_rows(to_parse_arp):
+    for interface, value in to_parse_arp.items():
+        learning = value.get('arp_dynamic_learning', {})
+        neighbors = value.get('ipv4', {}).get('neighbors')
+        if neighbors is None:
+            yield (interface, 'N/A', 'N/A', 'N/A', learning.get('local_proxy_enable', ''), learning.get('proxy_enable', ''))
+            continue
+        for neighbor, entry in neighbors.items():
+            yield (interface, neighbor, entry.get('link_layer_address', ''), entry.get('origin', ''), learning.get('local_proxy_enable', ''), learning.get('proxy_enable', ''))
+
+def show_ip_arp_rows(to_parse_ip_arp):
+    for interface, value in to_parse_ip_arp.items():
+        for neighbor, entry in value.get('ipv4', {}).get('neighbors', {}).items():
+            yield (interface, neighbor, entry.get('link_layer_address', ''), entry.get('type', ''), entry.get('origin', ''), entry.get('age', ''), entry.get('protocol', ''))
+
+def show_ip_route_rows(to_parse_ip_route):
+    for vrf, vrf_value in to_parse_ip_route.items():
+        for address_family, af_value in vrf_value.get('address_family', {}).items():
+            for route, entry in af_value.get('routes', {}).items():
+                for next_hop, hop in entry.get('next_hop', {}).get('next_hop_list', {}).items():
+                    yield (vrf, address_family, route, entry.get('active', ''), entry.get('metric', ''), entry.get('route_preference', ''),
+                           entry.get('source_protocol', ''), entry.get('source_protocol_codes', ''), next_hop,
+                           hop.get('next_hop', ''), hop.get('outgoing_interface', ''), hop.get('updated', ''))
+
+def show_mac_address_table_rows(to_parse_mac_address_table):
+    for vlan, vlan_value in to_parse_mac_address_table.get('vlans', {}).items():
+        for mac, mac_value in vlan_value.get('mac_addresses', {}).items():
+            for interface, entry in mac_value.get('interfaces', {}).items():
+                yield (vlan, mac, interface, entry.get('entry_type', ''))
+
+# name: (title, columns, row model)
+table_models = {
+    'learned_arp': ("Learn ARP",
+        ["Interface", "Neighbor IP Address", "Neighbor MAC Address", "Origin", "ARP Dynamic Learning Local Proxy Enabled", "ARP Dynamic Learning Proxy Enable"],
+        learned_arp_rows),
+    'show_ip_arp': ("Show IP ARP (Global Routing Table)",
+        ["Interface", "Neighbor IP Address", "MAC Address", "Type", "Origin", "Age", "Protocol"],
+        show_ip_arp_rows),
+    'show_ip_route': ("Show IP Route",
+        ["VRF", "Address Family", "Route", "Active", "Metric", "Route Preference", "Source Protocol", "Source Protocol Code", "Next Hop Number", "Next Hop", "Outgoing Interface", "Updated"],
+        show_ip_route_rows),
+    'show_mac_address_table': ("Show MAC Address-Table",
+        ["VLAN", "MAC Address", "Interface", "Entry Type"],
+        show_mac_address_table_rows),
+}
+
+# ----------------
+# Renderer
+# ----------------
+class TableRenderer:
+    @staticmethod
+    def render(model: str, data, file_path_prefix: str, title: str = None) -> int:
+        """Stream one table to <prefix>.csv, <prefix>.md and <prefix>.html in a single pass
+
+        Returns the number of rows written.
+        """
+        default_title, columns, rows = table_models[model]
+        title = title or default_title
+        count = 0
+
+        with open("%s.csv" % file_path_prefix, "w", newline="") as csv_file, \
+             open("%s.md" % file_path_prefix, "w") as md_file, \
+             open("%s.html" % file_path_prefix, "w") as html_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(columns)
+
+            md_file.write("# %s\n" % title)
+            md_file.write("| %s |\n" % " | ".join(columns))
+            md_file.write("| %s |\n" % " | ".join("-" * len(column) for column in columns))
+
+            html_file.write("<html><head><link rel=\"stylesheet\" href=\"../../../styles.css\"></head><body>\n")
+            html_file.write("<h1>%s</h1>\n<table class=\"merlin-table\">\n  <thead>\n  <tr>\n" % html.escape(title))
+            html_file.writelines("    <th>%s</th>\n" % html.escape(column) for column in columns)
+            html_file.write("  </tr>\n  </thead>\n  <tbody>\n")
+
+            for row in rows(data):
+                cells = [str(cell) for cell in row]
+                csv_writer.writerow(cells)
+                md_file.write("| %s |\n" % " | ".join(cell.replace("|", "\\|") for cell in cells))
+                html_file.write("  <tr>%s</tr>\n" % "".join("<td>%s</td>" % html.escape(cell) for cell in cells))
+                count += 1
+
+            html_file.write("  </tbody>\n</table>\n</body></html>\n")
+
+        return count
@@ -0,0 +1,49 @@
+# ----------------
+# Python
+# ----------------
+import os
+import threading
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+# ----------------
+# Settings
+# ----------------
+# Compiled template bytecode is kept here between runs so a run only compiles the
+# templates whose source changed since the last one.
+bytecode_cache_dir = os.environ.get("MERLIN_TEMPLATE_CACHE", ".jinja2_cache")
+
+# Templates are not re-checked on disk for every get_template() unless asked for,
+# e.g. MERLIN_TEMPLATE_AUTO_RELOAD=1 while editing templates.
+auto_reload = os.environ.get("MERLIN_TEMPLATE_AUTO_RELOAD", "0") == "1"
+
+_environments = {}
+_lock = threading.Lock()
+
+# ----------------
+# Environments
+# ----------------
+def template_environment(template_dir: str) -> Environment:
+    """One shared Jinja2 environment per template directory"""
+    with _lock:
+        env = _environments.get(template_dir)
+        if env is None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            env = Environment(loader=FileSystemLoader(template_dir),
+                              bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir),
+                              auto_reload=auto_reload,
+                              cache_size=-1)
+            _environments[template_dir] = env
+        return env
+
+def precompile(env: Environment, template_names=None) -> int:
+    """Load the given templates (all of them by default) so the first render does not compile
+
+    Returns the number of templates loaded.
+    """
+    if template_names is None:
+        template_names = env.list_templates(extensions=["j2"])
+    count = 0
+    for template_name in sorted(set(template_names)):
+        env.get_template(template_name)
+        count += 1
+    return count
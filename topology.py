@@ -0,0 +1,183 @@
+# ----------------
+# Python
+# ----------------
+import re
+import math
+import logging
+import threading
+from collections import defaultdict, deque
+from netjson_builder import NetJSONGraph, write_json
+
+# ----------------
+# Get logger for script
+# ----------------
+
+log = logging.getLogger(__name__)
+
+# ----------------
+# Normalization
+# ----------------
+# CDP and LLDP name the same device and port differently (FQDN vs hostname, NX-OS
+# serial suffixes, Gi1/0/1 vs GigabitEthernet1/0/1), so both ends of a link are keyed
+# by a normalized hostname and interface before they are matched.
+
+interface_prefixes = {
+    "hu": "HundredGigE", "hundredgige": "HundredGigE",
+    "fo": "FortyGigabitEthernet", "fortygigabitethernet": "FortyGigabitEthernet",
+    "twe": "TwentyFiveGigE", "twentyfivegige": "TwentyFiveGigE",
+    "te": "TenGigabitEthernet", "tengigabitethernet": "TenGigabitEthernet",
+    "tw": "TwoGigabitEthernet", "twogigabitethernet": "TwoGigabitEthernet",
+    "gi": "GigabitEthernet", "gigabitethernet": "GigabitEthernet",
+    "fa": "FastEthernet", "fastethernet": "FastEthernet",
+    "et": "Ethernet", "eth": "Ethernet", "ethernet": "Ethernet",
+    "po": "Port-channel", "port-channel": "Port-channel",
+    "mgmt": "mgmt", "management": "mgmt",
+}
+
+ip_address = re.compile(r"^\d+\.\d+\.\d+\.\d+$")
+interface_name = re.compile(r"^([a-z-]+)\s*([\d/.:]+)$")
+
+def display_hostname(hostname) -> str:
+    # NX-OS reports "switch(FDO12345)", CDP and LLDP often report the FQDN
+    hostname = re.sub(r"\(.*\)$", "", str(hostname).strip())
+    return hostname if ip_address.match(hostname) else hostname.split(".")[0]
+
+def normalize_hostname(hostname) -> str:
+    return display_hostname(hostname).lower()
+
+def normalize_interface(interface) -> str:
+    interface = str(interface or "").strip()
+    match = interface_name.match(interface.lower())
+    if not match or match.group(1) not in interface_prefixes:
+        return interface
+    return interface_prefixes[match.group(1)] + match.group(2)
+
+# ----------------
+# Fleet topology
+# ----------------
+class FleetTopology:
+    """Neighbor adjacencies reported by every device of a run, merged into one graph"""
+    def __init__(self):
+        # (hostname, interface) -> ((neighbor hostname, neighbor interface), protocol)
+        self.adjacency = {}
+        # normalized hostname -> name shown in the graph
+        self.hostnames = {}
+        self._lock = threading.Lock()
+
+    def add_adjacency(self, hostname, interface, neighbor, neighbor_interface, protocol: str):
+        with self._lock:
+            local = (self._host(hostname), normalize_interface(interface))
+            remote = (self._host(neighbor), normalize_interface(neighbor_interface))
+            # The first report of a port wins, the other side of the link reports the same pair
+            self.adjacency.setdefault(local, (remote, protocol))
+
+    def _host(self, hostname) -> str:
+        key = normalize_hostname(hostname)
+        self.hostnames.setdefault(key, display_hostname(hostname))
+        return key
+
+    def add_cdp(self, hostname, parsed_show_cdp_neighbors_detail: dict):
+        """Add a device's parsed 'show cdp neighbors detail'"""
+        for neighbor in parsed_show_cdp_neighbors_detail.get('index', {}).values():
+            if neighbor.get('device_id'):
+                self.add_adjacency(hostname, neighbor.get('local_interface'), neighbor['device_id'], neighbor.get('port_id'), "cdp")
+
+    def add_lldp(self, hostname, learned_lldp: dict):
+        """Add a device's learned lldp"""
+        for interface, value in learned_lldp.get('interfaces', {}).items():
+            for port, port_value in value.get('port_id', {}).items():
+                for neighbor, entry in port_value.get('neighbors', {}).items():
+                    self.add_adjacency(hostname, interface, entry.get('system_name', neighbor), port, "lldp")
+
+    def add(self, source: str, hostname, data: dict):
+        {'cdp': self.add_cdp, 'lldp': self.add_lldp}[source](hostname, data)
+
+    def links(self):
+        """One entry per physical link, whichever ends reported it"""
+        links = {}
+        for local, (remote, protocol) in self.adjacency.items():
+            key = (local, remote) if local <= remote else (remote, local)
+            links.setdefault(key, protocol)
+        return links
+
+    # ----------------
+    # Layout
+    # ----------------
+    def layout(self, nodes, links, spacing: int = 120):
+        """Radial layout per connected component: the best connected device in the centre,
+        each hop one ring further out, components side by side. Linear in nodes + links."""
+        neighbors = defaultdict(set)
+        for (local, remote) in links:
+            neighbors[local[0]].add(remote[0])
+            neighbors[remote[0]].add(local[0])
+
+        positions = {}
+        seen = set()
+        components = []
+        for node in sorted(nodes, key=lambda node: (-len(neighbors[node]), node)):
+            if node in seen:
+                continue
+            rings = []
+            queue = deque([(node, 0)])
+            seen.add(node)
+            while queue:
+                current, depth = queue.popleft()
+                if depth == len(rings):
+                    rings.append([])
+                rings[depth].append(current)
+                for neighbor in sorted(neighbors[current]):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append((neighbor, depth + 1))
+            components.append(rings)
+
+        columns = max(1, int(math.ceil(math.sqrt(len(components)))))
+        cell = 0
+        for rings in components:
+            cell = max(cell, self._ring_radius(rings, len(rings) - 1, spacing))
+        cell = 2 * cell + spacing
+
+        for index, rings in enumerate(components):
+            centre_x = (index % columns) * cell
+            centre_y = (index // columns) * cell
+            for depth, ring in enumerate(rings):
+                radius = self._ring_radius(rings, depth, spacing)
+                for position, node in enumerate(ring):
+                    angle = 2 * math.pi * position / len(ring)
+                    positions[node] = (round(centre_x + radius * math.cos(angle), 1), round(centre_y + radius * math.sin(angle), 1))
+        return positions
+
+    @staticmethod
+    def _ring_radius(rings, depth, spacing):
+        # Far enough out for the hop count and for the ring to fit its nodes
+        return max(depth * spacing, len(rings[depth]) * spacing / (2 * math.pi)) if depth else 0
+
+    # ----------------
+    # Output
+    # ----------------
+    def graph(self, label: str = "Fleet Topology") -> dict:
+        links = self.links()
+        nodes = set(self.hostnames)
+        positions = self.layout(nodes, links)
+
+        graph = NetJSONGraph(label)
+        for node in sorted(nodes):
+            graph.node(node)
+        for (local, remote) in links:
+            graph.link(local[0], remote[0], 1)
+
+        netjson = graph.to_dict()
+        for node in netjson['nodes']:
+            node['label'] = self.hostnames[node['id']]
+            node['x'], node['y'] = positions[node['id']]
+        # Parallel links between two devices are listed on their one graph link
+        interfaces = defaultdict(list)
+        for (local, remote), protocol in links.items():
+            interfaces[(local[0], remote[0])].append({"source_interface": local[1], "target_interface": remote[1], "protocol": protocol})
+        for link in netjson['links']:
+            link['properties'] = {"interfaces": interfaces[(link['source'], link['target'])]}
+        return netjson
+
+    def write(self, file_path: str, label: str = "Fleet Topology"):
+        write_json(file_path, self.graph(label))
+        log.info("Fleet topology: %s devices, %s links" % (len(self.hostnames), len(self.links())))